@@ -1,12 +1,8 @@
+import os
 import streamlit as st
-from resume_parser import parse_resume
-from job_parser import parse_job_description
-from skill_comparator import compare_skills, get_partial_matches
-from recommender import generate_recommendations
-from utils import extract_skills_from_text
-import re
-from collections import Counter
-import plotly.graph_objects as go
+import metrics
+import profiling
+from pipeline import run_stage
 
 # Set Streamlit theme and page config
 st.set_page_config(
@@ -15,6 +11,13 @@ st.set_page_config(
     layout="wide"
 )
 
+# Operators can allow a stage timing panel (SKILLSHIFT_DEBUG_PANEL=1, then ?debug=1 in the URL)
+# and single-run profiling (SKILLSHIFT_PROFILING=1, then ?profile=1). Spans are only
+# recorded for the session that asked, without turning metrics on for the whole process.
+debug_panel = os.getenv('SKILLSHIFT_DEBUG_PANEL') == '1' and st.query_params.get('debug') == '1'
+span_collector = metrics.collect() if debug_panel else None
+run_profile = profiling.profile('app', st.query_params.get('profile'))
+
 # Simple logo
 st.markdown("## SS")
 
@@ -25,158 +28,191 @@ st.markdown("""
 ---
 """)
 
-st.header("1. Upload Your Resume")
-resume_file = st.file_uploader("Upload Resume (PDF or DOCX)", type=["pdf", "docx"])
-resume_text = None
-resume_skills = []
-raw_skills_section = None
-if resume_file:
-    st.success(f"Uploaded: {resume_file.name}")
-    temp_resume_path = f"temp_resume.{resume_file.type.split('/')[-1]}"
-    with open(temp_resume_path, "wb") as f:
-        f.write(resume_file.getbuffer())
-    try:
-        resume_text, resume_skills, raw_skills_section = parse_resume(temp_resume_path)
-        st.subheader("Extracted Resume Text:")
-        st.text_area("Resume Content", resume_text, height=200)
-        st.subheader("Raw Extracted Skills Section:")
-        if raw_skills_section:
-            st.code(raw_skills_section)
+if span_collector is not None:
+    span_collector.start()
+run_profile.start()
+try:
+    # Stage outputs are memoized per session, so a rerun only recomputes the stages whose inputs changed
+    pipeline_memo = st.session_state.setdefault('pipeline_memo', {})
+    values = {}
+
+    st.header("1. Upload Your Resume")
+    resume_file = st.file_uploader("Upload Resume (PDF or DOCX)", type=["pdf", "docx"])
+    resume_text = None
+    resume_skills = []
+    raw_skills_section = None
+    if resume_file:
+        st.success(f"Uploaded: {resume_file.name}")
+        values['resume_bytes'] = resume_file.getvalue()
+        try:
+            run_stage('resume', values, pipeline_memo)
+            resume_text, resume_skills, raw_skills_section = values['resume_text'], values['resume_skills'], values['raw_skills_section']
+            st.subheader("Extracted Resume Text:")
+            st.text_area("Resume Content", resume_text, height=200)
+            st.subheader("Raw Extracted Skills Section:")
+            if raw_skills_section:
+                st.code(raw_skills_section)
+            else:
+                st.info("No 'Skills' section detected.")
+            st.subheader("Extracted Resume Skills:")
+            if resume_skills:
+                st.write(", ".join([s.title() for s in resume_skills]))
+            else:
+                st.info("No skills detected in resume. (Try using a more standard 'Skills' section or check the skill list in utils.py)")
+        except Exception as e:
+            st.error(f"Error parsing resume: {e}")
+
+    st.header("2. Paste Job Description Text")
+    jd_text_input = st.text_area("Paste Job Description Text Here", height=200)
+    jd_text = None
+    jd_skills = []
+    top_keywords = []
+
+    st.header("3. Specify Your Target Role")
+    target_role = st.text_input("Enter your target role (e.g., Data Scientist, Software Engineer, Product Manager)", placeholder="Data Scientist")
+
+    process_jd = st.button("Submit Job Description")
+    if process_jd and jd_text_input.strip():
+        # Keep the submitted JD across reruns so later widget changes don't discard the analysis
+        st.session_state['submitted_jd_text'] = jd_text_input
+    if st.session_state.get('submitted_jd_text'):
+        jd_text = st.session_state['submitted_jd_text']
+        values['jd_text'] = jd_text
+        jd_skills = run_stage('jd_skills', values, pipeline_memo)['jd_skills']
+        st.success("Job description text provided.")
+
+        st.subheader("Extracted Job Description Skills:")
+        if jd_skills:
+            st.write(", ".join([s.title() for s in jd_skills]))
+        else:
+            st.info("No skills detected in job description text.")
+        st.subheader("Top Keywords in Job Description:")
+        from keyword_engine import keyword_corpus_version
+        values['keyword_corpus'] = keyword_corpus_version()
+        top_keywords = run_stage('keywords', values, pipeline_memo)['top_keywords']
+        if top_keywords:
+            st.write(", ".join([w.title() for w in top_keywords]))
+            if not values['keyword_corpus_size']:
+                st.caption("Ranked by frequency: add job descriptions to the job store (python job_store.py jobs/*.pdf) to rank by TF-IDF.")
         else:
-            st.info("No 'Skills' section detected.")
-        st.subheader("Extracted Resume Skills:")
-        if resume_skills:
-            st.write(", ".join([s.title() for s in resume_skills]))
+            st.info("No significant keywords found.")
+
+    if resume_skills and jd_skills:
+        st.markdown('<div class="section-container">', unsafe_allow_html=True)
+        st.header("4. Skill Gap Analysis")
+        comparison = run_stage('comparison', values, pipeline_memo)['comparison']
+        st.subheader("Skills Present in Resume:")
+        if comparison['present']:
+            st.success(", ".join([s.title() for s in comparison['present']]))
         else:
-            st.info("No skills detected in resume. (Try using a more standard 'Skills' section or check the skill list in utils.py)")
-    except Exception as e:
-        st.error(f"Error parsing resume: {e}")
-
-st.header("2. Paste Job Description Text")
-jd_text_input = st.text_area("Paste Job Description Text Here", height=200)
-jd_text = None
-jd_skills = []
-top_keywords = []
-
-st.header("3. Specify Your Target Role")
-target_role = st.text_input("Enter your target role (e.g., Data Scientist, Software Engineer, Product Manager)", placeholder="Data Scientist")
-
-process_jd = st.button("Submit Job Description")
-if process_jd and jd_text_input.strip():
-    jd_text = jd_text_input
-    jd_skills = extract_skills_from_text(jd_text)
-    st.success("Job description text provided.")
-    
-    st.subheader("Extracted Job Description Skills:")
-    if jd_skills:
-        st.write(", ".join([s.title() for s in jd_skills]))
-    else:
-        st.info("No skills detected in job description text.")
-    st.subheader("Top Keywords in Job Description:")
-    words = re.findall(r'\b\w+\b', jd_text.lower())
-    stopwords = set(['the','and','to','of','in','a','for','on','with','as','is','by','or','be','are','at','an','from','that','this','will','can','has','have','it','was','but','not','if','their','they','we','you','your','our','all','may','who','which','so','such','more','than','other','any','do','does','should','must','were','been','being','into','about','also','these','those','each','per','its','no','yes','i','ii','iii','iv','v','vi','vii','viii','ix','x'])
-    filtered = [w for w in words if w not in stopwords and len(w) > 2]
-    top_keywords = [w for w, _ in Counter(filtered).most_common(10)]
-    if top_keywords:
-        st.write(", ".join([w.title() for w in top_keywords]))
-    else:
-        st.info("No significant keywords found.")
-
-if resume_skills and jd_skills:
-    st.markdown('<div class="section-container">', unsafe_allow_html=True)
-    st.header("4. Skill Gap Analysis")
-    comparison = compare_skills(resume_skills, jd_skills)
-    st.subheader("Skills Present in Resume:")
-    if comparison['present']:
-        st.success(", ".join([s.title() for s in comparison['present']]))
-    else:
-        st.info("No job description skills found in resume.")
-    st.subheader("Missing Skills (Required by Job, Not in Resume):")
-    if comparison['missing']:
-        st.warning(", ".join([s.title() for s in comparison['missing']]))
-    else:
-        st.success("No missing skills! Your resume covers all listed job skills.")
-
-    st.subheader("Skill Radar Chart")
-    all_skills = sorted(set([s.title() for s in jd_skills + resume_skills]))
-    resume_vector = [1 if s.lower() in [r.lower() for r in resume_skills] else 0 for s in all_skills]
-    jd_vector = [1 if s.lower() in [j.lower() for j in jd_skills] else 0 for s in all_skills]
-    fig = go.Figure()
-    fig.add_trace(go.Scatterpolar(r=resume_vector, theta=all_skills, fill='toself', name='Resume'))
-    fig.add_trace(go.Scatterpolar(r=jd_vector, theta=all_skills, fill='toself', name='Job Description'))
-    fig.update_layout(
-        polar=dict(radialaxis=dict(visible=True, range=[0,1])),
-        showlegend=True,
-        height=500,
-        margin=dict(l=40, r=40, t=40, b=40)
-    )
-    st.plotly_chart(fig, use_container_width=True)
-
-    st.subheader("Skill Fit Progress Bars")
-    if len(jd_skills) > 0:
-        skill_fit = len(comparison['present']) / len(jd_skills)
-    else:
-        skill_fit = 0
-    st.progress(skill_fit, text=f"{int(skill_fit*100)}% of job skills present in resume")
-    if len(resume_skills) > 0:
-        resume_relevance = len(comparison['present']) / len(resume_skills)
-    else:
-        resume_relevance = 0
-    st.progress(resume_relevance, text=f"{int(resume_relevance*100)}% of your resume skills match the job")
-
-    if comparison['missing']:
-        st.subheader("Dynamic Learning Path")
-        recs_and_path = generate_recommendations(comparison['missing'], jd_skills)
-        learning_path = recs_and_path.get('learning_path', [])
-        if learning_path:
-            for step in learning_path:
-                st.markdown(f"- {step}")
-
-    if comparison['missing'] and resume_text and jd_text and target_role:
-        from recommender import generate_llm_feedback, generate_role_advice
-        st.subheader("AI-Powered Resume Feedback")
-        with st.spinner("Generating feedback..."):
-            feedback = generate_llm_feedback(resume_text, jd_text, comparison['missing'])
-        st.markdown(feedback)
-
-        st.subheader("Role-Specific Advice")
-        with st.spinner("Generating role-specific advice..."):
-            advice = generate_role_advice(jd_text, comparison['missing'], target_role)
-        st.markdown(advice)
-
-    if comparison['missing']:
-        st.header("5. Upskilling Recommendations")
-        recommendations = recs_and_path['recommendations'] if 'recommendations' in recs_and_path else generate_recommendations(comparison['missing'])
-        for skill, recs in recommendations.items():
-            st.markdown(f"**{skill.title()}**")
-            for rec in recs:
-                st.markdown(f"- {rec}")
-
-    from utils import generate_pdf_report
-    if st.button("Download PDF Report"):
-        radar_chart_path = "radar_chart.png"
-        fig.write_image(radar_chart_path)
-        pdf_path = generate_pdf_report(
-            resume_text=resume_text,
-            jd_text=jd_text,
-            present_skills=comparison['present'],
-            missing_skills=comparison['missing'],
-            learning_path=recs_and_path.get('learning_path', []),
-            ai_feedback=feedback if 'feedback' in locals() else '',
-            role_advice=advice if 'advice' in locals() else '',
-            radar_chart_path=radar_chart_path
+            st.info("No job description skills found in resume.")
+        st.subheader("Missing Skills (Required by Job, Not in Resume):")
+        if comparison['missing']:
+            st.warning(", ".join([s.title() for s in comparison['missing']]))
+        else:
+            st.success("No missing skills! Your resume covers all listed job skills.")
+
+        st.subheader("Skill Radar Chart")
+        radar = run_stage('radar', values, pipeline_memo)
+        all_skills = radar['radar_labels']
+        resume_vector = radar['resume_vector']
+        jd_vector = radar['jd_vector']
+        import plotly.graph_objects as go
+        fig = go.Figure()
+        fig.add_trace(go.Scatterpolar(r=resume_vector, theta=all_skills, fill='toself', name='Resume'))
+        fig.add_trace(go.Scatterpolar(r=jd_vector, theta=all_skills, fill='toself', name='Job Description'))
+        fig.update_layout(
+            polar=dict(radialaxis=dict(visible=True, range=[0,1])),
+            showlegend=True,
+            height=500,
+            margin=dict(l=40, r=40, t=40, b=40)
         )
-        with open(pdf_path, "rb") as f:
+        st.plotly_chart(fig, use_container_width=True)
+
+        st.subheader("Skill Fit Progress Bars")
+        if len(jd_skills) > 0:
+            skill_fit = len(comparison['present']) / len(jd_skills)
+        else:
+            skill_fit = 0
+        st.progress(skill_fit, text=f"{int(skill_fit*100)}% of job skills present in resume")
+        if len(resume_skills) > 0:
+            resume_relevance = len(comparison['present']) / len(resume_skills)
+        else:
+            resume_relevance = 0
+        st.progress(resume_relevance, text=f"{int(resume_relevance*100)}% of your resume skills match the job")
+
+        recs_and_path = {}
+        if comparison['missing']:
+            st.subheader("Dynamic Learning Path")
+            recs_and_path = run_stage('recommendations', values, pipeline_memo)['recs_and_path']
+            learning_path = recs_and_path.get('learning_path', [])
+            if learning_path:
+                for step in learning_path:
+                    st.markdown(f"- {step}")
+
+        if comparison['missing'] and resume_text and jd_text and target_role:
+            values['target_role'] = target_role
+            with st.spinner("Generating feedback and role-specific advice..."):
+                llm_outputs = run_stage('llm', values, pipeline_memo)
+            feedback = llm_outputs['feedback']
+            advice = llm_outputs['advice']
+            st.subheader("AI-Powered Resume Feedback")
+            st.markdown(feedback)
+
+            st.subheader("Role-Specific Advice")
+            st.markdown(advice)
+
+        if comparison['missing']:
+            st.header("5. Upskilling Recommendations")
+            recommendations = recs_and_path['recommendations']
+            for skill, recs in recommendations.items():
+                st.markdown(f"**{skill.title()}**")
+                for rec in recs:
+                    st.markdown(f"- {rec}")
+
+        from utils import generate_pdf_report
+        if st.button("Download PDF Report"):
+            pdf_bytes = generate_pdf_report(
+                resume_text=resume_text,
+                jd_text=jd_text,
+                present_skills=comparison['present'],
+                missing_skills=comparison['missing'],
+                learning_path=recs_and_path.get('learning_path', []),
+                ai_feedback=feedback if 'feedback' in locals() else '',
+                role_advice=advice if 'advice' in locals() else '',
+                radar=radar
+            )
             st.download_button(
                 label="Download PDF Report",
-                data=f,
+                data=pdf_bytes,
                 file_name="SkillShift_Report.pdf",
                 mime="application/pdf"
             )
-    st.markdown('</div>', unsafe_allow_html=True)
+        st.markdown('</div>', unsafe_allow_html=True)
+finally:
+    # Also on Streamlit's rerun/stop exceptions, so the profiler and collector never leak
+    profile_paths = run_profile.stop()
+    run_spans = span_collector.stop() if span_collector is not None else []
+
+if profile_paths:
+    st.caption(f"Profile written to {profile_paths[0]} and {profile_paths[1]}")
+
+if debug_panel:
+    session_spans = st.session_state.setdefault('debug_spans', [])
+    session_spans.extend(run_spans)
+    with st.expander("Debug: stage timings"):
+        st.caption("Stages served from the session memo do not run again and are not timed.")
+        st.markdown("**This run**")
+        if run_spans:
+            st.table(metrics.breakdown(run_spans))
+        else:
+            st.info("No stages ran.")
+        st.markdown("**This session**")
+        if session_spans:
+            st.table(metrics.breakdown(session_spans))
 
 # Footer
 st.markdown("""
 ---
 <center><sub>SkillShift &copy; 2024 | Empowering your career with AI | Developed by Chandana Gangaraju</sub></center>
-""", unsafe_allow_html=True) 
\ No newline at end of file
+""", unsafe_allow_html=True)
@@ -0,0 +1,80 @@
+import os
+from multiprocessing import Pool
+
+# What each item in a batch is: raw text, a resume file or a job description file
+BATCH_MODES = ('text', 'resume', 'job')
+
+_worker_mode = None
+# The parent's parse cache, kept referenced in a worker: dropping it would close the
+# parent's SQLite connection from the child, which could checkpoint the parent's WAL
+_inherited_parse_cache = None
+
+def _init_worker(mode):
+    """
+    Runs once per pool worker process. Importing utils compiles the skill matcher, so
+    every document handled by this worker reuses it instead of rebuilding it.
+    A forked worker must not use the parent's SQLite connection, so the parse cache is
+    reopened on first use; the inherited one is left untouched.
+    """
+    global _worker_mode, _inherited_parse_cache
+    import utils  # noqa: F401
+    import parse_cache
+    _inherited_parse_cache = parse_cache._default_cache
+    parse_cache._default_cache = None
+    _worker_mode = mode
+
+def _process_item(item, mode):
+    if mode == 'text':
+        from utils import extract_skills_from_text
+        return extract_skills_from_text(item)
+    if mode == 'resume':
+        from resume_parser import parse_resume
+        return parse_resume(item)
+    from job_parser import parse_job_description
+    return parse_job_description(item)
+
+def _run_item(item, mode):
+    try:
+        return _process_item(item, mode)
+    except Exception as e:
+        # Returned rather than raised so one bad file does not abort the whole batch
+        return e
+
+def _worker(item):
+    return _run_item(item, _worker_mode)
+
+def extract_skills_batch(items, mode='text', workers=None, chunksize=16, return_exceptions=False):
+    """
+    Extract skills from many documents across a process pool.
+    `items` is any iterable of texts (mode='text') or file paths (mode='resume' / 'job').
+    Yields one result per item, in input order, as soon as it is ready: a sorted skill
+    list for 'text', or the tuple returned by parse_resume / parse_job_description.
+    Failed items raise, or are yielded as the exception when return_exceptions=True.
+    Arguments are checked when called, before the first result is requested.
+    """
+    if mode not in BATCH_MODES:
+        raise ValueError(f"Unsupported batch mode: {mode}")
+    if workers is None:
+        workers = os.cpu_count() or 1
+    if workers < 1 or chunksize < 1:
+        raise ValueError("workers and chunksize must be at least 1.")
+    return _iter_batch(items, mode, workers, chunksize, return_exceptions)
+
+def _iter_batch(items, mode, workers, chunksize, return_exceptions):
+    if workers == 1:
+        # No pool for a single worker; run inline with the same per-item semantics. The
+        # mode is passed per item, so batches in one process or thread do not interfere.
+        results = (_run_item(item, mode) for item in items)
+        pool = None
+    else:
+        pool = Pool(workers, initializer=_init_worker, initargs=(mode,))
+        results = pool.imap(_worker, items, chunksize=chunksize)
+    try:
+        for result in results:
+            if isinstance(result, Exception) and not return_exceptions:
+                raise result
+            yield result
+    finally:
+        if pool is not None:
+            pool.terminate()
+            pool.join()
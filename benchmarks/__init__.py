@@ -0,0 +1 @@
+"""Performance benchmarks and synthetic corpora for SkillShift."""
@@ -0,0 +1,61 @@
+"""
+Throughput of bulk_reports.generate_reports_bulk on synthetic analysis results.
+
+Run from the repository root:
+
+    python benchmarks/bench_bulk_reports.py [count]
+
+Renders `count` reports (default 2,000), each with a radar chart and LLM-sized feedback
+text, into a ZIP archive in a temporary directory with 1, 2 and 4 worker processes, and
+prints reports per second and the archive size.
+"""
+import os
+import random
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from bulk_reports import generate_reports_bulk
+from skill_taxonomy import TAXONOMY
+
+WORKER_COUNTS = [1, 2, 4]
+FEEDBACK = "Quantify the impact of your data pipeline work and highlight cloud experience. " * 12
+
+def make_result(rng, index):
+    resume = rng.sample(TAXONOMY.skills, 12)
+    jd = rng.sample(TAXONOMY.skills, 10) + resume[:4]
+    labels = sorted(set(s.title() for s in resume + jd))
+    return {
+        'name': f"candidate_{index:05d}",
+        'resume_text': "Experienced engineer. " * 60,
+        'jd_text': "We are hiring a Senior Data Engineer. " * 40,
+        'present_skills': sorted(set(resume) & set(jd)),
+        'missing_skills': sorted(set(jd) - set(resume)),
+        'learning_path': [f"Focus on {s.title()}." for s in jd[:3]],
+        'ai_feedback': FEEDBACK,
+        'role_advice': FEEDBACK,
+        'radar': {
+            'radar_labels': labels,
+            'resume_vector': [int(l.lower() in resume) for l in labels],
+            'jd_vector': [int(l.lower() in jd) for l in labels],
+        },
+    }
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 2000
+    rng = random.Random(0)
+    results = [make_result(rng, i) for i in range(count)]
+    print(f"{'workers':>7} {'reports':>8} {'seconds':>8} {'reports/s':>10} {'zip MB':>7}")
+    with tempfile.TemporaryDirectory() as tmp:
+        for workers in WORKER_COUNTS:
+            path = os.path.join(tmp, f"reports_{workers}.zip")
+            start = time.perf_counter()
+            summary = generate_reports_bulk(results, path, workers=workers, chunksize=8)
+            elapsed = time.perf_counter() - start
+            size_mb = os.path.getsize(path) / (1024 * 1024)
+            print(f"{workers:>7} {summary['written']:>8} {elapsed:>8.2f} {summary['written'] / elapsed:>10.1f} {size_mb:>7.1f}")
+
+if __name__ == '__main__':
+    main()
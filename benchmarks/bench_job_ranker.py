@@ -0,0 +1,50 @@
+"""
+Latency of job_ranker for one candidate against up to 5,000 job postings.
+
+Run from the repository root:
+
+    python benchmarks/bench_job_ranker.py
+
+Postings are random draws of 5-25 taxonomy skills plus a few skills outside the taxonomy.
+`encode` is the one-off cost of building the job matrix; `rank` is the per-candidate cost
+of scoring every posting and selecting the top 10, which is what a recruiter waits for.
+"""
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from job_ranker import JobRanker
+from skill_taxonomy import TAXONOMY
+
+JOB_COUNTS = [500, 1000, 5000]
+RESUME_BATCH = 100
+
+def random_skills(rng):
+    skills = rng.sample(TAXONOMY.skills, rng.randint(5, 25))
+    return skills + [f"custom skill {rng.randint(0, 500)}" for _ in range(rng.randint(0, 3))]
+
+def best_of(function, repeat):
+    best = float('inf')
+    for _ in range(repeat):
+        start = time.perf_counter()
+        function()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+def main():
+    rng = random.Random(0)
+    resumes = [random_skills(rng) for _ in range(RESUME_BATCH)]
+    print(f"{'jobs':>6} {'encode ms':>10} {'rank 1 ms':>10} {'rank 100 ms':>12}")
+    for job_count in JOB_COUNTS:
+        jobs = [random_skills(rng) for _ in range(job_count)]
+        encode = best_of(lambda: JobRanker(jobs), repeat=3)
+        ranker = JobRanker(jobs)
+        single = best_of(lambda: ranker.rank_jobs(resumes[:1], k=10), repeat=20)
+        batch = best_of(lambda: ranker.rank_jobs(resumes, k=10), repeat=3)
+        print(f"{job_count:>6} {encode * 1000:>10.2f} {single * 1000:>10.2f} {batch * 1000:>12.2f}")
+
+if __name__ == '__main__':
+    main()
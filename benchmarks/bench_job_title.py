@@ -0,0 +1,51 @@
+"""
+Latency of utils.extract_job_title on job descriptions from 1 KB to 1 MB.
+
+Run from the repository root:
+
+    python benchmarks/bench_job_title.py
+
+Each size is timed for a posting whose title sits at the top, one whose title only appears
+at the very end, and one with no title at all (the worst case, a full scan plus the
+common-title fallback). Time per KB should stay flat as the size grows.
+"""
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from utils import extract_job_title
+
+SIZES_KB = [1, 4, 16, 64, 256, 1024]
+FILLER = (
+    "You will collaborate with cross functional teams to design and ship reliable data products "
+    "and you will mentor peers while improving our tooling and processes across the organization "
+)
+
+def make_jd(size_kb, title_position):
+    body = (FILLER * (size_kb * 1024 // len(FILLER) + 1))[:size_kb * 1024]
+    if title_position == 'top':
+        return "Job Title: Senior Data Engineer\n" + body
+    if title_position == 'end':
+        return body + "\nWe are hiring a Staff Machine Learning Engineer."
+    return body
+
+def time_call(text, repeat):
+    best = float('inf')
+    for _ in range(repeat):
+        start = time.perf_counter()
+        extract_job_title(text)
+        best = min(best, time.perf_counter() - start)
+    return best
+
+def main():
+    print(f"{'size':>8} {'case':>6} {'ms':>10} {'us/KB':>8}")
+    for size_kb in SIZES_KB:
+        for case in ('top', 'end', 'none'):
+            text = make_jd(size_kb, case)
+            seconds = time_call(text, repeat=max(3, 200 // size_kb))
+            print(f"{size_kb:>6}KB {case:>6} {seconds * 1000:>10.3f} {seconds * 1e6 / size_kb:>8.1f}")
+
+if __name__ == '__main__':
+    main()
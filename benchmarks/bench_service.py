@@ -0,0 +1,63 @@
+"""
+Throughput of the headless analysis service under concurrent load.
+
+Run from the repository root:
+
+    python benchmarks/bench_service.py
+
+Starts an AnalysisService with a few worker counts, fires CONCURRENCY client threads at it
+for REQUESTS text-only analyses each, and reports requests per second, latency
+percentiles, and how many requests were rejected (503) or timed out (504).
+"""
+import os
+import sys
+import threading
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from service import AnalysisService, ServiceBusy, ServiceTimeout
+
+WORKER_COUNTS = [1, 2, 4]
+CONCURRENCY = 16
+REQUESTS = 50
+JD_TEXT = (
+    "Job Title: Senior Data Engineer\nWe need Python, SQL, Apache Spark, Airflow, AWS and Docker. "
+    "Experience with Tableau, communication and project management is a plus.\n"
+) * 20
+RESUME_TEXT = "Data engineer with Python, pandas, SQL Server, Hadoop, Excel and leadership experience. " * 20
+
+def client(service, latencies, outcomes):
+    for _ in range(REQUESTS):
+        start = time.perf_counter()
+        try:
+            service.analyze(JD_TEXT, resume_text=RESUME_TEXT)
+            latencies.append(time.perf_counter() - start)
+            outcomes['ok'] += 1
+        except ServiceBusy:
+            outcomes['busy'] += 1
+        except ServiceTimeout:
+            outcomes['timeout'] += 1
+
+def percentile(values, q):
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(q * len(ordered)))] if ordered else float('nan')
+
+def main():
+    print(f"{'workers':>7} {'req/s':>8} {'p50 ms':>8} {'p95 ms':>8} {'503':>5} {'504':>5}")
+    for workers in WORKER_COUNTS:
+        with AnalysisService(workers=workers, max_queue=CONCURRENCY) as service:
+            latencies = []
+            outcomes = {'ok': 0, 'busy': 0, 'timeout': 0}
+            threads = [threading.Thread(target=client, args=(service, latencies, outcomes)) for _ in range(CONCURRENCY)]
+            start = time.perf_counter()
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join()
+            elapsed = time.perf_counter() - start
+            print(f"{workers:>7} {outcomes['ok'] / elapsed:>8.1f} {percentile(latencies, 0.5) * 1000:>8.2f} "
+                  f"{percentile(latencies, 0.95) * 1000:>8.2f} {outcomes['busy']:>5} {outcomes['timeout']:>5}")
+
+if __name__ == '__main__':
+    main()
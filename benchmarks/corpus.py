@@ -0,0 +1,94 @@
+"""
+Synthetic resumes and job descriptions of controlled size and skill density.
+
+Documents are deterministic for a given seed. Size is the approximate length of the text
+in KB. Density is the share of words that are skills drawn from the taxonomy.
+"""
+import io
+import random
+from skill_taxonomy import TAXONOMY
+
+FILLER_WORDS = (
+    "designed built delivered improved reliable scalable systems across teams customers "
+    "analysis reporting stakeholders quarterly growth platform services migration reduced "
+    "latency cost ownership mentoring reviews roadmap features production quality data "
+    "insights process automation workflow results partners strategy support launch"
+).split()
+TITLES = ['Senior Data Engineer', 'Machine Learning Engineer', 'Business Analyst', 'Product Manager', 'Data Scientist']
+SECTIONS = ['SUMMARY', 'EXPERIENCE', 'PROJECTS', 'EDUCATION']
+
+def _sentences(rng, size_bytes, density, skills):
+    """Sentences of filler words with skills mixed in at `density`, up to about size_bytes."""
+    lines = []
+    length = 0
+    while length < size_bytes:
+        words = [rng.choice(skills) if rng.random() < density else rng.choice(FILLER_WORDS) for _ in range(rng.randint(8, 16))]
+        line = ' '.join(words).capitalize() + '.'
+        lines.append(line)
+        length += len(line) + 1
+    return lines
+
+def make_job_description(size_kb=4, density=0.05, seed=0):
+    """Job description text: a title line, then requirement sentences."""
+    rng = random.Random(seed)
+    skills = rng.sample(TAXONOMY.skills, 25)
+    title = rng.choice(TITLES)
+    body = _sentences(rng, size_kb * 1024, density, skills)
+    return f"Job Title: {title}\nWe are hiring a {title} to join our team.\n" + '\n'.join(body)
+
+def resume_lines(size_kb=4, density=0.05, seed=0, skills_count=15):
+    """Resume lines: a Skills section followed by the usual sections filled to size."""
+    rng = random.Random(seed)
+    skills = rng.sample(TAXONOMY.skills, skills_count)
+    lines = ['Jane Doe', 'SKILLS', 'Technical: ' + ', '.join(skills[:skills_count // 2]),
+             'Tools: ' + ', '.join(skills[skills_count // 2:]), '']
+    body = _sentences(rng, size_kb * 1024, density, skills)
+    per_section = max(1, len(body) // len(SECTIONS))
+    for i, section in enumerate(SECTIONS):
+        lines.append(section)
+        lines.extend(body[i * per_section:(i + 1) * per_section])
+        lines.append('')
+    return lines
+
+def make_resume_text(size_kb=4, density=0.05, seed=0):
+    return '\n'.join(resume_lines(size_kb, density, seed))
+
+def make_resume_pdf(size_kb=4, density=0.05, seed=0):
+    """Resume as PDF bytes, one text line per PDF line."""
+    from fpdf import FPDF
+    pdf = FPDF()
+    pdf.add_page()
+    pdf.set_font("Arial", size=9)
+    for line in resume_lines(size_kb, density, seed):
+        pdf.multi_cell(0, 4, line)
+    output = pdf.output(dest='S')
+    return output.encode('latin-1') if isinstance(output, str) else bytes(output)
+
+def make_resume_docx(size_kb=4, density=0.05, seed=0):
+    """Resume as DOCX bytes, one paragraph per line."""
+    import docx
+    document = docx.Document()
+    for line in resume_lines(size_kb, density, seed):
+        document.add_paragraph(line)
+    buffer = io.BytesIO()
+    document.save(buffer)
+    return buffer.getvalue()
+
+def make_job_description_pdf(size_kb=4, density=0.05, seed=0):
+    from fpdf import FPDF
+    pdf = FPDF()
+    pdf.add_page()
+    pdf.set_font("Arial", size=9)
+    for line in make_job_description(size_kb, density, seed).split('\n'):
+        pdf.multi_cell(0, 4, line)
+    output = pdf.output(dest='S')
+    return output.encode('latin-1') if isinstance(output, str) else bytes(output)
+
+def make_skill_lists(count, seed=0):
+    """Skill lists of 5-30 taxonomy skills with occasional misspelled variants, for comparisons."""
+    rng = random.Random(seed)
+    lists = []
+    for _ in range(count):
+        skills = rng.sample(TAXONOMY.skills, rng.randint(5, 30))
+        lists.append([s[:-1] if len(s) > 5 and rng.random() < 0.1 else s for s in skills])
+    return lists
@@ -0,0 +1,110 @@
+"""
+Cold-start import budget for the SkillShift modules.
+
+Run from the repository root:
+
+    python benchmarks/import_budget.py [--scale 2.0] [--json]
+
+Each module is imported in a fresh interpreter with `python -X importtime` (best of
+REPEAT runs) and its cumulative import time is compared with its budget. The run also
+fails if importing a module pulls in one of the HEAVY_MODULES, which must only be loaded
+on first use, or if app.py imports one of them at module level. Exits with status 1 when
+any check fails, so it can gate CI. --scale multiplies every budget, for slower machines.
+"""
+import argparse
+import ast
+import json
+import os
+import subprocess
+import sys
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# Cumulative import time budget per module, in milliseconds
+BUDGETS_MS = {
+    'utils': 40,
+    'skill_taxonomy': 10,
+    'metrics': 10,
+    'profiling': 40,
+    'skill_comparator': 40,
+    'resume_parser': 60,
+    'job_parser': 60,
+    'recommender': 100,
+    'pipeline': 150,
+    'job_store': 60,
+    'service': 100,
+}
+
+# Dependencies that are deferred to first use and must not load at import time
+HEAVY_MODULES = ('pdfplumber', 'docx', 'fpdf', 'requests', 'bs4', 'plotly', 'numpy', 'scipy', 'openai', 'pandas', 'sentence_transformers')
+
+REPEAT = 3
+
+_PROBE = "import sys, json, {module}; print(json.dumps(sorted(m for m in {heavy!r} if m in sys.modules)))"
+
+def measure(module):
+    """(best cumulative import time in ms, heavy modules loaded) for one module."""
+    best = None
+    loaded = []
+    for _ in range(REPEAT):
+        proc = subprocess.run(
+            [sys.executable, '-X', 'importtime', '-c', _PROBE.format(module=module, heavy=HEAVY_MODULES)],
+            cwd=ROOT, capture_output=True, text=True,
+        )
+        if proc.returncode != 0:
+            raise RuntimeError(f"Importing {module} failed:\n{proc.stderr[-2000:]}")
+        loaded = json.loads(proc.stdout.strip().splitlines()[-1])
+        for line in proc.stderr.splitlines():
+            # import time: self [us] | cumulative | imported package
+            parts = line.split('|')
+            if len(parts) == 3 and parts[2].strip() == module:
+                cumulative_ms = int(parts[1]) / 1000
+                best = cumulative_ms if best is None else min(best, cumulative_ms)
+    return best, loaded
+
+def app_heavy_imports(path=os.path.join(ROOT, 'app.py')):
+    """Heavy modules imported at the top level of app.py (function and block bodies excluded)."""
+    with open(path, 'r', encoding='utf-8') as f:
+        tree = ast.parse(f.read())
+    found = []
+    for node in tree.body:
+        if isinstance(node, ast.Import):
+            names = [alias.name for alias in node.names]
+        elif isinstance(node, ast.ImportFrom):
+            names = [node.module or '']
+        else:
+            continue
+        found.extend(name for name in names if name.split('.')[0] in HEAVY_MODULES)
+    return found
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Check module import times against their budgets.")
+    parser.add_argument('--scale', type=float, default=1.0, help="Multiply every budget by this factor")
+    parser.add_argument('--json', action='store_true', help="Print results as JSON")
+    args = parser.parse_args(argv)
+
+    results = []
+    for module, budget in BUDGETS_MS.items():
+        elapsed, loaded = measure(module)
+        budget *= args.scale
+        results.append({
+            'module': module, 'ms': round(elapsed, 2), 'budget_ms': budget, 'heavy_loaded': loaded,
+            'ok': elapsed <= budget and not loaded,
+        })
+    app_imports = app_heavy_imports()
+    failed = [r for r in results if not r['ok']]
+
+    if args.json:
+        print(json.dumps({'modules': results, 'app_heavy_imports': app_imports, 'ok': not failed and not app_imports}, indent=2))
+    else:
+        print(f"{'module':<18} {'ms':>8} {'budget':>8}  status")
+        for r in results:
+            status = 'ok' if r['ok'] else 'OVER BUDGET' if not r['heavy_loaded'] else 'loads ' + ', '.join(r['heavy_loaded'])
+            print(f"{r['module']:<18} {r['ms']:>8.1f} {r['budget_ms']:>8.1f}  {status}")
+        if app_imports:
+            print(f"app.py imports at module level: {', '.join(app_imports)}")
+    if failed or app_imports:
+        sys.exit(1)
+
+if __name__ == '__main__':
+    main()
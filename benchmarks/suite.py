@@ -0,0 +1,191 @@
+"""
+Benchmark suite for the hot paths, on synthetic corpora.
+
+Run from the repository root:
+
+    python -m benchmarks.suite [--quick] [--output results.json]
+    python -m benchmarks.suite --compare baseline.json results.json [--threshold 0.2]
+
+Every case is timed call by call until it has run at least MIN_RUNS times and for at
+least MIN_SECONDS. The JSON result has latency percentiles (ms) and throughput per case,
+plus the commit and interpreter it was measured on. --compare reports cases whose median
+latency grew by more than --threshold between two result files, and exits with status 1
+if there are any.
+"""
+import argparse
+import json
+import os
+import platform
+import subprocess
+import sys
+import tempfile
+import time
+from benchmarks import corpus
+
+MIN_RUNS = 5
+MIN_SECONDS = 0.5
+MAX_RUNS = 2000
+
+SIZES_KB = [1, 4, 16, 64]
+QUICK_SIZES_KB = [1, 16]
+DENSITIES = [0.02, 0.1]
+
+def _percentile(ordered, q):
+    position = (len(ordered) - 1) * q
+    low = int(position)
+    high = min(low + 1, len(ordered) - 1)
+    return ordered[low] + (ordered[high] - ordered[low]) * (position - low)
+
+def time_case(function, min_runs=MIN_RUNS, min_seconds=MIN_SECONDS):
+    """Per-call durations in seconds, after one warm-up call."""
+    function()
+    durations = []
+    started = time.perf_counter()
+    while len(durations) < MAX_RUNS and (len(durations) < min_runs or time.perf_counter() - started < min_seconds):
+        start = time.perf_counter()
+        function()
+        durations.append(time.perf_counter() - start)
+    return durations
+
+def summarize(name, params, durations, size_bytes=None):
+    ordered = sorted(durations)
+    total = sum(durations)
+    result = {
+        'name': name,
+        'params': params,
+        'runs': len(durations),
+        'mean_ms': total / len(durations) * 1000,
+        'p50_ms': _percentile(ordered, 0.5) * 1000,
+        'p90_ms': _percentile(ordered, 0.9) * 1000,
+        'p99_ms': _percentile(ordered, 0.99) * 1000,
+        'ops_per_s': len(durations) / total if total else None,
+    }
+    if size_bytes:
+        result['kb_per_s'] = size_bytes / 1024 * len(durations) / total if total else None
+    return result
+
+def _comparison_index(tmp):
+    """Skill index with the dependency-free hashing encoder, so no model is downloaded."""
+    from skill_embeddings import HashingEncoder, build_skill_index
+    return build_skill_index(encoder=HashingEncoder(), path=os.path.join(tmp, 'skill_index.npy'))
+
+def _cases(sizes, tmp):
+    """(name, params, function, input size in bytes) for every benchmark case."""
+    from job_parser import parse_job_description
+    from keyword_engine import KeywordEngine
+    from recommender import generate_recommendations
+    from resume_parser import parse_resume
+    from skill_comparator import compare_skills, get_partial_matches
+    from utils import extract_job_title, extract_skills_from_text, generate_pdf_report
+
+    keywords = KeywordEngine()
+    for seed in range(200):
+        keywords.add_document(corpus.make_job_description(4, seed=seed))
+
+    for size_kb in sizes:
+        for density in DENSITIES:
+            params = {'size_kb': size_kb, 'density': density}
+            jd = corpus.make_job_description(size_kb, density)
+            yield 'extract_skills_from_text', params, lambda jd=jd: extract_skills_from_text(jd), len(jd)
+            yield 'extract_job_title', params, lambda jd=jd: extract_job_title(jd), len(jd)
+            yield 'top_keywords', params, lambda jd=jd: keywords.top_keywords(jd), len(jd)
+        params = {'size_kb': size_kb, 'density': 0.05}
+        jd_bytes = corpus.make_job_description(size_kb).encode('utf-8')
+        jd_pdf = corpus.make_job_description_pdf(size_kb)
+        yield 'parse_job_description', dict(params, format='txt'), lambda d=jd_bytes: parse_job_description(d, use_cache=False), len(jd_bytes)
+        yield 'parse_job_description', dict(params, format='pdf'), lambda d=jd_pdf: parse_job_description(d, use_cache=False), len(jd_bytes)
+        resume_pdf = corpus.make_resume_pdf(size_kb)
+        resume_docx = corpus.make_resume_docx(size_kb)
+        yield 'parse_resume', dict(params, format='pdf'), lambda d=resume_pdf: parse_resume(d, use_cache=False), size_kb * 1024
+        yield 'parse_resume', dict(params, format='pdf', streaming=True), lambda d=resume_pdf: parse_resume(d, use_cache=False, streaming=True), size_kb * 1024
+        yield 'parse_resume', dict(params, format='docx'), lambda d=resume_docx: parse_resume(d, use_cache=False), size_kb * 1024
+
+    index = _comparison_index(tmp)
+    for count in (10, 30):
+        resumes = corpus.make_skill_lists(50, seed=count)
+        jobs = corpus.make_skill_lists(50, seed=count + 1)
+        pairs = [(r[:count], j[:count]) for r, j in zip(resumes, jobs)]
+        params = {'skills': count, 'pairs': len(pairs)}
+        yield 'compare_skills', params, lambda pairs=pairs: [compare_skills(r, j, skill_index=index) for r, j in pairs], None
+        yield 'get_partial_matches', params, lambda pairs=pairs: [get_partial_matches(r, j) for r, j in pairs], None
+        yield 'generate_recommendations', params, lambda pairs=pairs: [generate_recommendations(j, j) for _, j in pairs], None
+
+    radar = {'radar_labels': [f"Skill {i}" for i in range(20)], 'resume_vector': [i % 2 for i in range(20)], 'jd_vector': [1] * 20}
+    for feedback_kb in (1, 8):
+        feedback = corpus.make_job_description(feedback_kb)
+        yield 'generate_pdf_report', {'feedback_kb': feedback_kb}, lambda f=feedback: generate_pdf_report(
+            f[:2000], f[:2000], ['python', 'sql'], ['aws', 'docker'], ['Learn AWS.'], f, f, radar=radar), None
+
+def git_commit():
+    try:
+        return subprocess.run(['git', 'rev-parse', '--short', 'HEAD'], capture_output=True, text=True, check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+def run(quick=False, only=None):
+    """Run every case (or those named in `only`) and return the JSON-ready result."""
+    results = []
+    with tempfile.TemporaryDirectory() as tmp:
+        for name, params, function, size_bytes in _cases(QUICK_SIZES_KB if quick else SIZES_KB, tmp):
+            if only and name not in only:
+                continue
+            durations = time_case(function, min_seconds=MIN_SECONDS / 5 if quick else MIN_SECONDS)
+            result = summarize(name, params, durations, size_bytes)
+            results.append(result)
+            print(f"{name:<26} {json.dumps(params):<48} p50 {result['p50_ms']:>9.3f} ms  p99 {result['p99_ms']:>9.3f} ms", file=sys.stderr)
+    return {
+        'meta': {
+            'commit': git_commit(),
+            'python': platform.python_version(),
+            'platform': platform.platform(),
+            'timestamp': time.strftime('%Y-%m-%dT%H:%M:%S%z'),
+            'quick': quick,
+        },
+        'results': results,
+    }
+
+def _case_key(result):
+    return result['name'], json.dumps(result['params'], sort_keys=True)
+
+def compare(baseline, current, threshold=0.2):
+    """(case key, baseline p50, current p50, relative change) for cases slower than threshold."""
+    before = {_case_key(r): r for r in baseline['results']}
+    regressions = []
+    for result in current['results']:
+        old = before.get(_case_key(result))
+        if old is None or not old['p50_ms']:
+            continue
+        change = result['p50_ms'] / old['p50_ms'] - 1
+        if change > threshold:
+            regressions.append((_case_key(result), old['p50_ms'], result['p50_ms'], change))
+    return regressions
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmark SkillShift hot paths on synthetic corpora.")
+    parser.add_argument('--quick', action='store_true', help="Fewer sizes and shorter timing, for smoke runs")
+    parser.add_argument('--only', nargs='+', help="Only run the named functions")
+    parser.add_argument('--output', help="Write the JSON result to this file instead of stdout")
+    parser.add_argument('--compare', nargs=2, metavar=('BASELINE', 'CURRENT'), help="Compare two result files")
+    parser.add_argument('--threshold', type=float, default=0.2, help="Median slowdown that counts as a regression")
+    args = parser.parse_args(argv)
+
+    if args.compare:
+        with open(args.compare[0]) as f:
+            baseline = json.load(f)
+        with open(args.compare[1]) as f:
+            current = json.load(f)
+        regressions = compare(baseline, current, args.threshold)
+        for (name, params), old, new, change in regressions:
+            print(f"{name} {params}: p50 {old:.3f} ms -> {new:.3f} ms ({change:+.0%})")
+        print(f"{len(regressions)} regression(s) above {args.threshold:.0%}")
+        sys.exit(1 if regressions else 0)
+
+    result = run(quick=args.quick, only=args.only)
+    if args.output:
+        with open(args.output, 'w') as f:
+            json.dump(result, f, indent=2)
+    else:
+        print(json.dumps(result, indent=2))
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,148 @@
+import argparse
+import json
+import os
+import re
+import sys
+import zipfile
+from multiprocessing import Pool
+
+def _init_worker():
+    """
+    Runs once per worker process: imports FPDF and its core font metrics and renders a
+    throwaway report, so every report handled by this worker starts warm.
+    """
+    from utils import generate_pdf_report
+    generate_pdf_report('', '', [], [], [], '', '', radar={'radar_labels': ['a', 'b', 'c'], 'resume_vector': [1, 0, 1], 'jd_vector': [0, 1, 1]})
+
+def report_arguments(result):
+    """
+    generate_pdf_report keyword arguments for one analysis result: a dict with its argument
+    names, or an AnalysisService result ('comparison', 'learning_path', ...) plus the texts.
+    Feedback, advice, learning path and radar are optional.
+    """
+    comparison = result.get('comparison') or {}
+    return {
+        'resume_text': result.get('resume_text', ''),
+        'jd_text': result.get('jd_text', ''),
+        'present_skills': result.get('present_skills', comparison.get('present', [])),
+        'missing_skills': result.get('missing_skills', comparison.get('missing', [])),
+        'learning_path': result.get('learning_path', []),
+        'ai_feedback': result.get('ai_feedback', result.get('feedback', '')),
+        'role_advice': result.get('role_advice', result.get('advice', '')),
+        'radar': result.get('radar'),
+    }
+
+def _render(job):
+    index, name, result = job
+    from utils import generate_pdf_report
+    try:
+        return index, name, generate_pdf_report(**report_arguments(result)), None
+    except Exception as e:
+        # Returned rather than raised so one bad result does not abort the whole batch
+        return index, name, None, f"{type(e).__name__}: {e}"
+
+def _file_name(result, index, used):
+    base = re.sub(r'[^\w.-]+', '_', str(result.get('name') or f"report_{index + 1:05d}")).strip('._') or f"report_{index + 1:05d}"
+    if base.lower().endswith('.pdf'):
+        base = base[:-4]
+    name = f"{base}.pdf"
+    suffix = 2
+    while name in used:
+        name = f"{base}_{suffix}.pdf"
+        suffix += 1
+    used.add(name)
+    return name
+
+class _ZipSink:
+    def __init__(self, path):
+        os.makedirs(os.path.dirname(path) or '.', exist_ok=True)
+        # PDF page streams are already compressed, so entries are stored as they are
+        self._zip = zipfile.ZipFile(path, 'w', compression=zipfile.ZIP_STORED)
+
+    def write(self, name, data):
+        self._zip.writestr(name, data)
+
+    def close(self):
+        self._zip.close()
+
+class _DirectorySink:
+    def __init__(self, path):
+        self.path = path
+        os.makedirs(path, exist_ok=True)
+
+    def write(self, name, data):
+        with open(os.path.join(self.path, name), 'wb') as f:
+            f.write(data)
+
+    def close(self):
+        pass
+
+def generate_reports_bulk(results, output, workers=None, chunksize=4, progress=None):
+    """
+    Render a PDF report for each analysis result across a process pool and stream them
+    into `output`: a ZIP archive if it ends in .zip, otherwise a directory.
+    Each report is written as soon as it is ready, so at most a few PDFs are held in
+    memory. A result's 'name' becomes its file name (report_00001.pdf etc. by default).
+    progress(done, total) is called after every report; total is None for unsized input.
+    Returns a dict with 'written', 'failed' ((file name, error) pairs) and 'output'.
+    """
+    if workers is None:
+        workers = os.cpu_count() or 1
+    if workers < 1 or chunksize < 1:
+        raise ValueError("workers and chunksize must be at least 1.")
+    total = len(results) if hasattr(results, '__len__') else None
+    used = set()
+    jobs = ((index, _file_name(result, index, used), result) for index, result in enumerate(results))
+
+    sink = _ZipSink(output) if output.lower().endswith('.zip') else _DirectorySink(output)
+    if workers == 1:
+        _init_worker()
+        rendered = (_render(job) for job in jobs)
+        pool = None
+    else:
+        pool = Pool(workers, initializer=_init_worker)
+        rendered = pool.imap_unordered(_render, jobs, chunksize=chunksize)
+    written = 0
+    failed = []
+    try:
+        for done, (index, name, data, error) in enumerate(rendered, 1):
+            if error is None:
+                sink.write(name, data)
+                written += 1
+            else:
+                failed.append((name, error))
+            if progress is not None:
+                progress(done, total)
+    finally:
+        if pool is not None:
+            pool.terminate()
+            pool.join()
+        sink.close()
+    return {'written': written, 'failed': sorted(failed), 'output': output}
+
+def _read_results(path):
+    """Analysis results from a JSON array or a JSON-lines file."""
+    with open(path, 'r', encoding='utf-8') as f:
+        text = f.read()
+    if text.lstrip().startswith('['):
+        return json.loads(text)
+    return [json.loads(line) for line in text.splitlines() if line.strip()]
+
+def _print_progress(done, total):
+    if done == total or done % 50 == 0:
+        print(f"\r{done}/{total} reports", end='' if done != total else '\n', file=sys.stderr, flush=True)
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Render SkillShift PDF reports for many analysis results.")
+    parser.add_argument('results', help="JSON array or JSON-lines file of analysis results")
+    parser.add_argument('output', help="Output .zip archive or directory")
+    parser.add_argument('--workers', type=int, default=None, help="Rendering processes (default: CPU count)")
+    args = parser.parse_args(argv)
+
+    summary = generate_reports_bulk(_read_results(args.results), args.output, workers=args.workers, progress=_print_progress)
+    print(f"Wrote {summary['written']} reports to {summary['output']}")
+    for name, error in summary['failed']:
+        print(f"Failed {name}: {error}", file=sys.stderr)
+
+if __name__ == '__main__':
+    main()
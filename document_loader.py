@@ -0,0 +1,41 @@
+import io
+import os
+import zipfile
+
+def load_document(source):
+    """
+    Bytes of a document given as a file path, bytes-like object (bytes, bytearray,
+    memoryview such as an upload's getbuffer()) or binary file-like object.
+    Bytes-like objects are returned as they are, without copying.
+    """
+    if isinstance(source, (str, os.PathLike)):
+        with open(source, 'rb') as f:
+            return f.read()
+    if isinstance(source, (bytes, bytearray, memoryview)):
+        return source
+    if hasattr(source, 'read'):
+        return source.read()
+    raise TypeError(f"Unsupported document source: {type(source).__name__}")
+
+def detect_format(data):
+    """
+    'pdf', 'docx' or 'txt' from a document's content, or None if unrecognized. ZIP
+    archives only count as DOCX when they hold word/document.xml, so spreadsheets,
+    presentations and other archives are unrecognized rather than misparsed.
+    """
+    head = bytes(data[:8])
+    if head.startswith(b'%PDF'):
+        return 'pdf'
+    # DOCX files are ZIP archives
+    if head.startswith(b'PK\x03\x04'):
+        try:
+            with zipfile.ZipFile(io.BytesIO(data)) as archive:
+                archive.getinfo('word/document.xml')
+        except (zipfile.BadZipFile, KeyError):
+            return None
+        return 'docx'
+    try:
+        str(data, 'utf-8')
+    except UnicodeDecodeError:
+        return None
+    return 'txt'
@@ -1,19 +1,43 @@
-import pdfplumber
-import docx
 from utils import extract_skills_from_text
+from metrics import span, timed
+from parse_cache import cached_parse
+from document_loader import detect_format, load_document
+import io
+from functools import partial
 
-def parse_job_description(file_path):
-    """Extract text and skills from a PDF, DOCX, or TXT job description."""
-    if file_path.lower().endswith('.pdf'):
-        with pdfplumber.open(file_path) as pdf:
+# Bump when parsing logic changes so cached results are not reused
+PARSER_VERSION = 1
+
+@timed('job_parser.parse_job_description')
+def parse_job_description(source, use_cache=True):
+    """
+    Extract text and skills from a PDF, DOCX, or TXT job description.
+    `source` is a file path, bytes-like object or binary file object; the format is
+    detected from the content.
+    """
+    data = load_document(source)
+    file_format = detect_format(data)
+    if file_format is None:
+        raise ValueError("Unsupported file type for job description.")
+    parse = partial(_parse_job_description, file_format=file_format)
+    if use_cache:
+        return cached_parse(f"job.{file_format}", data, PARSER_VERSION, parse)
+    return parse(data)
+
+def _parse_job_description(data, file_format):
+    # Parser libraries are imported on first use, keeping them off the app's startup path
+    if file_format == 'pdf':
+        import pdfplumber
+        with span('job_parser.pdf_text'), pdfplumber.open(io.BytesIO(data)) as pdf:
             text = "\n".join(page.extract_text() or '' for page in pdf.pages)
-    elif file_path.lower().endswith('.docx'):
-        doc = docx.Document(file_path)
-        text = "\n".join([para.text for para in doc.paragraphs])
-    elif file_path.lower().endswith('.txt'):
-        with open(file_path, 'r', encoding='utf-8') as f:
-            text = f.read()
+    elif file_format == 'docx':
+        import docx
+        with span('job_parser.docx_text'):
+            doc = docx.Document(io.BytesIO(data))
+            text = "\n".join([para.text for para in doc.paragraphs])
+    elif file_format == 'txt':
+        text = str(data, 'utf-8')
     else:
         raise ValueError("Unsupported file type for job description.")
     skills = extract_skills_from_text(text)
-    return text, skills 
\ No newline at end of file
+    return text, skills
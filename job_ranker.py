@@ -0,0 +1,167 @@
+import argparse
+import json
+from collections import namedtuple
+import numpy as np
+from scipy import sparse
+from skill_taxonomy import TAXONOMY
+
+# One ranked pair. `index` is the position of the matched job (or resume) in the input;
+# coverage is the share of the job's skills the resume has, relevance the share of the
+# resume's skills the job asks for, and matched the number of shared skills.
+Match = namedtuple('Match', ['index', 'coverage', 'relevance', 'matched'])
+
+RANK_BY = ('coverage', 'relevance')
+
+# Rows scored per sparse product, bounding the dense score block to CHUNK_ROWS x targets
+CHUNK_ROWS = 256
+
+def _skill_keys(skills):
+    """Distinct keys for a skill list: taxonomy IDs for known skills, lowercased names otherwise."""
+    keys = set()
+    for skill in skills:
+        skill_id = TAXONOMY.id_of(skill)
+        keys.add(skill_id if skill_id is not None else skill.lower())
+    return keys
+
+def _new_columns():
+    # Taxonomy skills keep their IDs as column numbers; other skills are appended as seen
+    return {skill_id: skill_id for skill_id in range(len(TAXONOMY.skills))}
+
+def encode_skill_sets(skill_sets, columns, grow=True):
+    """
+    Encode skill lists as a sparse binary matrix, one row per list.
+    `columns` maps skill keys to column numbers and gains new skills when `grow` is True;
+    otherwise skills without a column are left out of the matrix. Returns (matrix, counts)
+    where counts holds each row's number of distinct skills, including left-out ones.
+    """
+    indices = []
+    indptr = [0]
+    counts = []
+    for skills in skill_sets:
+        keys = _skill_keys(skills)
+        counts.append(len(keys))
+        for key in keys:
+            column = columns.get(key)
+            if column is None and grow:
+                column = columns[key] = len(columns)
+            if column is not None:
+                indices.append(column)
+        indptr.append(len(indices))
+    data = np.ones(len(indices), dtype=np.float32)
+    matrix = sparse.csr_matrix((data, np.array(indices, dtype=np.int32), np.array(indptr, dtype=np.int64)),
+                               shape=(len(counts), len(columns)))
+    return matrix, np.array(counts, dtype=np.float64)
+
+def _share(overlap, counts):
+    """overlap / counts, with 0 where a document has no skills."""
+    with np.errstate(divide='ignore', invalid='ignore'):
+        return np.where(counts > 0, overlap / np.maximum(counts, 1), 0.0)
+
+def _top_k(primary, secondary, k):
+    """Indices of the k best entries of a row: by primary, then secondary, then lowest index."""
+    if k < len(primary):
+        # Keep every entry tied with the k-th best so tie-breaking below stays exact
+        threshold = np.partition(primary, len(primary) - k)[len(primary) - k]
+        candidates = np.flatnonzero(primary >= threshold)
+    else:
+        candidates = np.arange(len(primary))
+    order = np.lexsort((candidates, -secondary[candidates], -primary[candidates]))
+    return candidates[order[:k]]
+
+def _rank(query_matrix, query_counts, target_matrix, target_counts, k, by, queries_are_resumes):
+    results = []
+    target_t = target_matrix.T.tocsc()
+    for start in range(0, query_matrix.shape[0], CHUNK_ROWS):
+        block = query_matrix[start:start + CHUNK_ROWS]
+        overlap = np.asarray((block @ target_t).todense(), dtype=np.float64)
+        query_share = _share(overlap, query_counts[start:start + CHUNK_ROWS, None])
+        target_share = _share(overlap, target_counts[None, :])
+        # Coverage is measured against the job's skills, relevance against the resume's
+        coverage, relevance = (target_share, query_share) if queries_are_resumes else (query_share, target_share)
+        primary, secondary = (coverage, relevance) if by == 'coverage' else (relevance, coverage)
+        for row in range(overlap.shape[0]):
+            results.append([
+                Match(int(i), float(coverage[row, i]), float(relevance[row, i]), int(overlap[row, i]))
+                for i in _top_k(primary[row], secondary[row], k)
+            ])
+    return results
+
+def _check_ranking(k, by):
+    if k < 1:
+        raise ValueError("k must be at least 1.")
+    if by not in RANK_BY:
+        raise ValueError(f"Unsupported ranking: {by}")
+
+class JobRanker:
+    """
+    Job postings encoded once as a sparse skill matrix, ready to rank any number of resumes
+    against all of them with one sparse matrix product per batch of resumes.
+    """
+    def __init__(self, job_skill_sets):
+        self.columns = _new_columns()
+        self.matrix, self.counts = encode_skill_sets(job_skill_sets, self.columns)
+
+    def __len__(self):
+        return self.matrix.shape[0]
+
+    def _encode_resumes(self, resume_skill_sets):
+        # Resume skills no job mentions cannot match, but still count towards relevance
+        return encode_skill_sets(resume_skill_sets, self.columns, grow=False)
+
+    def rank_jobs(self, resume_skill_sets, k=10, by='coverage'):
+        """Top-k jobs for each resume, best first, as lists of Match (index = job position)."""
+        _check_ranking(k, by)
+        resumes, resume_counts = self._encode_resumes(resume_skill_sets)
+        return _rank(resumes, resume_counts, self.matrix, self.counts, k, by, True)
+
+    def rank_resumes(self, resume_skill_sets, k=10, by='coverage'):
+        """Top-k resumes for each job, best first, as lists of Match (index = resume position)."""
+        _check_ranking(k, by)
+        resumes, resume_counts = self._encode_resumes(resume_skill_sets)
+        return _rank(self.matrix, self.counts, resumes, resume_counts, k, by, False)
+
+def rank_matches(resume_skill_sets, job_skill_sets, k=10, per='resume', by='coverage'):
+    """
+    Score every resume against every job and return the top-k matches per resume
+    (per='resume') or per job (per='job'), ordered by coverage or relevance.
+    """
+    ranker = JobRanker(job_skill_sets)
+    if per == 'resume':
+        return ranker.rank_jobs(resume_skill_sets, k, by)
+    if per == 'job':
+        return ranker.rank_resumes(resume_skill_sets, k, by)
+    raise ValueError(f"Unsupported ranking target: {per}")
+
+def _load_skills(paths, mode, workers):
+    from batch_extractor import extract_skills_batch
+    return [result[1] for result in extract_skills_batch(paths, mode=mode, workers=workers)]
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Rank job descriptions against resumes by skill overlap.")
+    parser.add_argument('--resumes', nargs='+', required=True, help="Resume files (PDF or DOCX)")
+    parser.add_argument('--jobs', nargs='+', required=True, help="Job description files (PDF, DOCX or TXT)")
+    parser.add_argument('-k', '--top', type=int, default=10, help="Matches to report per resume or job")
+    parser.add_argument('--per', choices=('resume', 'job'), default='resume', help="Rank jobs per resume, or resumes per job")
+    parser.add_argument('--by', choices=RANK_BY, default='coverage', help="Primary ranking score")
+    parser.add_argument('--workers', type=int, default=None, help="Parsing processes (default: CPU count)")
+    parser.add_argument('--json', action='store_true', help="Print results as JSON")
+    args = parser.parse_args(argv)
+
+    resume_skills = _load_skills(args.resumes, 'resume', args.workers)
+    job_skills = _load_skills(args.jobs, 'job', args.workers)
+    results = rank_matches(resume_skills, job_skills, k=args.top, per=args.per, by=args.by)
+    queries, targets = (args.resumes, args.jobs) if args.per == 'resume' else (args.jobs, args.resumes)
+
+    if args.json:
+        print(json.dumps({
+            query: [dict(m._asdict(), path=targets[m.index]) for m in matches]
+            for query, matches in zip(queries, results)
+        }, indent=2))
+        return
+    for query, matches in zip(queries, results):
+        print(query)
+        for m in matches:
+            print(f"  {m.coverage:6.1%} coverage  {m.relevance:6.1%} relevance  {m.matched:3d} shared  {targets[m.index]}")
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,257 @@
+import argparse
+import hashlib
+import os
+import sqlite3
+import threading
+import time
+from collections import Counter, namedtuple
+from skill_taxonomy import TAXONOMY
+from utils import CACHE_DIR, extract_job_title, extract_skills_from_text, keyword_terms
+
+Posting = namedtuple('Posting', ['id', 'title', 'source', 'skills', 'added'])
+# A posting ranked for a resume; coverage and relevance are defined as in job_ranker.Match
+PostingMatch = namedtuple('PostingMatch', ['id', 'title', 'coverage', 'relevance', 'matched'])
+
+DEFAULT_STORE_PATH = os.path.join(CACHE_DIR, 'job_store.sqlite')
+
+class JobStore:
+    """
+    Local store of job postings with an inverted index from skill to postings, in a
+    SQLite file. Each posting keeps its text and extracted skills; skills get store-local
+    integer IDs, and posting_skills holds the (skill_id, posting_id) pairs indexed by skill,
+    so adding or removing a posting only touches that posting's rows. The terms table
+    counts the postings containing each keyword term, the document frequencies behind
+    keyword_engine's IDF, and is kept up to date the same way.
+    Posting IDs are never reused after a removal.
+    Identical texts are stored once.
+    """
+    def __init__(self, path=DEFAULT_STORE_PATH):
+        self.path = path
+        os.makedirs(os.path.dirname(path) or '.', exist_ok=True)
+        self._lock = threading.Lock()
+        # Bumped on every change made through this connection; see changes()
+        self._changes = 0
+        self._subscribers = []
+        self._conn = sqlite3.connect(path, timeout=30, check_same_thread=False, isolation_level=None)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA foreign_keys=ON")
+        self._conn.executescript(
+            "CREATE TABLE IF NOT EXISTS postings ("
+            "id INTEGER PRIMARY KEY AUTOINCREMENT, digest TEXT UNIQUE NOT NULL, title TEXT, source TEXT, "
+            "text TEXT NOT NULL, skill_count INTEGER NOT NULL, added REAL NOT NULL);"
+            "CREATE TABLE IF NOT EXISTS skills (id INTEGER PRIMARY KEY, name TEXT UNIQUE NOT NULL);"
+            "CREATE TABLE IF NOT EXISTS posting_skills ("
+            "skill_id INTEGER NOT NULL REFERENCES skills (id), "
+            "posting_id INTEGER NOT NULL REFERENCES postings (id) ON DELETE CASCADE, "
+            "PRIMARY KEY (skill_id, posting_id)) WITHOUT ROWID;"
+            "CREATE INDEX IF NOT EXISTS posting_skills_posting ON posting_skills (posting_id);"
+            "CREATE TABLE IF NOT EXISTS terms (term TEXT PRIMARY KEY, postings INTEGER NOT NULL) WITHOUT ROWID;"
+        )
+        self._conn.execute("BEGIN IMMEDIATE")
+        try:
+            # Stores created before the terms table get it filled in once
+            if (self._conn.execute("SELECT COUNT(*) FROM terms").fetchone()[0] == 0
+                    and self._conn.execute("SELECT COUNT(*) FROM postings").fetchone()[0] > 0):
+                counts = Counter()
+                for (text,) in self._conn.execute("SELECT text FROM postings"):
+                    counts.update(set(keyword_terms(text)))
+                self._conn.executemany("INSERT INTO terms (term, postings) VALUES (?, ?)", counts.items())
+            self._conn.execute("COMMIT")
+        except Exception:
+            self._conn.execute("ROLLBACK")
+            raise
+
+    def __len__(self):
+        with self._lock:
+            return self._conn.execute("SELECT COUNT(*) FROM postings").fetchone()[0]
+
+    def add_text(self, text, title=None, source=None, skills=None):
+        """
+        Store a job description and index its skills. Returns the posting ID; a text that
+        is already stored returns the existing posting's ID.
+        """
+        digest = hashlib.sha256(text.encode('utf-8')).hexdigest()
+        if skills is None:
+            skills = extract_skills_from_text(text)
+        if title is None:
+            title = extract_job_title(text)
+        names = sorted(set(TAXONOMY.canonical(s) for s in skills))
+        terms = sorted(set(keyword_terms(text)))
+        with self._lock:
+            row = self._conn.execute("SELECT id FROM postings WHERE digest = ?", (digest,)).fetchone()
+            if row is not None:
+                return row[0]
+            self._conn.execute("BEGIN IMMEDIATE")
+            try:
+                posting_id = self._conn.execute(
+                    "INSERT INTO postings (digest, title, source, text, skill_count, added) VALUES (?, ?, ?, ?, ?, ?)",
+                    (digest, title, source, text, len(names), time.time()),
+                ).lastrowid
+                self._conn.executemany("INSERT OR IGNORE INTO skills (name) VALUES (?)", [(n,) for n in names])
+                self._conn.executemany(
+                    "INSERT INTO posting_skills (skill_id, posting_id) SELECT id, ? FROM skills WHERE name = ?",
+                    [(posting_id, n) for n in names],
+                )
+                self._conn.executemany(
+                    "INSERT INTO terms (term, postings) VALUES (?, 1) "
+                    "ON CONFLICT (term) DO UPDATE SET postings = postings + 1",
+                    [(t,) for t in terms],
+                )
+                self._conn.execute("COMMIT")
+            except Exception:
+                self._conn.execute("ROLLBACK")
+                raise
+            self._changes += 1
+            self._notify('add', text)
+            return posting_id
+
+    def add_file(self, file_path, title=None):
+        """Parse a PDF, DOCX or TXT job description with job_parser and store it."""
+        from job_parser import parse_job_description
+        text, skills = parse_job_description(file_path)
+        return self.add_text(text, title=title, source=file_path, skills=skills)
+
+    def remove(self, posting_id):
+        """Delete a posting and its index entries. Returns False if it was not stored."""
+        with self._lock:
+            row = self._conn.execute("SELECT text FROM postings WHERE id = ?", (posting_id,)).fetchone()
+            if row is None:
+                return False
+            self._conn.execute("BEGIN IMMEDIATE")
+            try:
+                cursor = self._conn.execute("DELETE FROM postings WHERE id = ?", (posting_id,))
+                if cursor.rowcount > 0:
+                    terms = [(t,) for t in set(keyword_terms(row[0]))]
+                    self._conn.executemany("UPDATE terms SET postings = postings - 1 WHERE term = ?", terms)
+                    self._conn.executemany("DELETE FROM terms WHERE term = ? AND postings <= 0", terms)
+                self._conn.execute("COMMIT")
+            except Exception:
+                self._conn.execute("ROLLBACK")
+                raise
+            if cursor.rowcount > 0:
+                self._changes += 1
+                self._notify('remove', row[0])
+            return cursor.rowcount > 0
+
+    def get(self, posting_id):
+        """The stored Posting, or None."""
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT id, title, source, added FROM postings WHERE id = ?", (posting_id,)
+            ).fetchone()
+            if row is None:
+                return None
+            skills = [name for (name,) in self._conn.execute(
+                "SELECT s.name FROM posting_skills ps JOIN skills s ON s.id = ps.skill_id "
+                "WHERE ps.posting_id = ? ORDER BY s.name", (posting_id,)
+            )]
+        return Posting(row[0], row[1], row[2], skills, row[3])
+
+    def text(self, posting_id):
+        with self._lock:
+            row = self._conn.execute("SELECT text FROM postings WHERE id = ?", (posting_id,)).fetchone()
+        return row[0] if row is not None else None
+
+    def iter_texts(self):
+        """(posting_id, text) for every stored posting, oldest first."""
+        with self._lock:
+            rows = self._conn.execute("SELECT id, text FROM postings ORDER BY id").fetchall()
+        return iter(rows)
+
+    def term_statistics(self):
+        """(number of postings, {term: number of postings containing it}) over the whole store."""
+        with self._lock:
+            documents = self._conn.execute("SELECT COUNT(*) FROM postings").fetchone()[0]
+            frequencies = dict(self._conn.execute("SELECT term, postings FROM terms"))
+        return documents, frequencies
+
+    def subscribe(self, callback):
+        """
+        Call callback(event, text, change) after every posting added ('add') or removed
+        ('remove') through this store, where `change` is the first element of changes()
+        right after it. Callbacks run in order, under the store's lock, so they must not
+        call back into the store.
+        """
+        with self._lock:
+            self._subscribers.append(callback)
+
+    def _notify(self, event, text):
+        for callback in self._subscribers:
+            callback(event, text, self._changes)
+
+    def changes(self):
+        """
+        A token that differs whenever postings were added or removed, through this store or
+        another connection to the same file, so derived statistics know when to reload.
+        """
+        with self._lock:
+            return self._changes, self._conn.execute("PRAGMA data_version").fetchone()[0]
+
+    def postings_needing(self, skill):
+        """IDs of the postings that ask for a skill (or one of its aliases), oldest first."""
+        with self._lock:
+            return [posting_id for (posting_id,) in self._conn.execute(
+                "SELECT ps.posting_id FROM skills s JOIN posting_skills ps ON ps.skill_id = s.id "
+                "WHERE s.name = ? ORDER BY ps.posting_id", (TAXONOMY.canonical(skill),)
+            )]
+
+    def best_postings(self, resume_skills, k=10, by='coverage'):
+        """
+        Postings a resume covers best, as PostingMatch, best first. Only postings sharing at
+        least one skill with the resume are considered; they are found through the skill
+        index, so the cost grows with the matching postings rather than the whole store.
+        """
+        if by not in ('coverage', 'relevance'):
+            raise ValueError(f"Unsupported ranking: {by}")
+        names = sorted(set(TAXONOMY.canonical(s) for s in resume_skills))
+        if not names or k < 1:
+            return []
+        placeholders = ','.join('?' * len(names))
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT p.id, p.title, p.skill_count, COUNT(*) FROM skills s "
+                "JOIN posting_skills ps ON ps.skill_id = s.id JOIN postings p ON p.id = ps.posting_id "
+                f"WHERE s.name IN ({placeholders}) GROUP BY p.id", names
+            ).fetchall()
+        matches = [
+            PostingMatch(posting_id, title, matched / skill_count, matched / len(names), matched)
+            for posting_id, title, skill_count, matched in rows
+        ]
+        if by == 'coverage':
+            matches.sort(key=lambda m: (-m.coverage, -m.relevance, m.id))
+        else:
+            matches.sort(key=lambda m: (-m.relevance, -m.coverage, m.id))
+        return matches[:k]
+
+    def close(self):
+        with self._lock:
+            self._conn.close()
+
+_default_store = None
+_default_store_lock = threading.Lock()
+
+def get_job_store():
+    """Process-wide job store at SKILLSHIFT_CACHE_DIR/job_store.sqlite, opened on first use."""
+    global _default_store
+    with _default_store_lock:
+        if _default_store is None:
+            _default_store = JobStore()
+        return _default_store
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Add job descriptions to the SkillShift job store.")
+    parser.add_argument('files', nargs='*', help="Job description files (PDF, DOCX or TXT)")
+    parser.add_argument('--path', default=DEFAULT_STORE_PATH, help="Store file")
+    args = parser.parse_args(argv)
+
+    store = JobStore(args.path)
+    try:
+        for file_path in args.files:
+            print(f"{store.add_file(file_path):6d}  {file_path}")
+        documents, frequencies = store.term_statistics()
+        print(f"{documents} postings, {len(frequencies)} keyword terms in {args.path}")
+    finally:
+        store.close()
+
+if __name__ == '__main__':
+    main()
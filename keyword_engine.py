@@ -0,0 +1,196 @@
+import threading
+import numpy as np
+from scipy import sparse
+from utils import keyword_terms
+
+class KeywordEngine:
+    """
+    TF-IDF keywords for job descriptions, against the document frequencies of a corpus.
+    Frequencies are kept in a growable array, one column per term, so adding or removing
+    a document only touches its own terms. IDF is smoothed, idf = ln((1 + N) / (1 + df)) + 1,
+    so terms the corpus has never seen score highest and an empty corpus ranks by frequency.
+    Updates and scoring may come from different threads; they take turns on one lock.
+    """
+    def __init__(self, document_frequencies=None, documents=0):
+        self._lock = threading.Lock()
+        self.columns = {}
+        self.terms = []
+        self.documents = documents
+        self._df = np.zeros(1024, dtype=np.int64)
+        self._idf = None
+        if document_frequencies:
+            self._add_counts(document_frequencies.keys(), list(document_frequencies.values()))
+
+    @classmethod
+    def from_store(cls, store):
+        """Engine over the postings of a job_store.JobStore, from its stored term counts."""
+        documents, frequencies = store.term_statistics()
+        return cls(frequencies, documents)
+
+    def __len__(self):
+        return len(self.columns)
+
+    def _column_indices(self, terms, grow):
+        indices = []
+        for term in terms:
+            column = self.columns.get(term)
+            if column is None and grow:
+                column = self.columns[term] = len(self.terms)
+                self.terms.append(term)
+            indices.append(-1 if column is None else column)
+        if len(self.columns) > len(self._df):
+            grown = np.zeros(max(len(self.columns), 2 * len(self._df)), dtype=np.int64)
+            grown[:len(self._df)] = self._df
+            self._df = grown
+        return np.array(indices, dtype=np.int64)
+
+    def _add_counts(self, terms, counts):
+        self._df[self._column_indices(terms, grow=True)] += counts
+        self._idf = None
+
+    def add_document(self, text):
+        """Count a new document's terms into the document frequencies."""
+        terms = set(keyword_terms(text))
+        with self._lock:
+            self._add_counts(terms, 1)
+            self.documents += 1
+
+    def remove_document(self, text):
+        """Undo add_document for a document leaving the corpus."""
+        terms = set(keyword_terms(text))
+        with self._lock:
+            indices = self._column_indices(terms, grow=False)
+            indices = indices[indices >= 0]
+            self._df[indices] = np.maximum(self._df[indices] - 1, 0)
+            self.documents = max(self.documents - 1, 0)
+            self._idf = None
+
+    def idf(self):
+        """IDF per column, recomputed only after the frequencies change."""
+        if self._idf is None:
+            df = self._df[:len(self.columns)]
+            self._idf = np.log((1.0 + self.documents) / (1.0 + df)) + 1.0
+        return self._idf
+
+    def top_keywords_batch(self, texts, k=10):
+        """
+        Top-k keywords of each text, best first. All texts are scored in one sparse
+        term-count matrix: corpus terms keep their columns, and terms the corpus has not
+        seen get extra columns with the highest IDF. Ties keep the order of first use.
+        """
+        if k < 1:
+            raise ValueError("k must be at least 1.")
+        with self._lock:
+            return self._top_keywords(texts, k)
+
+    def _top_keywords(self, texts, k):
+        idf = self.idf()
+        unseen = {}
+        indices = []
+        indptr = [0]
+        for text in texts:
+            for term in keyword_terms(text):
+                column = self.columns.get(term)
+                if column is None:
+                    column = unseen.setdefault(term, len(self.columns) + len(unseen))
+                indices.append(column)
+            indptr.append(len(indices))
+        width = len(self.columns) + len(unseen)
+        counts = sparse.csr_matrix(
+            (np.ones(len(indices)), np.array(indices, dtype=np.int64), np.array(indptr, dtype=np.int64)),
+            shape=(len(indptr) - 1, width),
+        )
+        # Positions of each row's first occurrence, for stable tie-breaking
+        first_seen = []
+        for row in range(counts.shape[0]):
+            row_indices = counts.indices[counts.indptr[row]:counts.indptr[row + 1]]
+            _, first = np.unique(row_indices, return_index=True)
+            first_seen.append(first)
+        counts.sum_duplicates()
+        weights = np.concatenate([idf, np.full(len(unseen), np.log(1.0 + self.documents) + 1.0)])
+        scores = counts.data * weights[counts.indices]
+
+        names = self.terms + list(unseen)
+        results = []
+        for row in range(counts.shape[0]):
+            start, end = counts.indptr[row], counts.indptr[row + 1]
+            row_scores = scores[start:end]
+            if k < len(row_scores):
+                # Keep every entry tied with the k-th best so tie-breaking below stays exact
+                threshold = np.partition(row_scores, len(row_scores) - k)[len(row_scores) - k]
+                candidates = np.flatnonzero(row_scores >= threshold)
+            else:
+                candidates = np.arange(len(row_scores))
+            order = np.lexsort((first_seen[row][candidates], -row_scores[candidates]))
+            results.append([names[counts.indices[start + i]] for i in candidates[order[:k]]])
+        return results
+
+    def top_keywords(self, text, k=10):
+        """Top-k keywords of one text, best first."""
+        return self.top_keywords_batch([text], k)[0]
+
+_default_engine = None
+# Last store change applied to the engine, and the store's data_version when it was loaded
+_default_engine_change = None
+_default_engine_data_version = None
+_default_engine_lock = threading.Lock()
+_subscribed_store = None
+_subscribe_lock = threading.Lock()
+
+def _apply_store_change(event, text, change):
+    """JobStore subscriber: apply one added or removed posting to the process-wide engine."""
+    global _default_engine_change
+    with _default_engine_lock:
+        if _default_engine is None or change <= _default_engine_change:
+            # Not loaded yet, or already part of the loaded counts
+            return
+        if event == 'add':
+            _default_engine.add_document(text)
+        else:
+            _default_engine.remove_document(text)
+        _default_engine_change = change
+
+def _load(store):
+    """(engine, store change it reflects) from the store's term counts, retried if a posting lands mid-read."""
+    while True:
+        before = store.changes()[0]
+        engine = KeywordEngine.from_store(store)
+        if store.changes()[0] == before:
+            return engine, before
+
+def get_keyword_engine():
+    """
+    Process-wide engine over the job store (get_job_store). The term counts are loaded
+    once; postings added or removed through this process's store are then applied one
+    document at a time, and the counts are only reloaded after another process (another
+    connection to the store file) has changed it.
+    """
+    global _default_engine, _default_engine_change, _default_engine_data_version, _subscribed_store
+    from job_store import get_job_store
+    store = get_job_store()
+    # The store calls the subscriber under its own lock, so the store is never called
+    # while holding _default_engine_lock
+    with _subscribe_lock:
+        if _subscribed_store is not store:
+            store.subscribe(_apply_store_change)
+            _subscribed_store = store
+    with _default_engine_lock:
+        engine = _default_engine
+        loaded_version = _default_engine_data_version
+    data_version = store.changes()[1]
+    if engine is not None and data_version == loaded_version:
+        return engine
+    while True:
+        engine, change = _load(store)
+        with _default_engine_lock:
+            _default_engine, _default_engine_change, _default_engine_data_version = engine, change, data_version
+        # A posting that landed between loading and publishing went to the old engine; reload
+        current = store.changes()[0]
+        with _default_engine_lock:
+            if _default_engine_change >= current:
+                return _default_engine
+
+def keyword_corpus_version():
+    """Token that changes whenever the job store's postings change, for memoizing keyword results."""
+    from job_store import get_job_store
+    return get_job_store().changes()
@@ -0,0 +1,57 @@
+import hashlib
+import os
+import re
+import threading
+from cache_store import DiskCache
+from utils import CACHE_DIR
+
+def normalize_prompt(prompt):
+    """Collapse whitespace so prompts differing only in indentation or line breaks share an entry."""
+    return re.sub(r'\s+', ' ', prompt).strip()
+
+class LLMResponseCache:
+    """
+    Persistent cache of LLM replies in a local SQLite file, keyed by a hash of the model,
+    normalized prompt and max_tokens. Entries expire after ttl seconds and the least
+    recently used ones are evicted beyond max_entries.
+    """
+    def __init__(self, path=os.path.join(CACHE_DIR, 'llm_cache.sqlite'), ttl=24 * 3600, max_entries=5000):
+        self.disk = DiskCache(path, max_entries=max_entries, ttl=ttl)
+        self._lock = threading.Lock()
+        self._stats = {'hits': 0, 'misses': 0}
+
+    @staticmethod
+    def make_key(model, prompt, max_tokens):
+        payload = f"{model}\0{max_tokens}\0{normalize_prompt(prompt)}"
+        return hashlib.sha256(payload.encode('utf-8')).hexdigest()
+
+    def get(self, model, prompt, max_tokens):
+        blob = self.disk.get(self.make_key(model, prompt, max_tokens))
+        with self._lock:
+            self._stats['hits' if blob is not None else 'misses'] += 1
+        return bytes(blob).decode('utf-8') if blob is not None else None
+
+    def put(self, model, prompt, max_tokens, reply):
+        self.disk.put(self.make_key(model, prompt, max_tokens), reply.encode('utf-8'))
+
+    def stats(self):
+        """Hit/miss counters for this process, plus hit_rate."""
+        with self._lock:
+            stats = dict(self._stats)
+        lookups = stats['hits'] + stats['misses']
+        stats['hit_rate'] = stats['hits'] / lookups if lookups else 0.0
+        return stats
+
+_default_cache = None
+_default_cache_lock = threading.Lock()
+
+def get_llm_cache():
+    """Process-wide LLM response cache, or None when disabled with SKILLSHIFT_LLM_CACHE=0."""
+    global _default_cache
+    if os.getenv('SKILLSHIFT_LLM_CACHE', '1') == '0':
+        return None
+    with _default_cache_lock:
+        if _default_cache is None:
+            ttl_hours = float(os.getenv('SKILLSHIFT_LLM_CACHE_TTL_HOURS', '24'))
+            _default_cache = LLMResponseCache(ttl=ttl_hours * 3600)
+        return _default_cache
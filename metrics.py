@@ -0,0 +1,180 @@
+import contextvars
+import functools
+import json
+import os
+import threading
+import time
+
+# Off unless SKILLSHIFT_METRICS=1 or enable() is called. When off, spans are still recorded
+# inside a collect() block, for that context only; everywhere else span() returns a shared
+# no-op context manager and @timed functions call straight through after two cheap checks.
+_enabled = os.getenv('SKILLSHIFT_METRICS', '0') == '1'
+
+# Upper bounds (seconds) of the Prometheus histogram buckets
+BUCKETS = (0.001, 0.005, 0.01, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0)
+
+_lock = threading.Lock()
+_stages = {}
+# Spans of the current collect() block, e.g. one Streamlit script run
+_collector = contextvars.ContextVar('skillshift_span_collector', default=None)
+_log_file = None
+
+def enable(flag=True):
+    global _enabled
+    _enabled = flag
+
+def is_enabled():
+    return _enabled
+
+class _NoSpan:
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+_NO_SPAN = _NoSpan()
+
+class _Span:
+    __slots__ = ('name', 'start')
+
+    def __init__(self, name):
+        self.name = name
+
+    def __enter__(self):
+        self.start = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc):
+        record(self.name, time.perf_counter() - self.start)
+        return False
+
+def span(name):
+    """Context manager timing the enclosed block as stage `name`."""
+    if not _enabled and _collector.get() is None:
+        return _NO_SPAN
+    return _Span(name)
+
+def timed(name):
+    """Decorator timing every call of a function as stage `name`."""
+    def decorate(function):
+        @functools.wraps(function)
+        def wrapper(*args, **kwargs):
+            if not _enabled and _collector.get() is None:
+                return function(*args, **kwargs)
+            start = time.perf_counter()
+            try:
+                return function(*args, **kwargs)
+            finally:
+                record(name, time.perf_counter() - start)
+        return wrapper
+    return decorate
+
+def record(name, seconds):
+    """
+    Add one span to the active collector and, when metrics are enabled, to the process-wide
+    stage statistics and the span log.
+    """
+    spans = _collector.get()
+    if spans is not None:
+        spans.append((name, seconds))
+    if not _enabled:
+        return
+    with _lock:
+        stage = _stages.get(name)
+        if stage is None:
+            stage = _stages[name] = {'count': 0, 'sum': 0.0, 'max': 0.0, 'buckets': [0] * len(BUCKETS)}
+        stage['count'] += 1
+        stage['sum'] += seconds
+        stage['max'] = max(stage['max'], seconds)
+        for i, bound in enumerate(BUCKETS):
+            if seconds <= bound:
+                stage['buckets'][i] += 1
+                break
+        if _log_file is not None:
+            _log_file.write(json.dumps({'ts': time.time(), 'stage': name, 'seconds': seconds}) + '\n')
+
+class SpanCollector:
+    """
+    Collects the spans recorded in this context (thread or task) into a list, e.g. for one
+    Streamlit run or one service request, whether or not metrics are enabled. Use as
+    `with collect() as spans:`, or call start() and stop() around a script. Work handed to
+    other threads is included when it runs in a copy of this context (contextvars.copy_context).
+    """
+    def __init__(self):
+        self.spans = []
+        self._token = None
+
+    def start(self):
+        self._token = _collector.set(self.spans)
+        return self.spans
+
+    def stop(self):
+        if self._token is not None:
+            _collector.reset(self._token)
+            self._token = None
+        return self.spans
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, *exc):
+        self.stop()
+        return False
+
+def collect():
+    return SpanCollector()
+
+def breakdown(spans):
+    """Per-stage count, total and max seconds for a list of (stage, seconds) spans, slowest total first."""
+    stages = {}
+    for name, seconds in spans:
+        count, total, longest = stages.get(name, (0, 0.0, 0.0))
+        stages[name] = (count + 1, total + seconds, max(longest, seconds))
+    return [
+        {'stage': name, 'count': count, 'total_s': total, 'max_s': longest}
+        for name, (count, total, longest) in sorted(stages.items(), key=lambda item: -item[1][1])
+    ]
+
+def snapshot():
+    """Copy of the process-wide statistics per stage: count, sum, max and bucket counts."""
+    with _lock:
+        return {name: dict(stage, buckets=list(stage['buckets'])) for name, stage in _stages.items()}
+
+def reset():
+    with _lock:
+        _stages.clear()
+
+def prometheus_text():
+    """Stage statistics in the Prometheus text exposition format, as one histogram."""
+    lines = [
+        '# HELP skillshift_stage_seconds Time spent in each analysis stage.',
+        '# TYPE skillshift_stage_seconds histogram',
+    ]
+    for name, stage in sorted(snapshot().items()):
+        cumulative = 0
+        for bound, count in zip(BUCKETS, stage['buckets']):
+            cumulative += count
+            lines.append(f'skillshift_stage_seconds_bucket{{stage="{name}",le="{bound}"}} {cumulative}')
+        lines.append(f'skillshift_stage_seconds_bucket{{stage="{name}",le="+Inf"}} {stage["count"]}')
+        lines.append(f'skillshift_stage_seconds_sum{{stage="{name}"}} {stage["sum"]}')
+        lines.append(f'skillshift_stage_seconds_count{{stage="{name}"}} {stage["count"]}')
+    return '\n'.join(lines) + '\n'
+
+def json_lines():
+    """Stage statistics as JSON lines, one stage per line."""
+    return ''.join(
+        json.dumps({'stage': name, 'count': stage['count'], 'sum_s': stage['sum'], 'max_s': stage['max']}) + '\n'
+        for name, stage in sorted(snapshot().items())
+    )
+
+def log_spans(path):
+    """Also append every span as a JSON line to `path` (None stops logging)."""
+    global _log_file
+    with _lock:
+        if _log_file is not None:
+            _log_file.close()
+        _log_file = open(path, 'a', buffering=1, encoding='utf-8') if path else None
+
+if _enabled and os.getenv('SKILLSHIFT_METRICS_LOG'):
+    log_spans(os.getenv('SKILLSHIFT_METRICS_LOG'))
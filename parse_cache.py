@@ -0,0 +1,85 @@
+import hashlib
+import json
+import os
+import threading
+from cache_store import DiskCache, MemoryLRU
+from utils import CACHE_DIR, SKILLS_VERSION
+
+class ParseCache:
+    """
+    Two-tier cache for parser results, keyed by a hash of the document bytes plus the
+    parser and skill vocabulary versions. Results are the tuples returned by
+    parse_resume / parse_job_description.
+    """
+    def __init__(self, path=os.path.join(CACHE_DIR, 'parse_cache.sqlite'), max_bytes=64 * 1024 * 1024, memory_entries=128):
+        self.memory = MemoryLRU(memory_entries)
+        self.disk = DiskCache(path, max_bytes) if path else None
+        self._lock = threading.Lock()
+        self._stats = {'memory_hits': 0, 'disk_hits': 0, 'misses': 0}
+
+    @staticmethod
+    def make_key(kind, data, parser_version):
+        digest = hashlib.sha256()
+        digest.update(f"{kind}\0{parser_version}\0{SKILLS_VERSION}\0".encode('utf-8'))
+        digest.update(data)
+        return digest.hexdigest()
+
+    def _count(self, name):
+        with self._lock:
+            self._stats[name] += 1
+
+    def get(self, key):
+        result = self.memory.get(key)
+        if result is not None:
+            self._count('memory_hits')
+            return result
+        if self.disk is not None:
+            blob = self.disk.get(key)
+            if blob is not None:
+                result = tuple(json.loads(bytes(blob).decode('utf-8')))
+                self.memory.put(key, result)
+                self._count('disk_hits')
+                return result
+        self._count('misses')
+        return None
+
+    def put(self, key, result):
+        result = tuple(result)
+        self.memory.put(key, result)
+        if self.disk is not None:
+            self.disk.put(key, json.dumps(result).encode('utf-8'))
+
+    def stats(self):
+        """Hit/miss counters for this process: memory_hits, disk_hits, misses, hits and hit_rate."""
+        with self._lock:
+            stats = dict(self._stats)
+        stats['hits'] = stats['memory_hits'] + stats['disk_hits']
+        lookups = stats['hits'] + stats['misses']
+        stats['hit_rate'] = stats['hits'] / lookups if lookups else 0.0
+        return stats
+
+_default_cache = None
+_default_cache_lock = threading.Lock()
+
+def get_parse_cache():
+    """Process-wide parse cache, or None when disabled with SKILLSHIFT_PARSE_CACHE=0."""
+    global _default_cache
+    if os.getenv('SKILLSHIFT_PARSE_CACHE', '1') == '0':
+        return None
+    with _default_cache_lock:
+        if _default_cache is None:
+            max_mb = int(os.getenv('SKILLSHIFT_PARSE_CACHE_MB', '64'))
+            _default_cache = ParseCache(max_bytes=max_mb * 1024 * 1024)
+        return _default_cache
+
+def cached_parse(kind, data, parser_version, parse):
+    """Return parse(data), served from the parse cache when the same bytes were parsed before."""
+    cache = get_parse_cache()
+    if cache is None:
+        return parse(data)
+    key = cache.make_key(kind, data, parser_version)
+    result = cache.get(key)
+    if result is None:
+        result = tuple(parse(data))
+        cache.put(key, result)
+    return result
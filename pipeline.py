@@ -0,0 +1,91 @@
+import hashlib
+import pickle
+from collections import namedtuple
+from metrics import span
+from resume_parser import parse_resume
+from skill_comparator import compare_skills
+from skill_taxonomy import TAXONOMY, iter_ids
+from recommender import generate_recommendations
+from utils import extract_skills_from_text
+
+def parse_resume_stage(resume_bytes):
+    """Parse an uploaded resume straight from memory; its format is detected from the content."""
+    text, skills, raw_section = parse_resume(resume_bytes)
+    return {'resume_text': text, 'resume_skills': skills, 'raw_skills_section': raw_section}
+
+def jd_skills_stage(jd_text):
+    return {'jd_skills': extract_skills_from_text(jd_text)}
+
+def keywords_stage(jd_text, keyword_corpus):
+    """
+    TF-IDF keywords against the stored job descriptions, so words every posting uses rank low.
+    keyword_corpus is keyword_engine.keyword_corpus_version(): the keywords depend on the
+    stored postings, so they are recomputed when the store changes.
+    """
+    from keyword_engine import get_keyword_engine
+    engine = get_keyword_engine()
+    return {'top_keywords': engine.top_keywords(jd_text, 10), 'keyword_corpus_size': engine.documents}
+
+def comparison_stage(resume_skills, jd_skills):
+    return {'comparison': compare_skills(resume_skills, jd_skills)}
+
+def radar_stage(resume_skills, jd_skills):
+    resume_bits, resume_other = TAXONOMY.to_bits(resume_skills)
+    jd_bits, jd_other = TAXONOMY.to_bits(jd_skills)
+    # label -> (in resume, in JD); taxonomy skills are looked up by bit, the rest by set membership
+    axes = {}
+    for skill_id in iter_ids(resume_bits | jd_bits):
+        axes[TAXONOMY.skills[skill_id].title()] = ((resume_bits >> skill_id) & 1, (jd_bits >> skill_id) & 1)
+    for skill in resume_other | jd_other:
+        axes[skill.title()] = (int(skill in resume_other), int(skill in jd_other))
+    labels = sorted(axes)
+    return {
+        'radar_labels': labels,
+        'resume_vector': [axes[label][0] for label in labels],
+        'jd_vector': [axes[label][1] for label in labels],
+    }
+
+def recommendations_stage(comparison, jd_skills):
+    return {'recs_and_path': generate_recommendations(comparison['missing'], jd_skills)}
+
+def llm_stage(resume_text, jd_text, comparison, target_role):
+    """Resume feedback and role advice, requested concurrently."""
+    from recommender import generate_llm_outputs
+    outputs = generate_llm_outputs(resume_text, jd_text, comparison['missing'], target_role)
+    return {'feedback': outputs['feedback'], 'advice': outputs['advice']}
+
+Stage = namedtuple('Stage', ['function', 'inputs'])
+
+# Each stage declares the named values it reads; its outputs are the keys of the dict it returns.
+# A stage is only recomputed when one of its inputs changes.
+STAGES = {
+    'resume': Stage(parse_resume_stage, ('resume_bytes',)),
+    'jd_skills': Stage(jd_skills_stage, ('jd_text',)),
+    'keywords': Stage(keywords_stage, ('jd_text', 'keyword_corpus')),
+    'comparison': Stage(comparison_stage, ('resume_skills', 'jd_skills')),
+    'radar': Stage(radar_stage, ('resume_skills', 'jd_skills')),
+    'recommendations': Stage(recommendations_stage, ('comparison', 'jd_skills')),
+    'llm': Stage(llm_stage, ('resume_text', 'jd_text', 'comparison', 'target_role')),
+}
+
+def _fingerprint(args):
+    return hashlib.sha256(pickle.dumps(args, protocol=4)).hexdigest()
+
+def run_stage(name, values, memo):
+    """
+    Run stage `name` with inputs taken from `values` and merge its outputs into `values`.
+    `memo` (e.g. Streamlit session state) keeps the last inputs fingerprint and outputs per
+    stage, so an unchanged stage returns its previous outputs without recomputing.
+    """
+    stage = STAGES[name]
+    args = tuple(values[key] for key in stage.inputs)
+    fingerprint = _fingerprint(args)
+    cached = memo.get(name)
+    if cached is not None and cached[0] == fingerprint:
+        outputs = cached[1]
+    else:
+        with span('pipeline.' + name):
+            outputs = stage.function(*args)
+        memo[name] = (fingerprint, outputs)
+    values.update(outputs)
+    return outputs
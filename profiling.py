@@ -0,0 +1,172 @@
+import cProfile
+import os
+import re
+import sys
+import threading
+import time
+from collections import Counter
+from utils import CACHE_DIR
+
+# Profiles are written here, oldest deleted first once the directory exceeds PROFILE_MAX_MB
+PROFILE_DIR = os.getenv('SKILLSHIFT_PROFILE_DIR', os.path.join(CACHE_DIR, 'profiles'))
+PROFILE_MAX_MB = float(os.getenv('SKILLSHIFT_PROFILE_MB', '100'))
+# Seconds between stack samples for the collapsed-stack file
+SAMPLE_INTERVAL = 0.005
+
+# Only one profile runs at a time per process: cProfile hooks a single thread, and a
+# second profiler would silently replace the first one's hook
+_active = threading.Lock()
+_sequence = 0
+
+def requested(flag=None):
+    """
+    Whether to profile this run: SKILLSHIFT_PROFILE=1 profiles every run, and an explicit
+    flag from a caller (query parameter, request field) is only honoured when the operator
+    allowed on-demand profiling with SKILLSHIFT_PROFILING=1.
+    """
+    if os.getenv('SKILLSHIFT_PROFILE', '0') == '1':
+        return True
+    return (os.getenv('SKILLSHIFT_PROFILING', '0') == '1'
+            and flag is not None and str(flag).lower() in ('1', 'true', 'yes'))
+
+class _NoProfile:
+    paths = None
+
+    def start(self):
+        return self
+
+    def stop(self):
+        return None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+_NO_PROFILE = _NoProfile()
+
+def _frame_name(code):
+    return f"{code.co_name} ({os.path.basename(code.co_filename)}:{code.co_firstlineno})"
+
+class _Sampler(threading.Thread):
+    """Samples the call stack of one thread every `interval` seconds into collapsed-stack counts."""
+    def __init__(self, thread_id, interval):
+        super().__init__(name='skillshift-profile-sampler', daemon=True)
+        self.thread_id = thread_id
+        self.interval = interval
+        self.stacks = Counter()
+        self._stop_event = threading.Event()
+
+    def run(self):
+        while not self._stop_event.wait(self.interval):
+            frame = sys._current_frames().get(self.thread_id)
+            names = []
+            while frame is not None:
+                names.append(_frame_name(frame.f_code))
+                frame = frame.f_back
+            if names:
+                self.stacks[';'.join(reversed(names))] += 1
+
+    def stop(self):
+        self._stop_event.set()
+        self.join()
+
+class Profile:
+    """
+    Profiles the code between start() and stop() (or a with block) on the current thread.
+    stop() writes <name>.pstats (cProfile, for pstats/snakeviz) and <name>.collapsed
+    (sampled stacks, one "frame;frame;frame count" line each, for flamegraph.pl or
+    speedscope) to `directory`, prunes the oldest profiles beyond max_mb, and returns
+    the two paths. While another profile is running in this process it records nothing
+    and stop() returns None.
+    """
+    def __init__(self, label, directory=None, max_mb=None, interval=SAMPLE_INTERVAL):
+        self.label = re.sub(r'[^\w.-]+', '_', label)
+        self.directory = directory or PROFILE_DIR
+        self.max_bytes = (PROFILE_MAX_MB if max_mb is None else max_mb) * 1024 * 1024
+        self.interval = interval
+        self.paths = None
+        self._profiler = None
+        self._sampler = None
+
+    def start(self):
+        if self._profiler is not None or not _active.acquire(blocking=False):
+            return self
+        self._profiler = cProfile.Profile()
+        self._sampler = _Sampler(threading.get_ident(), self.interval)
+        self._sampler.start()
+        self._profiler.enable()
+        return self
+
+    def stop(self):
+        if self._profiler is None:
+            return self.paths
+        self._profiler.disable()
+        self._sampler.stop()
+        try:
+            self.paths = self._write()
+        finally:
+            self._profiler = None
+            _active.release()
+        return self.paths
+
+    def _write(self):
+        global _sequence
+        os.makedirs(self.directory, exist_ok=True)
+        _sequence += 1
+        base = os.path.join(self.directory, f"{time.strftime('%Y%m%d-%H%M%S')}-{os.getpid()}-{_sequence}-{self.label}")
+        self._profiler.dump_stats(base + '.pstats')
+        with open(base + '.collapsed', 'w', encoding='utf-8') as f:
+            for stack, count in self._sampler.stacks.most_common():
+                f.write(f"{stack} {count}\n")
+        prune(self.directory, self.max_bytes, keep=base)
+        return base + '.pstats', base + '.collapsed'
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, *exc):
+        self.stop()
+        return False
+
+def profile(label, enabled=None, directory=None):
+    """
+    A Profile for one run when profiling is requested (see requested()), otherwise a shared
+    no-op with the same start()/stop() interface.
+    """
+    if not requested(enabled):
+        return _NO_PROFILE
+    return Profile(label, directory)
+
+def prune(directory, max_bytes, keep=None):
+    """
+    Delete the oldest profiles (.pstats and .collapsed pairs) until the directory holds at
+    most max_bytes. The profile with base path `keep` is never deleted.
+    """
+    profiles = {}
+    for name in os.listdir(directory):
+        base, extension = os.path.splitext(name)
+        if extension not in ('.pstats', '.collapsed'):
+            continue
+        path = os.path.join(directory, name)
+        try:
+            stat = os.stat(path)
+        except OSError:
+            continue
+        entry = profiles.setdefault(os.path.join(directory, base), [0.0, 0, []])
+        entry[0] = max(entry[0], stat.st_mtime)
+        entry[1] += stat.st_size
+        entry[2].append(path)
+    total = sum(size for _, size, _ in profiles.values())
+    for base, (_, size, paths) in sorted(profiles.items(), key=lambda item: item[1][0]):
+        if total <= max_bytes:
+            break
+        if base == keep:
+            continue
+        for path in paths:
+            try:
+                os.remove(path)
+            except OSError:
+                pass
+        total -= size
@@ -1,7 +1,14 @@
+import asyncio
+import contextvars
+import functools
+import json
 import os
-import requests
-from bs4 import BeautifulSoup
+import threading
+from concurrent.futures import ThreadPoolExecutor, wait
 import re
+from collections import namedtuple
+from metrics import timed
+from skill_taxonomy import TAXONOMY
 
 def search_top_courses(skill):
     """
@@ -80,16 +87,41 @@ def search_top_courses(skill):
         {'name': f'{skill.title()} Learning Path (edX)', 'url': f'https://www.edx.org/search?q={skill.replace(" ", "+")}', 'platform': 'edX', 'rating': '4.5+'}
     ]
 
+SkillGroup = namedtuple('SkillGroup', ['keywords', 'mask'])
+
+def _skill_group(keywords):
+    """A skill group: every taxonomy skill containing one of the keywords, precomputed as a bitmask."""
+    return SkillGroup(tuple(keywords), TAXONOMY.mask_where(lambda name: any(k in name for k in keywords)))
+
+TECH_GROUP = _skill_group(['python', 'sql', 'aws', 'docker', 'git', 'machine learning', 'data', 'pandas', 'tensorflow', 'pytorch', 'scikit-learn'])
+PROJECT_TECH_GROUP = _skill_group(['python', 'sql', 'aws', 'docker', 'git', 'machine learning', 'data', 'pandas', 'tensorflow', 'pytorch'])
+ANALYSIS_GROUP = _skill_group(['excel', 'tableau', 'power bi', 'statistical analysis', 'a/b testing'])
+CLOUD_GROUP = _skill_group(['aws', 'azure', 'gcp', 'docker', 'kubernetes'])
+SOFT_GROUP = _skill_group(['communication', 'leadership', 'teamwork', 'project management'])
+
+def _skills_in_group(skills, group):
+    """Skills belonging to a group, in input order. Skills outside the taxonomy are matched by keyword."""
+    selected = []
+    for skill in skills:
+        skill_id = TAXONOMY.id_of(skill)
+        if skill_id is not None:
+            if (group.mask >> skill_id) & 1:
+                selected.append(skill)
+        elif any(k in skill.lower() for k in group.keywords):
+            selected.append(skill)
+    return selected
+
+@timed('recommender.recommendations')
 def generate_recommendations(missing_skills, jd_skills=None):
     """
     Provide general platform recommendations for skill categories instead of specific courses for each skill.
     Also generate a dynamic learning path as a step-by-step sequence.
     """
     # Categorize skills
-    tech_skills = [s for s in missing_skills if any(tech in s.lower() for tech in ['python', 'sql', 'aws', 'docker', 'git', 'machine learning', 'data', 'pandas', 'tensorflow', 'pytorch', 'scikit-learn'])]
-    analysis_skills = [s for s in missing_skills if any(analysis in s.lower() for analysis in ['excel', 'tableau', 'power bi', 'statistical analysis', 'a/b testing'])]
-    cloud_skills = [s for s in missing_skills if any(cloud in s.lower() for cloud in ['aws', 'azure', 'gcp', 'docker', 'kubernetes'])]
-    soft_skills = [s for s in missing_skills if any(soft in s.lower() for soft in ['communication', 'leadership', 'teamwork', 'project management'])]
+    tech_skills = _skills_in_group(missing_skills, TECH_GROUP)
+    analysis_skills = _skills_in_group(missing_skills, ANALYSIS_GROUP)
+    cloud_skills = _skills_in_group(missing_skills, CLOUD_GROUP)
+    soft_skills = _skills_in_group(missing_skills, SOFT_GROUP)
     
     recommendations = {}
     
@@ -162,52 +194,107 @@ def generate_recommendations(missing_skills, jd_skills=None):
     
     return {"recommendations": recommendations, "learning_path": learning_path}
 
-def generate_llm_feedback(resume_text, jd_text, missing_skills):
+# Chat model used for all generated feedback, advice and project ideas
+LLM_MODEL = "gpt-3.5-turbo"
+
+_openai_client = None
+# True while the client was supplied through set_openai_client rather than built from the environment
+_openai_client_injected = False
+_openai_client_lock = threading.Lock()
+
+def get_openai_client():
     """
-    Generate actionable resume feedback using OpenAI's GPT API (new API >=1.0.0) or placeholder if not configured.
-    Now provides unique, personalized feedback based on actual resume and job description content.
+    Process-wide OpenAI client, created on first use and shared by all threads so HTTP
+    connections are pooled and kept alive between calls. Pool size, keep-alive and retries
+    are read from SKILLSHIFT_LLM_MAX_CONNECTIONS, SKILLSHIFT_LLM_KEEPALIVE_SECONDS and
+    SKILLSHIFT_LLM_MAX_RETRIES (retries use the client's exponential backoff).
     """
-    openai_api_key = os.getenv('OPENAI_API_KEY')
-    if openai_api_key:
-        import openai
-        client = openai.OpenAI(api_key=openai_api_key)
-        
-        # Create a more detailed prompt for personalized feedback
-        prompt = f"""
-        You are an expert career coach and resume reviewer. Analyze the following resume and job description to provide specific, actionable feedback.
+    global _openai_client
+    with _openai_client_lock:
+        if _openai_client is None:
+            import openai
+            max_connections = int(os.getenv('SKILLSHIFT_LLM_MAX_CONNECTIONS', '20'))
+            # Build Limits from the type of the client's own defaults, so this follows
+            # whichever HTTP library the installed openai package is built on
+            limits = type(openai.DEFAULT_CONNECTION_LIMITS)(
+                max_connections=max_connections,
+                max_keepalive_connections=max_connections,
+                keepalive_expiry=float(os.getenv('SKILLSHIFT_LLM_KEEPALIVE_SECONDS', '30')),
+            )
+            _openai_client = openai.OpenAI(
+                api_key=os.getenv('OPENAI_API_KEY'),
+                max_retries=int(os.getenv('SKILLSHIFT_LLM_MAX_RETRIES', '2')),
+                http_client=openai.DefaultHttpxClient(limits=limits),
+            )
+        return _openai_client
 
-        RESUME CONTENT:
-        {resume_text[:1500]}
+def set_openai_client(client):
+    """Replace the shared client, e.g. with one pointed at a local stand-in; None rebuilds it on next use."""
+    global _openai_client, _openai_client_injected
+    with _openai_client_lock:
+        _openai_client = client
+        _openai_client_injected = client is not None
 
-        JOB DESCRIPTION:
-        {jd_text[:1500]}
+@timed('recommender.llm_call')
+def _chat_completion(prompt, max_tokens, timeout=None):
+    """
+    Send a single-message chat completion to OpenAI's GPT API (new API >=1.0.0).
+    Replies are served from the persistent LLM response cache when the same request was made recently.
+    Returns the reply text, or None if no client is available or the call fails. Without an
+    injected client (set_openai_client) an OPENAI_API_KEY is required.
+    """
+    if not _openai_client_injected and not os.getenv('OPENAI_API_KEY'):
+        return None
+    from llm_cache import get_llm_cache
+    cache = get_llm_cache()
+    if cache is not None:
+        cached = cache.get(LLM_MODEL, prompt, max_tokens)
+        if cached is not None:
+            return cached
+    try:
+        client = get_openai_client()
+        response = client.chat.completions.create(
+            model=LLM_MODEL,
+            messages=[{"role": "user", "content": prompt}],
+            max_tokens=max_tokens,
+            timeout=timeout
+        )
+        reply = response.choices[0].message.content.strip()
+    except Exception as e:
+        # Callers fall back to placeholder text if the API fails
+        return None
+    if cache is not None:
+        cache.put(LLM_MODEL, prompt, max_tokens, reply)
+    return reply
 
-        MISSING SKILLS: {', '.join(missing_skills)}
+def _feedback_prompt(resume_text, jd_text, missing_skills):
+    # Create a more detailed prompt for personalized feedback
+    prompt = f"""
+    You are an expert career coach and resume reviewer. Analyze the following resume and job description to provide specific, actionable feedback.
 
-        Based on this specific resume and job description, provide 3-5 personalized, actionable suggestions to improve the candidate's chances for this specific role. Focus on:
+    RESUME CONTENT:
+    {resume_text[:1500]}
 
-        1. Specific improvements to the resume content based on what's missing
-        2. How to better align the resume with this particular job description
-        3. Specific ways to address the missing skills in the resume
-        4. Any red flags or areas that need immediate attention
-        5. Strengths to emphasize and weaknesses to address
+    JOB DESCRIPTION:
+    {jd_text[:1500]}
 
-        Make your feedback specific to this resume and job, not generic advice. Reference specific parts of the resume and job description when possible.
+    MISSING SKILLS: {', '.join(missing_skills)}
 
-        FEEDBACK:
-        """
-        
-        try:
-            response = client.chat.completions.create(
-                model="gpt-3.5-turbo",
-                messages=[{"role": "user", "content": prompt}],
-                max_tokens=500
-            )
-            return response.choices[0].message.content.strip()
-        except Exception as e:
-            # Fallback to placeholder if API fails
-            pass
-    
+    Based on this specific resume and job description, provide 3-5 personalized, actionable suggestions to improve the candidate's chances for this specific role. Focus on:
+
+    1. Specific improvements to the resume content based on what's missing
+    2. How to better align the resume with this particular job description
+    3. Specific ways to address the missing skills in the resume
+    4. Any red flags or areas that need immediate attention
+    5. Strengths to emphasize and weaknesses to address
+
+    Make your feedback specific to this resume and job, not generic advice. Reference specific parts of the resume and job description when possible.
+
+    FEEDBACK:
+    """
+    return prompt
+
+def _feedback_placeholder(missing_skills):
     # Enhanced placeholder feedback that's more specific
     return (
         f"Based on your resume and the job description, here are specific recommendations:\n\n"
@@ -218,54 +305,46 @@ def generate_llm_feedback(resume_text, jd_text, missing_skills):
         f"5. **Professional Development**: Consider adding relevant certifications or courses that address the missing skills."
     )
 
-def generate_role_advice(jd_text, missing_skills, job_title=None):
+def generate_llm_feedback(resume_text, jd_text, missing_skills):
     """
-    Generate role-specific advice using GPT if available, otherwise provide a generic template.
-    Now includes the specific job title for more targeted advice and analyzes the actual job description.
+    Generate actionable resume feedback using OpenAI's GPT API (new API >=1.0.0) or placeholder if not configured.
+    Now provides unique, personalized feedback based on actual resume and job description content.
     """
-    openai_api_key = os.getenv('OPENAI_API_KEY')
-    if openai_api_key:
-        import openai
-        client = openai.OpenAI(api_key=openai_api_key)
-        
-        role_context = f"for a {job_title} position" if job_title else "for this role"
-        
-        # Create a more detailed prompt for personalized role advice
-        prompt = f"""
-        You are a career coach specializing in {job_title if job_title else 'professional development'}. 
-        
-        Analyze the following job description and provide specific, actionable advice for a candidate with the missing skills listed below.
+    feedback = _chat_completion(_feedback_prompt(resume_text, jd_text, missing_skills), max_tokens=500)
+    if feedback is not None:
+        return feedback
+    return _feedback_placeholder(missing_skills)
 
-        JOB DESCRIPTION:
-        {jd_text[:1500]}
+def _role_advice_prompt(jd_text, missing_skills, job_title=None):
+    role_context = f"for a {job_title} position" if job_title else "for this role"
 
-        MISSING SKILLS: {', '.join(missing_skills)}
-        TARGET ROLE: {job_title if job_title else 'Professional Role'}
+    # Create a more detailed prompt for personalized role advice
+    prompt = f"""
+    You are a career coach specializing in {job_title if job_title else 'professional development'}. 
 
-        Provide 3-5 specific pieces of advice that are tailored to this exact job description and role. Focus on:
+    Analyze the following job description and provide specific, actionable advice for a candidate with the missing skills listed below.
 
-        1. How to position yourself for this specific role despite the missing skills
-        2. What the hiring manager is likely looking for based on this job description
-        3. Specific strategies to address the missing skills for this particular position
-        4. How to leverage existing experience to compensate for missing skills
-        5. Industry-specific insights for this role and company type
+    JOB DESCRIPTION:
+    {jd_text[:1500]}
 
-        Make your advice specific to this job description and role, not generic career advice. Reference specific requirements or responsibilities from the job description when possible.
+    MISSING SKILLS: {', '.join(missing_skills)}
+    TARGET ROLE: {job_title if job_title else 'Professional Role'}
 
-        ROLE-SPECIFIC ADVICE:
-        """
-        
-        try:
-            response = client.chat.completions.create(
-                model="gpt-3.5-turbo",
-                messages=[{"role": "user", "content": prompt}],
-                max_tokens=500
-            )
-            return response.choices[0].message.content.strip()
-        except Exception as e:
-            # Fallback to placeholder if API fails
-            pass
-    
+    Provide 3-5 specific pieces of advice that are tailored to this exact job description and role. Focus on:
+
+    1. How to position yourself for this specific role despite the missing skills
+    2. What the hiring manager is likely looking for based on this job description
+    3. Specific strategies to address the missing skills for this particular position
+    4. How to leverage existing experience to compensate for missing skills
+    5. Industry-specific insights for this role and company type
+
+    Make your advice specific to this job description and role, not generic career advice. Reference specific requirements or responsibilities from the job description when possible.
+
+    ROLE-SPECIFIC ADVICE:
+    """
+    return prompt
+
+def _role_advice_placeholder(missing_skills, job_title=None):
     # Enhanced placeholder advice that's more specific
     if job_title:
         return (
@@ -286,10 +365,83 @@ def generate_role_advice(jd_text, missing_skills, job_title=None):
             "5. **Skill Application**: Prepare to discuss how you would apply the missing skills in practical scenarios relevant to this role."
         )
 
-def search_real_projects(missing_skills, job_title=None):
+def generate_role_advice(jd_text, missing_skills, job_title=None):
+    """
+    Generate role-specific advice using GPT if available, otherwise provide a generic template.
+    Now includes the specific job title for more targeted advice and analyzes the actual job description.
+    """
+    advice = _chat_completion(_role_advice_prompt(jd_text, missing_skills, job_title), max_tokens=500)
+    if advice is not None:
+        return advice
+    return _role_advice_placeholder(missing_skills, job_title)
+
+# GitHub base URL for project search; override to point at a local fake server
+GITHUB_URL = os.getenv('SKILLSHIFT_GITHUB_URL', 'https://github.com')
+# Seconds allowed for all project searches together, and for each single request
+PROJECT_SEARCH_DEADLINE = 8
+PROJECT_SEARCH_TIMEOUT = 5
+PROJECT_SEARCH_WORKERS = 4
+# How long parsed search results are reused, in seconds
+PROJECT_SEARCH_CACHE_TTL = 6 * 3600
+
+_search_executor = ThreadPoolExecutor(max_workers=PROJECT_SEARCH_WORKERS, thread_name_prefix='skillshift-search')
+_http_session = None
+_http_cache = None
+_http_lock = threading.Lock()
+
+def _get_http_session():
+    """Shared requests session so searches reuse pooled connections."""
+    global _http_session
+    with _http_lock:
+        if _http_session is None:
+            import requests
+            session = requests.Session()
+            adapter = requests.adapters.HTTPAdapter(pool_connections=4, pool_maxsize=PROJECT_SEARCH_WORKERS)
+            session.mount('https://', adapter)
+            session.mount('http://', adapter)
+            session.headers['User-Agent'] = 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
+            _http_session = session
+        return _http_session
+
+def _get_http_cache():
+    global _http_cache
+    with _http_lock:
+        if _http_cache is None:
+            from cache_store import DiskCache
+            from utils import CACHE_DIR
+            _http_cache = DiskCache(os.path.join(CACHE_DIR, 'http_cache.sqlite'), max_bytes=8 * 1024 * 1024, ttl=PROJECT_SEARCH_CACHE_TTL)
+        return _http_cache
+
+@timed('recommender.github_search')
+def _search_repositories(query):
+    """Return up to 2 (name, url) repositories from one GitHub search page, cached by URL."""
+    search_url = f"{GITHUB_URL}/search?q={query.replace(' ', '+')}&type=repositories"
+    cache = _get_http_cache()
+    cached = cache.get(search_url)
+    if cached is not None:
+        return [tuple(repo) for repo in json.loads(bytes(cached).decode('utf-8'))]
+    response = _get_http_session().get(search_url, timeout=PROJECT_SEARCH_TIMEOUT)
+    if response.status_code != 200:
+        return []
+    from bs4 import BeautifulSoup
+    soup = BeautifulSoup(response.content, 'html.parser')
+
+    # Extract repository information
+    repo_links = soup.find_all('a', href=re.compile(r'/[^/]+/[^/]+$'))
+    repos = []
+    for link in repo_links[:2]:  # Get first 2 results
+        repo_name = link.get_text().strip()
+        if repo_name and not repo_name.startswith('Sign up'):
+            repos.append((repo_name, f"{GITHUB_URL}{link['href']}"))
+    cache.put(search_url, json.dumps(repos).encode('utf-8'))
+    return repos
+
+@timed('recommender.project_search')
+def search_real_projects(missing_skills, job_title=None, deadline=PROJECT_SEARCH_DEADLINE):
     """
     Search for real project examples that include the missing skills.
     Returns 2-3 specific project examples with descriptions and links.
+    Searches run concurrently; whatever has arrived when the deadline passes is used.
     """
     if not missing_skills:
         return "No missing skills to search for projects."
@@ -302,46 +454,25 @@ def search_real_projects(missing_skills, job_title=None):
     
     projects_found = []
     
-    try:
-        # Search for GitHub projects (simplified approach)
-        for query in search_queries[:4]:  # Limit searches
-            # Use GitHub search API or web scraping
-            search_url = f"https://github.com/search?q={query.replace(' ', '+')}&type=repositories"
-            
-            headers = {
-                'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
-            }
-            
-            try:
-                response = requests.get(search_url, headers=headers, timeout=5)
-                if response.status_code == 200:
-                    soup = BeautifulSoup(response.content, 'html.parser')
-                    
-                    # Extract repository information
-                    repo_links = soup.find_all('a', href=re.compile(r'/[^/]+/[^/]+$'))
-                    
-                    for link in repo_links[:2]:  # Get first 2 results
-                        repo_name = link.get_text().strip()
-                        repo_url = f"https://github.com{link['href']}"
-                        
-                        if repo_name and not repo_name.startswith('Sign up'):
-                            projects_found.append({
-                                'name': repo_name,
-                                'url': repo_url,
-                                'description': f"GitHub repository demonstrating {', '.join(missing_skills[:2])} skills"
-                            })
-                            
-                            if len(projects_found) >= 3:
-                                break
-                    
-                    if len(projects_found) >= 3:
-                        break
-                        
-            except Exception as e:
-                continue
-                
-    except Exception as e:
-        pass
+    # Search for GitHub projects (simplified approach), limiting the number of searches
+    # Each search runs in a copy of the caller's context, so its timing span reaches the caller's collector
+    futures = [_search_executor.submit(contextvars.copy_context().run, _search_repositories, query) for query in search_queries[:4]]
+    _, not_done = wait(futures, timeout=deadline)
+    # Searches still queued behind busy workers are dropped, so they don't delay later
+    # callers; running ones end within PROJECT_SEARCH_TIMEOUT
+    for future in not_done:
+        future.cancel()
+    # Keep query order so results don't depend on which request finished first
+    for future in futures:
+        if not future.done() or future.exception() is not None:
+            continue
+        for repo_name, repo_url in future.result():
+            projects_found.append({
+                'name': repo_name,
+                'url': repo_url,
+                'description': f"GitHub repository demonstrating {', '.join(missing_skills[:2])} skills"
+            })
+    projects_found = projects_found[:3]
     
     # If web scraping fails, provide curated examples
     if not projects_found:
@@ -381,79 +512,148 @@ def search_real_projects(missing_skills, job_title=None):
     else:
         return "Focus on building your own projects to demonstrate these skills effectively."
 
-def generate_project_suggestions(missing_skills, jd_text=None, job_title=None):
-    """
-    Suggest portfolio or GitHub project ideas that combine multiple missing skills.
-    Now includes real project examples from web search.
-    """
-    if len(missing_skills) < 2:
-        return "Consider building a focused project to demonstrate your expertise in the missing skill."
-    
-    # Get real project examples
-    real_projects = search_real_projects(missing_skills, job_title)
-    
+def _project_skill_groups(missing_skills):
     # Check if skills can be meaningfully combined
-    tech_skills = [s for s in missing_skills if any(tech in s.lower() for tech in ['python', 'sql', 'aws', 'docker', 'git', 'machine learning', 'data', 'pandas', 'tensorflow', 'pytorch'])]
-    analysis_skills = [s for s in missing_skills if any(analysis in s.lower() for analysis in ['excel', 'tableau', 'power bi', 'statistical analysis', 'a/b testing'])]
-    cloud_skills = [s for s in missing_skills if any(cloud in s.lower() for cloud in ['aws', 'azure', 'gcp', 'docker', 'kubernetes'])]
-    
-    openai_api_key = os.getenv('OPENAI_API_KEY')
-    if openai_api_key:
-        import openai
-        client = openai.OpenAI(api_key=openai_api_key)
-        
-        # Create a more natural prompt for combined projects
-        skill_groups = []
-        if tech_skills and analysis_skills:
-            skill_groups.append(f"technical skills ({', '.join(tech_skills)}) and analysis tools ({', '.join(analysis_skills)})")
-        elif tech_skills and cloud_skills:
-            skill_groups.append(f"technical skills ({', '.join(tech_skills)}) and cloud platforms ({', '.join(cloud_skills)})")
-        elif len(tech_skills) >= 2:
-            skill_groups.append(f"multiple technical skills ({', '.join(tech_skills)})")
-        else:
-            skill_groups.append(f"your missing skills ({', '.join(missing_skills)})")
-        
-        role_context = f"for a {job_title} position" if job_title else "for this job"
-        prompt = (
-            f"Suggest 1-2 portfolio project ideas that creatively combine {skill_groups[0]} "
-            f"{role_context}. Focus on projects that demonstrate practical application "
-            f"and real-world value. Make the suggestions specific and actionable.\n"
-            f"Job Description context: {jd_text[:500] if jd_text else ''}\n"
-            f"Project Ideas:"
-        )
-        
-        try:
-            response = client.chat.completions.create(
-                model="gpt-3.5-turbo",
-                messages=[{"role": "user", "content": prompt}],
-                max_tokens=300
-            )
-            ai_suggestions = response.choices[0].message.content.strip()
-            return f"{ai_suggestions}\n\n{real_projects}"
-        except:
-            pass
-    
+    tech_skills = _skills_in_group(missing_skills, PROJECT_TECH_GROUP)
+    analysis_skills = _skills_in_group(missing_skills, ANALYSIS_GROUP)
+    cloud_skills = _skills_in_group(missing_skills, CLOUD_GROUP)
+    return tech_skills, analysis_skills, cloud_skills
+
+def _project_prompt(missing_skills, jd_text=None, job_title=None):
+    tech_skills, analysis_skills, cloud_skills = _project_skill_groups(missing_skills)
+    # Create a more natural prompt for combined projects
+    skill_groups = []
+    if tech_skills and analysis_skills:
+        skill_groups.append(f"technical skills ({', '.join(tech_skills)}) and analysis tools ({', '.join(analysis_skills)})")
+    elif tech_skills and cloud_skills:
+        skill_groups.append(f"technical skills ({', '.join(tech_skills)}) and cloud platforms ({', '.join(cloud_skills)})")
+    elif len(tech_skills) >= 2:
+        skill_groups.append(f"multiple technical skills ({', '.join(tech_skills)})")
+    else:
+        skill_groups.append(f"your missing skills ({', '.join(missing_skills)})")
+
+    role_context = f"for a {job_title} position" if job_title else "for this job"
+    return (
+        f"Suggest 1-2 portfolio project ideas that creatively combine {skill_groups[0]} "
+        f"{role_context}. Focus on projects that demonstrate practical application "
+        f"and real-world value. Make the suggestions specific and actionable.\n"
+        f"Job Description context: {jd_text[:500] if jd_text else ''}\n"
+        f"Project Ideas:"
+    )
+
+def _project_placeholder(missing_skills):
+    tech_skills, analysis_skills, cloud_skills = _project_skill_groups(missing_skills)
     # Fallback: Check if we can suggest meaningful combinations
-    combined_suggestions = ""
     if tech_skills and analysis_skills:
-        combined_suggestions = (
+        return (
             f"Build a data analysis project that combines {', '.join(tech_skills[:2])} with "
             f"{', '.join(analysis_skills[:2])}. For example, create a dashboard that "
             f"analyzes real-world data using your technical skills."
         )
     elif tech_skills and cloud_skills:
-        combined_suggestions = (
+        return (
             f"Develop a cloud-based application using {', '.join(tech_skills[:2])} and "
             f"deploy it using {', '.join(cloud_skills[:2])}. This demonstrates both "
             f"technical implementation and cloud infrastructure skills."
         )
     elif len(tech_skills) >= 2:
-        combined_suggestions = (
+        return (
             f"Create an end-to-end project that showcases {', '.join(tech_skills[:3])}. "
             f"Focus on building something complete and deployable that demonstrates "
             f"your ability to work with multiple technologies together."
         )
-    else:
-        combined_suggestions = "Focus on individual skill development through targeted learning and practice."
+    return "Focus on individual skill development through targeted learning and practice."
+
+# Returned instead of project ideas when there is nothing to combine
+SINGLE_SKILL_PROJECT_MESSAGE = "Consider building a focused project to demonstrate your expertise in the missing skill."
+
+def generate_project_suggestions(missing_skills, jd_text=None, job_title=None):
+    """
+    Suggest portfolio or GitHub project ideas that combine multiple missing skills.
+    Now includes real project examples from web search.
+    """
+    if len(missing_skills) < 2:
+        return SINGLE_SKILL_PROJECT_MESSAGE
     
-    return f"{combined_suggestions}\n\n{real_projects}" 
\ No newline at end of file
+    # Get real project examples
+    real_projects = search_real_projects(missing_skills, job_title)
+    ideas = _chat_completion(_project_prompt(missing_skills, jd_text, job_title), max_tokens=300)
+    if ideas is None:
+        ideas = _project_placeholder(missing_skills)
+    return f"{ideas}\n\n{real_projects}"
+
+# Seconds allowed for each LLM call, and for all concurrent calls together
+LLM_CALL_TIMEOUT = 20
+LLM_DEADLINE = 30
+
+# Blocking LLM calls run here; asyncio.run() does not wait for these threads on exit,
+# so a call that overruns the deadline never holds up the caller
+_llm_executor = ThreadPoolExecutor(max_workers=8, thread_name_prefix='skillshift-llm')
+
+async def _run_blocking(function, *args):
+    # run_in_executor does not carry context variables over; run the call in a copy of ours
+    # so its timing span reaches the caller's collector
+    context = contextvars.copy_context()
+    return await asyncio.get_running_loop().run_in_executor(_llm_executor, functools.partial(context.run, function, *args))
+
+async def _with_fallback(coroutine, fallback, timeout):
+    """Await coroutine within timeout; on timeout, error or a None reply, return fallback()."""
+    try:
+        result = await asyncio.wait_for(coroutine, timeout)
+    except Exception:
+        result = None
+    return fallback() if result is None else result
+
+async def _project_suggestions_async(missing_skills, jd_text, job_title, call_timeout):
+    # The GitHub search and the LLM call for project ideas run side by side
+    real_projects, ideas = await asyncio.gather(
+        _run_blocking(search_real_projects, missing_skills, job_title),
+        _with_fallback(
+            _run_blocking(_chat_completion, _project_prompt(missing_skills, jd_text, job_title), 300, call_timeout),
+            lambda: _project_placeholder(missing_skills),
+            call_timeout,
+        ),
+    )
+    return f"{ideas}\n\n{real_projects}"
+
+async def generate_llm_outputs_async(resume_text, jd_text, missing_skills, job_title=None, include_projects=False, call_timeout=LLM_CALL_TIMEOUT, deadline=LLM_DEADLINE):
+    """
+    Generate resume feedback, role advice and (optionally) project suggestions concurrently.
+    Each call is bounded by call_timeout and all of them together by deadline; any call that
+    fails or runs out of time falls back to its placeholder text on its own.
+    Returns a dict with 'feedback', 'advice' and, if include_projects, 'projects'.
+    To exercise this without the real API, inject a client pointed at a local stub server
+    with set_openai_client (see tests/test_llm_outputs.py).
+    """
+    fallbacks = {
+        'feedback': lambda: _feedback_placeholder(missing_skills),
+        'advice': lambda: _role_advice_placeholder(missing_skills, job_title),
+    }
+    calls = {
+        'feedback': _run_blocking(_chat_completion, _feedback_prompt(resume_text, jd_text, missing_skills), 500, call_timeout),
+        'advice': _run_blocking(_chat_completion, _role_advice_prompt(jd_text, missing_skills, job_title), 500, call_timeout),
+    }
+    if include_projects:
+        if len(missing_skills) < 2:
+            fallbacks['projects'] = lambda: SINGLE_SKILL_PROJECT_MESSAGE
+        else:
+            fallbacks['projects'] = lambda: _project_placeholder(missing_skills)
+            calls['projects'] = _project_suggestions_async(missing_skills, jd_text, job_title, call_timeout)
+
+    tasks = {name: asyncio.ensure_future(_with_fallback(call, fallbacks[name], call_timeout)) for name, call in calls.items()}
+    await asyncio.wait(tasks.values(), timeout=deadline)
+    results = {}
+    for name in fallbacks:
+        task = tasks.get(name)
+        if task is not None and task.done():
+            results[name] = task.result()
+        else:
+            if task is not None:
+                task.cancel()
+            results[name] = fallbacks[name]()
+    return results
+
+@timed('recommender.llm_outputs')
+def generate_llm_outputs(resume_text, jd_text, missing_skills, job_title=None, include_projects=False, call_timeout=LLM_CALL_TIMEOUT, deadline=LLM_DEADLINE):
+    """Blocking wrapper around generate_llm_outputs_async for callers without an event loop (e.g. Streamlit)."""
+    return asyncio.run(generate_llm_outputs_async(resume_text, jd_text, missing_skills, job_title, include_projects, call_timeout, deadline))
@@ -1,25 +1,32 @@
-import pdfplumber
-import docx
 from utils import extract_skills_from_text
+from metrics import span, timed
+from parse_cache import cached_parse
+from document_loader import detect_format, load_document
+from section_segmenter import iter_sections, section_lines, segment_sections
+import io
+from functools import partial
 import re
 
-def extract_skills_section(text):
+# Bump when parsing logic changes so cached results are not reused
+PARSER_VERSION = 2
+
+# Characters separating individual skills within a Skills section line
+_SKILL_SEPARATORS = re.compile(r'[\u2022\u2023\u25E6\u2043\u2219\-•;\,\n]')
+
+def extract_skills_section(text, sections=None):
     """
-    Extract all skills from the 'Skills' section, handling category headers (e.g., 'Languages:') and comma-separated lists.
+    Extract all skills from every 'Skills' section, handling category headers (e.g., 'Languages:') and comma-separated lists.
     Returns a flat list of all found skills and the raw section text.
+    Pass `sections` from segment_sections(text) to reuse an existing segmentation.
     """
-    lines = text.splitlines()
+    if sections is None:
+        sections = segment_sections(text)
     skills_lines = []
-    in_skills = False
-    for line in lines:
-        if not in_skills and re.match(r'^\s*skills\s*[:\-]?', line, re.IGNORECASE):
-            in_skills = True
-            continue
-        if in_skills:
-            # Stop at next section header (all caps, or common section names), or empty line
-            if re.match(r'^\s*[A-Z][A-Z\s]{2,}$', line) or re.match(r'^\s*(experience|education|projects|summary|certifications|work|profile|professional|languages|interests|contact)\b', line, re.IGNORECASE) or not line.strip():
-                break
-            skills_lines.append(line.strip())
+    for section in sections.get('skills', []):
+        skills_lines.extend(section_lines(text, section))
+    return _split_skills_lines(skills_lines)
+
+def _split_skills_lines(skills_lines):
     # Extract all comma-separated skills from each line after a colon
     all_skills = []
     for line in skills_lines:
@@ -27,24 +34,85 @@ def extract_skills_section(text):
             _, skills_part = line.split(':', 1)
         else:
             skills_part = line
-        raw_skills = re.split(r'[\u2022\u2023\u25E6\u2043\u2219\-•;\,\n]', skills_part)
+        raw_skills = _SKILL_SEPARATORS.split(skills_part)
         all_skills.extend([s.strip() for s in raw_skills if s.strip()])
     raw_section = '\n'.join(skills_lines)
     return all_skills if all_skills else None, raw_section if skills_lines else None
 
-def parse_resume(file_path):
-    """Extract text and skills from a PDF or DOCX resume, focusing on the 'Skills' section if present. Returns (text, skills, raw_skills_section)."""
-    if file_path.lower().endswith('.pdf'):
-        with pdfplumber.open(file_path) as pdf:
+@timed('resume_parser.parse_resume')
+def parse_resume(source, use_cache=True, streaming=False):
+    """
+    Extract text and skills from a PDF or DOCX resume, focusing on the 'Skills' section if present. Returns (text, skills, raw_skills_section).
+    `source` is a file path, bytes-like object (e.g. an upload's getbuffer()) or binary file
+    object; the format is detected from the content, and in-memory input is parsed without
+    touching the filesystem.
+    With streaming=True, PDF pages are read lazily and reading stops once the first Skills
+    section has closed, so the returned text only covers the pages read and the skills come
+    from that first section only; the default mode collects every Skills section. If no
+    usable Skills section is found, the whole document is read as usual.
+    """
+    data = load_document(source)
+    file_format = detect_format(data)
+    if file_format not in ('pdf', 'docx'):
+        raise ValueError("Unsupported file type for resume.")
+    streaming = streaming and file_format == 'pdf'
+    if streaming:
+        parse = _parse_resume_streaming
+    else:
+        parse = partial(_parse_resume, file_format=file_format)
+    if use_cache:
+        kind = f"resume.{file_format}-stream" if streaming else f"resume.{file_format}"
+        return cached_parse(kind, data, PARSER_VERSION, parse)
+    return parse(data)
+
+def _iter_pdf_lines(pdf, page_texts):
+    """Yield a PDF's lines page by page, recording each extracted page text in page_texts."""
+    for page in pdf.pages:
+        page_text = page.extract_text() or ''
+        page.flush_cache()
+        page_texts.append(page_text)
+        # Same lines as splitting the fully joined text, since pages are joined with newlines
+        yield from page_text.split('\n')
+
+@timed('resume_parser.pdf_stream')
+def _parse_resume_streaming(data):
+    import pdfplumber
+    page_texts = []
+    with pdfplumber.open(io.BytesIO(data)) as pdf:
+        lines = _iter_pdf_lines(pdf, page_texts)
+        for section in iter_sections(lines):
+            if section.name != 'skills':
+                continue
+            text = "\n".join(page_texts)
+            skills_section, raw_section = _split_skills_lines(section_lines(text, section))
+            if skills_section:
+                return text, extract_skills_from_text(' '.join(skills_section)), raw_section
+            break
+        # Fallback: no usable Skills section, so read the remaining pages
+        for _ in lines:
+            pass
+    return _skills_from_text("\n".join(page_texts))
+
+def _parse_resume(data, file_format):
+    # Parser libraries are imported on first use, keeping them off the app's startup path
+    if file_format == 'pdf':
+        import pdfplumber
+        with span('resume_parser.pdf_text'), pdfplumber.open(io.BytesIO(data)) as pdf:
             text = "\n".join(page.extract_text() or '' for page in pdf.pages)
-    elif file_path.lower().endswith('.docx'):
-        doc = docx.Document(file_path)
-        text = "\n".join([para.text for para in doc.paragraphs])
+    elif file_format == 'docx':
+        import docx
+        with span('resume_parser.docx_text'):
+            doc = docx.Document(io.BytesIO(data))
+            text = "\n".join([para.text for para in doc.paragraphs])
     else:
         raise ValueError("Unsupported file type for resume.")
+    return _skills_from_text(text)
+
+@timed('resume_parser.skills')
+def _skills_from_text(text):
     skills_section, raw_section = extract_skills_section(text)
     if skills_section:
         skills = extract_skills_from_text(' '.join(skills_section))
     else:
         skills = extract_skills_from_text(text)
-    return text, skills, raw_section 
\ No newline at end of file
+    return text, skills, raw_section 
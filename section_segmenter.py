@@ -0,0 +1,67 @@
+import re
+from collections import namedtuple
+
+# A section found in a document. `header_start` is the offset of its header line;
+# its body is text[start:end], without the header line and without the trailing newline.
+Section = namedtuple('Section', ['name', 'header_start', 'start', 'end'])
+
+_SKILLS_HEADER = re.compile(r'^\s*skills\s*[:\-]?', re.IGNORECASE)
+_NAMED_HEADER = re.compile(r'^\s*(experience|education|projects|summary|certifications|work|profile|professional|languages|interests|contact)\b', re.IGNORECASE)
+_CAPS_HEADER = re.compile(r'^\s*[A-Z][A-Z\s]{2,}$')
+
+def _header_name(line):
+    """Section name if the line is a section header, otherwise None."""
+    if _SKILLS_HEADER.match(line):
+        return 'skills'
+    match = _NAMED_HEADER.match(line)
+    if match:
+        return match.group(1).lower()
+    if _CAPS_HEADER.match(line):
+        return ' '.join(line.split()).lower()
+    return None
+
+def iter_sections(lines):
+    """
+    Walk the lines of a document once and yield each Section as soon as it closes, so
+    callers reading a document lazily can stop early. Offsets assume the lines are joined
+    by single newlines, i.e. they come from text.split('\\n').
+    A section runs until the next header line. A skills section also ends at the first
+    empty line, and only an all-caps or common section header closes it (a nested
+    'Skills:' line stays part of the block).
+    """
+    offset = 0
+    current = None
+    for line in lines:
+        line_start = offset
+        offset += len(line) + 1
+        if current is not None:
+            name, header_start, start = current
+            if name == 'skills':
+                blank = not line.strip()
+                if not (blank or _CAPS_HEADER.match(line) or _NAMED_HEADER.match(line)):
+                    continue
+                yield Section(name, header_start, start, max(start, line_start - 1))
+                current = None
+                if blank:
+                    continue
+        header = _header_name(line)
+        if header is None:
+            continue
+        if current is not None:
+            name, header_start, start = current
+            yield Section(name, header_start, start, max(start, line_start - 1))
+        current = (header, line_start, offset)
+    if current is not None:
+        name, header_start, start = current
+        yield Section(name, header_start, start, max(start, offset - 1))
+
+def segment_sections(text):
+    """Return a dict mapping each section name to its Sections, in document order."""
+    sections = {}
+    for section in iter_sections(text.split('\n')):
+        sections.setdefault(section.name, []).append(section)
+    return sections
+
+def section_lines(text, section):
+    """Non-empty, stripped body lines of a section."""
+    return [line.strip() for line in text[section.start:section.end].split('\n') if line.strip()]
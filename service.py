@@ -0,0 +1,289 @@
+import argparse
+import base64
+import binascii
+import json
+import os
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from multiprocessing import Array, Event, Pool, Value, TimeoutError as PoolTimeout
+from urllib.parse import parse_qs, urlsplit
+import metrics
+import profiling
+
+# Default limits: concurrent analyses equal the worker count, up to MAX_QUEUE more may
+# wait for a worker, and a caller waits at most REQUEST_TIMEOUT seconds for its result
+MAX_QUEUE = 32
+REQUEST_TIMEOUT = 30
+# Seconds the workers get to import the pipeline and load the skill index at startup
+STARTUP_TIMEOUT = 120
+MAX_BODY_BYTES = 20 * 1024 * 1024
+
+class ServiceBusy(Exception):
+    """Raised when the request queue is full; the HTTP server answers 503."""
+
+class ServiceTimeout(Exception):
+    """Raised when a request does not finish within its timeout; the HTTP server answers 504."""
+
+class ServiceStartupError(Exception):
+    """Raised when the workers fail to start, or do not start within the startup timeout."""
+
+def _init_worker(started, workers, ready, error):
+    """
+    Runs once per worker process, before it takes requests: importing the pipeline compiles
+    the skill matcher and loads the recommender, and the skill embedding index is loaded
+    (or found unavailable) now rather than on the first request.
+    Sets `ready` once `workers` initializers have finished. A failing initializer stores its
+    error and sets `ready` too, so the service stops waiting and reports it.
+    """
+    try:
+        import pipeline  # noqa: F401
+        from skill_embeddings import get_default_skill_index
+        get_default_skill_index()
+    except Exception as e:
+        with error.get_lock():
+            error.value = f"{type(e).__name__}: {e}".encode('utf-8', 'replace')[:len(error) - 1]
+        ready.set()
+        raise
+    with started.get_lock():
+        started.value += 1
+        if started.value >= workers:
+            ready.set()
+
+def _analyze(request):
+    """Parse -> extract -> compare -> recommend for one request, inside a worker process."""
+    from pipeline import comparison_stage, jd_skills_stage, parse_resume_stage, recommendations_stage
+    from utils import extract_job_title, extract_skills_from_text
+    run_profile = profiling.profile('analyze', request.get('profile'))
+    run_profile.start()
+    # Request timings are only collected when metrics are on, so they cost nothing otherwise
+    collector = metrics.collect() if metrics.is_enabled() else None
+    spans = collector.start() if collector is not None else []
+    try:
+        values = {'jd_text': request['jd_text']}
+        if request.get('resume_bytes') is not None:
+            values.update(parse_resume_stage(request['resume_bytes']))
+        else:
+            values['resume_skills'] = extract_skills_from_text(request['resume_text'])
+        values.update(jd_skills_stage(values['jd_text']))
+        values.update(comparison_stage(values['resume_skills'], values['jd_skills']))
+        values.update(recommendations_stage(values['comparison'], values['jd_skills']))
+        job_title = extract_job_title(values['jd_text'])
+    finally:
+        if collector is not None:
+            collector.stop()
+        run_profile.stop()
+    result = {
+        'job_title': job_title,
+        'resume_skills': values['resume_skills'],
+        'jd_skills': values['jd_skills'],
+        'comparison': values['comparison'],
+        'recommendations': values['recs_and_path']['recommendations'],
+        'learning_path': values['recs_and_path']['learning_path'],
+    }
+    if spans:
+        # Stage timings of this request, (stage, seconds) in the order they finished
+        result['timings'] = spans
+    if run_profile.paths:
+        result['profile'] = {'pstats': run_profile.paths[0], 'collapsed': run_profile.paths[1]}
+    return result
+
+class AnalysisService:
+    """
+    Runs skill-gap analyses in a pool of pre-warmed worker processes.
+    At most `workers` analyses run at once and at most `max_queue` more wait; beyond that
+    analyze() raises ServiceBusy immediately instead of queueing without bound. A request
+    that takes longer than its timeout raises ServiceTimeout; its worker finishes the work
+    in the background and still counts towards the limits until then.
+    The constructor waits until every worker is warm, and raises ServiceStartupError if a
+    worker fails to start or they are not all ready within startup_timeout seconds.
+    """
+    def __init__(self, workers=None, max_queue=MAX_QUEUE, timeout=REQUEST_TIMEOUT, startup_timeout=STARTUP_TIMEOUT):
+        self.workers = workers or os.cpu_count() or 1
+        self.max_queue = max_queue
+        self.timeout = timeout
+        self._lock = threading.Lock()
+        self._pending = 0
+        self._stats = {'completed': 0, 'failed': 0, 'rejected': 0, 'timed_out': 0}
+        started = Value('i', 0)
+        ready = Event()
+        error = Array('c', 1024)
+        self._pool = Pool(self.workers, initializer=_init_worker, initargs=(started, self.workers, ready, error))
+        # Wait until every worker has run its initializer, so the first requests are not slow.
+        # The pool would respawn a failing worker forever, so give up on the first failure.
+        if not ready.wait(startup_timeout):
+            self.close()
+            raise ServiceStartupError(f"Workers did not start within {startup_timeout} seconds.")
+        if error.value:
+            self.close()
+            raise ServiceStartupError(f"A worker failed to start: {error.value.decode('utf-8', 'replace')}")
+
+    def _finished(self, key):
+        with self._lock:
+            self._pending -= 1
+            self._stats[key] += 1
+
+    def _completed(self, result):
+        # Spans are recorded in the worker processes; fold them into this process's
+        # statistics so GET /metrics covers every request
+        for name, seconds in result.get('timings', ()):
+            metrics.record(name, seconds)
+        self._finished('completed')
+
+    def analyze(self, jd_text, resume_bytes=None, resume_text=None, timeout=None, profile=False):
+        """
+        Analyze a resume against a job description. The resume is an uploaded PDF/DOCX
+        (resume_bytes, format detected from the content) or plain text. Returns a dict with job_title,
+        resume_skills, jd_skills, comparison, recommendations and learning_path, plus timings
+        ((stage, seconds) spans) when metrics are enabled. With profile=True (or
+        SKILLSHIFT_PROFILE=1) the analysis is profiled and 'profile' has the paths of the
+        pstats and collapsed-stack files the worker wrote.
+        """
+        if not jd_text:
+            raise ValueError("jd_text is required.")
+        if resume_bytes is None and resume_text is None:
+            raise ValueError("Either resume_bytes or resume_text is required.")
+        request = {'jd_text': jd_text, 'resume_bytes': resume_bytes, 'resume_text': resume_text, 'profile': profile}
+        with self._lock:
+            if self._pending >= self.workers + self.max_queue:
+                self._stats['rejected'] += 1
+                raise ServiceBusy("Too many requests in progress.")
+            self._pending += 1
+        try:
+            result = self._pool.apply_async(
+                _analyze, (request,),
+                callback=self._completed,
+                error_callback=lambda _: self._finished('failed'),
+            )
+        except Exception:
+            self._finished('failed')
+            raise
+        try:
+            return result.get(timeout if timeout is not None else self.timeout)
+        except PoolTimeout:
+            with self._lock:
+                self._stats['timed_out'] += 1
+            raise ServiceTimeout("Analysis did not finish in time.")
+
+    def stats(self):
+        """Worker count, limits, requests currently running or queued, and outcome counters."""
+        with self._lock:
+            stats = dict(self._stats, pending=self._pending)
+        stats.update(workers=self.workers, max_queue=self.max_queue, timeout=self.timeout)
+        return stats
+
+    def close(self):
+        self._pool.terminate()
+        self._pool.join()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+def _request_from_json(body, query=None):
+    """Keyword arguments for AnalysisService.analyze from a JSON request body and URL query."""
+    kwargs = {'jd_text': body.get('jd_text'), 'resume_text': body.get('resume_text')}
+    if body.get('profile') or (query or {}).get('profile') == ['1']:
+        kwargs['profile'] = True
+    if body.get('resume_base64') is not None:
+        try:
+            kwargs['resume_bytes'] = base64.b64decode(body['resume_base64'], validate=True)
+        except (binascii.Error, TypeError):
+            raise ValueError("resume_base64 is not valid base64.")
+    if body.get('timeout') is not None:
+        kwargs['timeout'] = float(body['timeout'])
+    return kwargs
+
+class _Handler(BaseHTTPRequestHandler):
+    service = None
+
+    def _reply(self, status, payload, headers=(), content_type='application/json'):
+        data = payload.encode('utf-8') if isinstance(payload, str) else json.dumps(payload).encode('utf-8')
+        self.send_response(status)
+        self.send_header('Content-Type', content_type)
+        self.send_header('Content-Length', str(len(data)))
+        for name, value in headers:
+            self.send_header(name, value)
+        self.end_headers()
+        self.wfile.write(data)
+
+    def do_GET(self):
+        url = urlsplit(self.path)
+        if url.path == '/health':
+            self._reply(200, self.service.stats())
+        elif url.path == '/metrics':
+            if parse_qs(url.query).get('format') == ['json']:
+                self._reply(200, metrics.json_lines(), content_type='application/x-ndjson')
+            else:
+                self._reply(200, metrics.prometheus_text(), content_type='text/plain; version=0.0.4')
+        else:
+            self._reply(404, {'error': 'Not found.'})
+
+    def do_POST(self):
+        url = urlsplit(self.path)
+        if url.path != '/analyze':
+            self._reply(404, {'error': 'Not found.'})
+            return
+        length = int(self.headers.get('Content-Length') or 0)
+        if length > MAX_BODY_BYTES:
+            self._reply(413, {'error': 'Request body too large.'})
+            return
+        try:
+            body = json.loads(self.rfile.read(length) or b'{}')
+            if not isinstance(body, dict):
+                raise ValueError("Request body must be a JSON object.")
+            self._reply(200, self.service.analyze(**_request_from_json(body, parse_qs(url.query))))
+        except ServiceBusy as e:
+            self._reply(503, {'error': str(e)}, headers=[('Retry-After', '1')])
+        except ServiceTimeout as e:
+            self._reply(504, {'error': str(e)})
+        except ValueError as e:
+            self._reply(400, {'error': str(e)})
+        except Exception as e:
+            self._reply(500, {'error': f"Analysis failed: {e}"})
+
+    def log_message(self, format, *args):
+        pass
+
+def make_server(service, host='127.0.0.1', port=8080):
+    """
+    HTTP/JSON front end for a service:
+    POST /analyze with {"jd_text", and "resume_text" or "resume_base64"} (profiled with
+    "profile": true or /analyze?profile=1),
+    GET /health for the service stats,
+    GET /metrics for the stage timings (Prometheus text, or JSON lines with ?format=json).
+    """
+    handler = type('AnalysisHandler', (_Handler,), {'service': service})
+    server = ThreadingHTTPServer((host, port), handler)
+    server.daemon_threads = True
+    return server
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Run the SkillShift analysis service.")
+    parser.add_argument('--host', default='127.0.0.1')
+    parser.add_argument('--port', type=int, default=8080)
+    parser.add_argument('--workers', type=int, default=None, help="Worker processes (default: CPU count)")
+    parser.add_argument('--max-queue', type=int, default=MAX_QUEUE, help="Requests allowed to wait for a worker")
+    parser.add_argument('--timeout', type=float, default=REQUEST_TIMEOUT, help="Per-request timeout in seconds")
+    parser.add_argument('--startup-timeout', type=float, default=STARTUP_TIMEOUT, help="Seconds allowed for the workers to start")
+    parser.add_argument('--metrics', action='store_true', help="Record stage timings (same as SKILLSHIFT_METRICS=1)")
+    args = parser.parse_args(argv)
+
+    if args.metrics:
+        # Set before the pool starts so the worker processes record spans too
+        os.environ['SKILLSHIFT_METRICS'] = '1'
+        metrics.enable()
+
+    with AnalysisService(args.workers, args.max_queue, args.timeout, args.startup_timeout) as service:
+        server = make_server(service, args.host, args.port)
+        print(f"Serving on http://{args.host}:{args.port} with {service.workers} workers")
+        try:
+            server.serve_forever()
+        except KeyboardInterrupt:
+            pass
+        finally:
+            server.server_close()
+
+if __name__ == '__main__':
+    main()
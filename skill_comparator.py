@@ -1,36 +1,82 @@
 import difflib
+from collections import Counter
+from metrics import span, timed
+from skill_taxonomy import TAXONOMY
 
-def compare_skills(resume_skills, job_skills):
+# Minimum SequenceMatcher ratio for two different skills to count as a partial match
+PARTIAL_MATCH_THRESHOLD = 0.75
+
+@timed('skill_comparator.compare_skills')
+def compare_skills(resume_skills, job_skills, skill_index=None):
     """
     Compare resume and job description skills.
-    Returns a dict with 'present', 'missing', and 'partial' (empty for now).
+    Returns a dict with 'present', 'missing', and 'partial' ((resume_skill, job_skill) pairs
+    where a missing job skill is semantically close to a resume skill).
+    Aliases are compared and reported under their canonical name.
+    `skill_index` defaults to the shared embedding index, which only exists when a model is
+    configured (SKILLSHIFT_SKILL_ENCODER, see skill_embeddings.default_encoder); otherwise
+    'partial' stays empty. With a model configured, the first call in a process builds the
+    index and writes its files to SKILLSHIFT_CACHE_DIR (./.skillshift_cache by default).
     """
-    resume_set = set([s.lower() for s in resume_skills])
-    job_set = set([s.lower() for s in job_skills])
-    present = sorted(list(resume_set & job_set))
-    missing = sorted(list(job_set - resume_set))
-    partial = []  # Placeholder for future fuzzy/semantic matching
+    # Taxonomy skills are compared as bitsets; skills outside the taxonomy fall back to sets
+    resume_bits, resume_other = TAXONOMY.to_bits(resume_skills)
+    job_bits, job_other = TAXONOMY.to_bits(job_skills)
+    present = sorted(TAXONOMY.names(resume_bits & job_bits) + list(resume_other & job_other))
+    missing = sorted(TAXONOMY.names(job_bits & ~resume_bits) + list(job_other - resume_other))
+    resume_set = set(TAXONOMY.names(resume_bits)) | resume_other
+    partial = []
+    if missing and resume_set:
+        from skill_embeddings import get_default_skill_index, get_semantic_matches
+        if skill_index is None:
+            skill_index = get_default_skill_index()
+        if skill_index is not None:
+            with span('skill_comparator.semantic_matches'):
+                partial = get_semantic_matches(resume_set, missing, skill_index)
     return {
         'present': present,
         'missing': missing,
         'partial': partial
     }
 
+@timed('skill_comparator.partial_matches')
 def get_partial_matches(resume_skills, job_skills, max_distance=2):
     """
     Return pairs of (resume_skill, job_skill) that are similar but not exact matches (Levenshtein distance <= max_distance).
+    Job skills are indexed by length and character counts so that pairs which cannot reach
+    PARTIAL_MATCH_THRESHOLD are pruned before SequenceMatcher scores them.
     """
     from difflib import SequenceMatcher
     matches = []
     resume_set = set([s.lower() for s in resume_skills])
     job_set = set([s.lower() for s in job_skills])
+    # Index job skills by length, remembering their iteration order so the result
+    # comes out in the same order as a full resume x job scan
+    by_length = {}
+    for order, j in enumerate(job_set):
+        by_length.setdefault(len(j), []).append((order, j, Counter(j)))
+    lengths = sorted(by_length)
+    matcher = SequenceMatcher(None)
     for r in resume_set:
-        for j in job_set:
-            if r == j:
+        r_counts = None
+        scored = []
+        for length in lengths:
+            total = len(r) + length
+            # ratio = 2 * matched / total and matched <= the shorter length
+            if 2.0 * min(len(r), length) / total <= PARTIAL_MATCH_THRESHOLD:
                 continue
-            # Use SequenceMatcher ratio as a proxy for similarity
-            ratio = SequenceMatcher(None, r, j).ratio()
-            # Consider as partial match if ratio is high but not 1.0
-            if 0.75 < ratio < 1.0:
-                matches.append((r, j))
-    return matches 
\ No newline at end of file
+            if r_counts is None:
+                r_counts = Counter(r)
+            for order, j, j_counts in by_length[length]:
+                if r == j:
+                    continue
+                # Matched characters can never exceed the shared character counts
+                shared = sum((r_counts & j_counts).values())
+                if 2.0 * shared / total <= PARTIAL_MATCH_THRESHOLD:
+                    continue
+                matcher.set_seqs(r, j)
+                ratio = matcher.ratio()
+                # Consider as partial match if ratio is high but not 1.0
+                if PARTIAL_MATCH_THRESHOLD < ratio < 1.0:
+                    scored.append((order, j))
+        matches.extend((r, j) for _, j in sorted(scored))
+    return matches
@@ -0,0 +1,174 @@
+import json
+import os
+import re
+import threading
+import zlib
+import numpy as np
+from utils import COMMON_SKILLS, CACHE_DIR
+
+# Minimum cosine similarity for a missing job skill to count as partially covered by a resume skill
+SEMANTIC_MATCH_THRESHOLD = 0.6
+DEFAULT_INDEX_PATH = os.path.join(CACHE_DIR, 'skill_embeddings.npy')
+
+def _normalize(matrix):
+    norms = np.linalg.norm(matrix, axis=1, keepdims=True)
+    norms[norms == 0] = 1.0
+    return (matrix / norms).astype(np.float32)
+
+class HashingEncoder:
+    """
+    Deterministic, dependency-free encoder: hashed character trigrams, L2-normalized.
+    Needs no model download, so it is used for offline runs and tests.
+    """
+    def __init__(self, dim=256):
+        self.dim = dim
+        self.name = f"hashing-{dim}"
+
+    def encode(self, texts):
+        matrix = np.zeros((len(texts), self.dim), dtype=np.float32)
+        for row, text in enumerate(texts):
+            padded = f" {text.lower()} "
+            for i in range(len(padded) - 2):
+                matrix[row, zlib.crc32(padded[i:i + 3].encode('utf-8')) % self.dim] += 1.0
+        return _normalize(matrix)
+
+class SentenceTransformerEncoder:
+    """Encoder backed by a sentence-transformers model, loaded on first use."""
+    def __init__(self, model_name='all-MiniLM-L6-v2'):
+        self.model_name = model_name
+        self.name = f"sentence-transformers/{model_name}"
+        self._model = None
+
+    def encode(self, texts):
+        if self._model is None:
+            from sentence_transformers import SentenceTransformer
+            self._model = SentenceTransformer(self.model_name)
+        vectors = self._model.encode(list(texts), convert_to_numpy=True, normalize_embeddings=True)
+        return np.asarray(vectors, dtype=np.float32).reshape(len(texts), -1)
+
+class SkillIndex:
+    """A skill vocabulary and its normalized embedding matrix (one row per skill)."""
+    def __init__(self, skills, matrix, encoder):
+        self.skills = list(skills)
+        self.matrix = matrix
+        self.encoder = encoder
+        self._rows = {skill: i for i, skill in enumerate(self.skills)}
+
+    def vectors(self, skills):
+        """Embedding rows for the given skills; skills outside the vocabulary are encoded on the fly."""
+        keys = [s.lower() for s in skills]
+        unknown = sorted(set(k for k in keys if k not in self._rows))
+        encoded = dict(zip(unknown, self.encoder.encode(unknown))) if unknown else {}
+        if not keys:
+            return np.zeros((0, self.matrix.shape[1]), dtype=np.float32)
+        return np.stack([self.matrix[self._rows[k]] if k in self._rows else encoded[k] for k in keys])
+
+    def top_k(self, queries, k=3, candidates=None):
+        """
+        For each query skill, return the k most similar candidate skills as a list of
+        (candidate, score) pairs, best first. Candidates default to the whole vocabulary.
+        All queries are scored with a single matrix product.
+        """
+        if candidates is None:
+            candidates, candidate_matrix = self.skills, self.matrix
+        else:
+            candidates = [c.lower() for c in candidates]
+            candidate_matrix = self.vectors(candidates)
+        if not queries or not candidates:
+            return [[] for _ in queries]
+        scores = self.vectors(queries) @ np.asarray(candidate_matrix).T
+        k = min(k, len(candidates))
+        top = np.argpartition(-scores, k - 1, axis=1)[:, :k]
+        results = []
+        for row, columns in enumerate(top):
+            columns = columns[np.argsort(-scores[row, columns], kind='stable')]
+            results.append([(candidates[c], float(scores[row, c])) for c in columns])
+        return results
+
+def _meta_path(path):
+    return os.path.splitext(path)[0] + '.json'
+
+def build_skill_index(skills=COMMON_SKILLS, encoder=None, path=DEFAULT_INDEX_PATH):
+    """Encode the skill vocabulary once and save it as an .npy matrix plus a JSON sidecar."""
+    encoder = encoder or SentenceTransformerEncoder()
+    skills = sorted(set(s.lower() for s in skills))
+    matrix = _normalize(encoder.encode(skills))
+    os.makedirs(os.path.dirname(path) or '.', exist_ok=True)
+    # Write to temporary files first so concurrent readers never see a half-written index
+    tmp_path = f"{path}.{os.getpid()}.tmp"
+    with open(tmp_path, 'wb') as f:
+        np.save(f, matrix)
+    with open(tmp_path + '.json', 'w', encoding='utf-8') as f:
+        json.dump({'encoder': encoder.name, 'skills': skills}, f)
+    os.replace(tmp_path, path)
+    os.replace(tmp_path + '.json', _meta_path(path))
+    return load_skill_index(path, encoder)
+
+def load_skill_index(path=DEFAULT_INDEX_PATH, encoder=None):
+    """Load a saved index; the matrix is memory-mapped so processes share the pages read-only."""
+    encoder = encoder or SentenceTransformerEncoder()
+    with open(_meta_path(path), 'r', encoding='utf-8') as f:
+        meta = json.load(f)
+    if meta['encoder'] != encoder.name:
+        raise ValueError(f"Skill index at {path} was built with {meta['encoder']}, not {encoder.name}.")
+    matrix = np.load(path, mmap_mode='r')
+    return SkillIndex(meta['skills'], matrix, encoder)
+
+def get_skill_index(skills=COMMON_SKILLS, encoder=None, path=DEFAULT_INDEX_PATH):
+    """Load the index at `path` if it matches the vocabulary and encoder, otherwise (re)build it."""
+    encoder = encoder or SentenceTransformerEncoder()
+    try:
+        index = load_skill_index(path, encoder)
+        if index.skills == sorted(set(s.lower() for s in skills)):
+            return index
+    except (OSError, ValueError, KeyError):
+        pass
+    return build_skill_index(skills, encoder, path)
+
+def default_encoder():
+    """
+    Encoder for the process-wide index, or None when semantic matching is off (the default).
+    SKILLSHIFT_SKILL_ENCODER=sentence-transformers opts into the model, downloaded on first
+    use. HashingEncoder only measures spelling overlap, so it is never a default; pass it
+    explicitly (e.g. compare_skills(..., skill_index=...)) for offline runs and tests.
+    """
+    if os.getenv('SKILLSHIFT_SKILL_ENCODER', '') == 'sentence-transformers':
+        return SentenceTransformerEncoder()
+    return None
+
+def default_index_path(encoder):
+    """Index file for an encoder under CACHE_DIR, so indexes built by different encoders don't replace each other."""
+    name = re.sub(r'[^\w.-]+', '_', encoder.name)
+    return os.path.join(CACHE_DIR, f"skill_embeddings-{name}.npy")
+
+_default_index = None
+_default_index_lock = threading.Lock()
+
+def get_default_skill_index():
+    """
+    Process-wide index for COMMON_SKILLS with default_encoder(), built or loaded on first use
+    and saved under CACHE_DIR. Returns None if no encoder is configured, or if it is
+    unavailable (e.g. sentence-transformers is not installed or the model cannot be
+    downloaded), so callers can skip semantic matching.
+    """
+    global _default_index
+    with _default_index_lock:
+        if _default_index is None:
+            try:
+                encoder = default_encoder()
+                _default_index = get_skill_index(encoder=encoder, path=default_index_path(encoder)) if encoder else False
+            except Exception:
+                _default_index = False
+        return _default_index or None
+
+def get_semantic_matches(resume_skills, job_skills, skill_index, threshold=SEMANTIC_MATCH_THRESHOLD, k=3):
+    """
+    Return (resume_skill, job_skill) pairs where a job skill is not on the resume but a
+    resume skill is semantically close to it (cosine similarity >= threshold).
+    """
+    resume_set = sorted(set(s.lower() for s in resume_skills))
+    job_only = sorted(set(s.lower() for s in job_skills) - set(resume_set))
+    matches = []
+    for job_skill, neighbours in zip(job_only, skill_index.top_k(job_only, k=k, candidates=resume_set)):
+        matches.extend((resume_skill, job_skill) for resume_skill, score in neighbours if score >= threshold)
+    return matches
@@ -0,0 +1,96 @@
+# Canonical skills by category (user-provided and common variants). A skill may belong to several categories.
+SKILL_CATEGORIES = {
+    'Programming Languages': ['python', 'sql', 'r', 'javascript', 'xml', 'scala', 'bash'],
+    'Data Analysis & Reporting': ['excel', 'tableau', 'power bi', 'business objects', 'a/b testing', 'statistical analysis', 'spss', 'sas'],
+    'Databases': ['postgresql', 'sql server', 'mysql', 'mongodb', 'cassandra', 'snowflake', 'amazon aurora', 'oracle', 'hive'],
+    'ETL & Big Data Tools': ['apache spark', 'pyspark', 'hadoop', 'airflow', 'aws emr', 'aws s3', 'amazon aurora'],
+    'Frameworks & Libraries': ['pandas', 'numpy', 'scikit-learn', 'xgboost', 'tensorflow', 'pytorch', 'keras', 'transformers', 'clip', 'bert', 'u-net', 'opencv', 'nltk', 'spacy', 'mllib', 'prophet', 'arima', 'sarima'],
+    'Tools & Platforms': ['aws', 'git', 'gitlab', 'gitlab ci/cd', 'docker', 'jupyter', 'gradio', 'lucidchart', 'superset', 'looker', 'qgis', 'databricks', 'github', 'bitbucket', 'jenkins', 'jira'],
+    'Visualization & Dashboarding': ['tableau', 'power bi', 'excel (pivot tables, macros)', 'superset', 'looker'],
+    'Process Modeling & Documentation': ['lucidchart', 'youtrack', 'agile', 'scrum', 'business process mapping', 'cost-benefit analysis'],
+    'Machine Learning/AI': ['machine learning', 'deep learning', 'ml', 'ai', 'generative ai', 'nlp', 'drift detection', 'error analysis'],
+    'Cloud': ['azure', 'gcp', 'oci'],
+    'Other': ['object oriented programming', 'functional programming', 'quality assurance', 'data pipelines', 'model creation', 'production environments', 'data science', 'big data', 'data analysis', 'data scientist'],
+    'Soft Skills': ['communication', 'leadership', 'teamwork', 'problem solving', 'critical thinking', 'adaptability', 'creativity', 'time management', 'collaboration', 'project management', 'presentation', 'negotiation', 'empathy', 'organization'],
+}
+
+# Alternative spellings, mapped to their canonical skill
+SKILL_ALIASES = {
+    'scikit learn': 'scikit-learn',
+}
+
+def iter_ids(bits):
+    """Yield the skill IDs set in a bitset, lowest first."""
+    while bits:
+        lowest = bits & -bits
+        yield lowest.bit_length() - 1
+        bits ^= lowest
+
+def count_bits(bits):
+    return bin(bits).count('1')
+
+class SkillTaxonomy:
+    """
+    Canonical skills with integer IDs. A set of skills is an int bitset with bit `id` set
+    for each skill, so set algebra on skills is plain bitwise arithmetic.
+    """
+    def __init__(self, categories, aliases):
+        self.skills = []
+        self._ids = {}
+        self.category_masks = {}
+        for category, names in categories.items():
+            mask = 0
+            for name in names:
+                key = name.lower()
+                if key not in self._ids:
+                    self._ids[key] = len(self.skills)
+                    self.skills.append(key)
+                mask |= 1 << self._ids[key]
+            self.category_masks[category] = mask
+        for alias, canonical in aliases.items():
+            self._ids[alias.lower()] = self._ids[canonical.lower()]
+        self.aliases = {alias.lower(): canonical.lower() for alias, canonical in aliases.items()}
+
+    @property
+    def vocabulary(self):
+        """Every spelling the taxonomy recognizes: canonical names followed by aliases."""
+        return self.skills + list(self.aliases)
+
+    def id_of(self, skill):
+        """Integer ID of a skill or alias, or None if it is not in the taxonomy."""
+        return self._ids.get(skill.lower())
+
+    def canonical(self, skill):
+        """Canonical name for a skill or alias; unknown skills are returned lowercased."""
+        skill_id = self._ids.get(skill.lower())
+        return self.skills[skill_id] if skill_id is not None else skill.lower()
+
+    def to_bits(self, skills):
+        """Split skills into (bitset of taxonomy skills, set of lowercased unknown skills)."""
+        bits = 0
+        unknown = set()
+        for skill in skills:
+            skill_id = self._ids.get(skill.lower())
+            if skill_id is None:
+                unknown.add(skill.lower())
+            else:
+                bits |= 1 << skill_id
+        return bits, unknown
+
+    def names(self, bits):
+        """Canonical names of the skills in a bitset, sorted."""
+        return sorted(self.skills[skill_id] for skill_id in iter_ids(bits))
+
+    def mask_where(self, predicate):
+        """Bitset of all canonical skills whose name satisfies predicate."""
+        mask = 0
+        for skill_id, name in enumerate(self.skills):
+            if predicate(name):
+                mask |= 1 << skill_id
+        return mask
+
+    def categories_of(self, bits):
+        """Categories that share at least one skill with a bitset."""
+        return [category for category, mask in self.category_masks.items() if mask & bits]
+
+TAXONOMY = SkillTaxonomy(SKILL_CATEGORIES, SKILL_ALIASES)
@@ -0,0 +1,56 @@
+import os
+import sys
+import tempfile
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+import pytest
+
+# The modules live at the repository root; keep every cache the tests touch out of the
+# working tree, and make LLM replies come from the test's client rather than the cache
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+os.environ['SKILLSHIFT_CACHE_DIR'] = tempfile.mkdtemp(prefix='skillshift-tests-')
+os.environ['SKILLSHIFT_LLM_CACHE'] = '0'
+os.environ.pop('OPENAI_API_KEY', None)
+
+@pytest.fixture
+def local_server():
+    """
+    Start a local HTTP server: local_server(respond) returns its base URL, where
+    respond(method, path, body) returns (status, content_type, body bytes, delay seconds).
+    """
+    servers = []
+
+    def start(respond):
+        class Handler(BaseHTTPRequestHandler):
+            def _handle(self):
+                length = int(self.headers.get('Content-Length') or 0)
+                body = self.rfile.read(length) if length else b''
+                status, content_type, data, delay = respond(self.command, self.path, body)
+                if delay:
+                    time.sleep(delay)
+                try:
+                    self.send_response(status)
+                    self.send_header('Content-Type', content_type)
+                    self.send_header('Content-Length', str(len(data)))
+                    self.end_headers()
+                    self.wfile.write(data)
+                except OSError:
+                    # The client gave up waiting
+                    pass
+
+            do_GET = do_POST = _handle
+
+            def log_message(self, format, *args):
+                pass
+
+        server = ThreadingHTTPServer(('127.0.0.1', 0), Handler)
+        server.daemon_threads = True
+        threading.Thread(target=server.serve_forever, daemon=True).start()
+        servers.append(server)
+        return f"http://127.0.0.1:{server.server_address[1]}"
+
+    yield start
+    for server in servers:
+        server.shutdown()
+        server.server_close()
@@ -0,0 +1,53 @@
+import pytest
+import batch_extractor
+import parse_cache
+from batch_extractor import extract_skills_batch
+from utils import extract_skills_from_text
+
+TEXTS = [f"Engineer {i} with python, sql server and docker" if i % 2 else f"Analyst {i}: tableau, excel" for i in range(40)]
+
+@pytest.mark.parametrize('workers', [1, 2])
+def test_results_follow_input_order(workers):
+    results = list(extract_skills_batch(iter(TEXTS), workers=workers, chunksize=3))
+    assert results == [extract_skills_from_text(text) for text in TEXTS]
+
+def test_failed_items_raise_or_are_returned(tmp_path):
+    bad = tmp_path / 'resume.xlsx'
+    bad.write_bytes(b'\x00\xff binary')
+    missing = str(tmp_path / 'missing.pdf')
+    results = list(extract_skills_batch([str(bad), missing], mode='resume', workers=2, return_exceptions=True))
+    assert isinstance(results[0], ValueError) and isinstance(results[1], FileNotFoundError)
+    with pytest.raises(FileNotFoundError):
+        list(extract_skills_batch([missing], mode='job', workers=1))
+
+def test_job_files_are_parsed(tmp_path):
+    path = tmp_path / 'jd.txt'
+    path.write_text("Data engineer with airflow and python", encoding='utf-8')
+    [(text, skills)] = extract_skills_batch([str(path)], mode='job', workers=1)
+    assert text.startswith("Data engineer") and skills == ['airflow', 'python']
+
+def test_rejects_bad_arguments_when_called():
+    with pytest.raises(ValueError):
+        extract_skills_batch(TEXTS, mode='cover-letter')
+    with pytest.raises(ValueError):
+        extract_skills_batch(TEXTS, workers=0)
+    with pytest.raises(ValueError):
+        extract_skills_batch(TEXTS, chunksize=0)
+
+def test_inline_batches_do_not_interfere(tmp_path):
+    path = tmp_path / 'jd.txt'
+    path.write_text("Data engineer with airflow", encoding='utf-8')
+    texts = extract_skills_batch(["python sql", "docker aws"], mode='text', workers=1)
+    assert next(texts) == ['python', 'sql']
+    jobs = extract_skills_batch([str(path)], mode='job', workers=1)
+    assert next(jobs)[1] == ['airflow']
+    assert next(texts) == ['aws', 'docker']
+
+def test_pool_workers_reopen_the_parse_cache(monkeypatch):
+    inherited = object()
+    monkeypatch.setattr(parse_cache, '_default_cache', inherited)
+    monkeypatch.setattr(batch_extractor, '_inherited_parse_cache', None)
+    monkeypatch.setattr(batch_extractor, '_worker_mode', None)
+    batch_extractor._init_worker('job')
+    assert parse_cache._default_cache is None
+    assert batch_extractor._inherited_parse_cache is inherited
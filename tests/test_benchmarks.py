@@ -0,0 +1,44 @@
+import pytest
+from benchmarks import corpus, suite
+from resume_parser import parse_resume
+from skill_taxonomy import TAXONOMY
+from utils import extract_job_title, extract_skills_from_text
+
+def test_corpus_is_deterministic_and_sized():
+    jd = corpus.make_job_description(4, density=0.1, seed=3)
+    assert jd == corpus.make_job_description(4, density=0.1, seed=3)
+    assert jd != corpus.make_job_description(4, density=0.1, seed=4)
+    assert 4 * 1024 <= len(jd) < 6 * 1024
+    assert extract_job_title(jd) in corpus.TITLES
+    lists = corpus.make_skill_lists(20, seed=1)
+    assert lists == corpus.make_skill_lists(20, seed=1)
+    assert all(5 <= len(skills) <= 30 for skills in lists)
+
+def test_density_controls_skill_mentions():
+    sparse = corpus.make_job_description(16, density=0.02)
+    dense = corpus.make_job_description(16, density=0.1)
+    assert len(extract_skills_from_text(dense)) >= len(extract_skills_from_text(sparse)) > 0
+
+def test_synthetic_resumes_have_a_skills_section():
+    lines = corpus.resume_lines(2, seed=5)
+    listed = {s.strip() for line in lines[2:4] for s in line.split(':', 1)[1].split(',')}
+    for data in (corpus.make_resume_pdf(2, seed=5), corpus.make_resume_docx(2, seed=5)):
+        _, skills, raw = parse_resume(data, use_cache=False)
+        assert raw is not None
+        assert set(skills) <= listed <= set(TAXONOMY.skills)
+
+def test_summary_and_regression_comparison():
+    result = suite.summarize('case', {'size_kb': 1}, [0.001, 0.002, 0.003, 0.004], size_bytes=1024)
+    assert result['runs'] == 4 and result['p50_ms'] == pytest.approx(2.5)
+    assert result['ops_per_s'] == pytest.approx(400) and result['kb_per_s'] == pytest.approx(400)
+    baseline = {'results': [result, dict(result, name='other')]}
+    current = {'results': [dict(result, p50_ms=3.5), dict(result, name='other', p50_ms=2.6), dict(result, name='new')]}
+    regressions = suite.compare(baseline, current, threshold=0.2)
+    assert [(key[0], round(change, 2)) for key, _, _, change in regressions] == [('case', 0.4)]
+
+def test_quick_run_of_selected_cases(monkeypatch):
+    monkeypatch.setattr(suite, 'MIN_SECONDS', 0.01)
+    result = suite.run(quick=True, only=['extract_job_title'])
+    assert {r['name'] for r in result['results']} == {'extract_job_title'}
+    assert len(result['results']) == len(suite.QUICK_SIZES_KB) * len(suite.DENSITIES)
+    assert result['meta']['quick'] is True
@@ -0,0 +1,49 @@
+import json
+import os
+import zipfile
+import pytest
+import bulk_reports
+from bulk_reports import generate_reports_bulk, report_arguments
+
+def _results(count):
+    return [{
+        'name': f"candidate {i % 3}",
+        'comparison': {'present': ['python'], 'missing': ['docker']},
+        'learning_path': [f"Step {i}"],
+        'feedback': "Feedback",
+        'resume_text': "Resume", 'jd_text': "JD",
+    } for i in range(count)]
+
+def test_service_results_map_to_report_arguments():
+    arguments = report_arguments(_results(1)[0])
+    assert arguments['present_skills'] == ['python'] and arguments['missing_skills'] == ['docker']
+    assert arguments['ai_feedback'] == "Feedback" and arguments['role_advice'] == ''
+    assert report_arguments({'present_skills': ['sql']})['present_skills'] == ['sql']
+
+@pytest.mark.parametrize('workers', [1, 2])
+def test_reports_stream_into_a_zip(tmp_path, workers):
+    progress = []
+    output = str(tmp_path / 'reports.zip')
+    summary = generate_reports_bulk(_results(7), output, workers=workers, chunksize=2,
+                                    progress=lambda done, total: progress.append((done, total)))
+    assert summary == {'written': 7, 'failed': [], 'output': output}
+    assert progress == [(i, 7) for i in range(1, 8)]
+    with zipfile.ZipFile(output) as archive:
+        names = sorted(archive.namelist())
+        assert all(archive.read(name).startswith(b'%PDF') for name in names)
+    assert names == sorted(['candidate_0.pdf', 'candidate_1.pdf', 'candidate_2.pdf', 'candidate_0_2.pdf',
+                            'candidate_1_2.pdf', 'candidate_2_2.pdf', 'candidate_0_3.pdf'])
+
+def test_failed_reports_are_listed_and_the_rest_written(tmp_path):
+    results = [{'learning_path': None}, {'name': '../escape.pdf'}, {}]
+    summary = generate_reports_bulk(iter(results), str(tmp_path / 'out'), workers=1)
+    assert summary['written'] == 2
+    assert [name for name, _ in summary['failed']] == ['report_00001.pdf']
+    assert summary['failed'][0][1].startswith('TypeError')
+    assert sorted(os.listdir(tmp_path / 'out')) == ['escape.pdf', 'report_00003.pdf']
+
+def test_main_reads_json_lines(tmp_path, capsys):
+    source = tmp_path / 'results.jsonl'
+    source.write_text('\n'.join(json.dumps(r) for r in _results(2)) + '\n', encoding='utf-8')
+    bulk_reports.main([str(source), str(tmp_path / 'reports.zip'), '--workers', '1'])
+    assert "Wrote 2 reports" in capsys.readouterr().out
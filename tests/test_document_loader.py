@@ -0,0 +1,50 @@
+import io
+import zipfile
+import pytest
+from document_loader import detect_format, load_document
+from job_parser import parse_job_description
+from resume_parser import parse_resume
+
+def _docx_bytes(text):
+    import docx
+    document = docx.Document()
+    document.add_paragraph(text)
+    buffer = io.BytesIO()
+    document.save(buffer)
+    return buffer.getvalue()
+
+def _zip_bytes(name):
+    buffer = io.BytesIO()
+    with zipfile.ZipFile(buffer, 'w') as archive:
+        archive.writestr(name, '<workbook/>')
+    return buffer.getvalue()
+
+def test_detects_pdf_docx_and_text():
+    assert detect_format(b'%PDF-1.4\n...') == 'pdf'
+    assert detect_format(_docx_bytes("Skills: Python")) == 'docx'
+    assert detect_format("Data engineer – Python".encode('utf-8')) == 'txt'
+    assert detect_format(b'\xff\xfe\x00binary') is None
+
+def test_other_zip_archives_are_not_docx():
+    xlsx = _zip_bytes('xl/workbook.xml')
+    assert detect_format(xlsx) is None
+    assert detect_format(memoryview(xlsx)) is None
+    # Truncated archive: ZIP magic without a readable directory
+    assert detect_format(b'PK\x03\x04' + b'\x00' * 40) is None
+    with pytest.raises(ValueError):
+        parse_job_description(xlsx, use_cache=False)
+    with pytest.raises(ValueError):
+        parse_resume(xlsx, use_cache=False)
+
+def test_loads_paths_bytes_and_file_objects(tmp_path):
+    data = _docx_bytes("Skills: Python")
+    path = tmp_path / 'resume.docx'
+    path.write_bytes(data)
+    assert load_document(str(path)) == data
+    assert load_document(path) == data
+    assert load_document(io.BytesIO(data)) == data
+    view = memoryview(data)
+    assert load_document(view) is view
+    assert detect_format(view) == 'docx'
+    with pytest.raises(TypeError):
+        load_document(42)
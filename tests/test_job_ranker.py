@@ -0,0 +1,53 @@
+import random
+import pytest
+import job_ranker
+from job_ranker import JobRanker, rank_matches
+from skill_taxonomy import TAXONOMY
+
+def _brute_force(queries, targets, k, by, queries_are_resumes):
+    results = []
+    for query in queries:
+        query_keys = {TAXONOMY.canonical(s) for s in query}
+        scored = []
+        for index, target in enumerate(targets):
+            target_keys = {TAXONOMY.canonical(s) for s in target}
+            matched = len(query_keys & target_keys)
+            query_share = matched / len(query_keys) if query_keys else 0.0
+            target_share = matched / len(target_keys) if target_keys else 0.0
+            coverage, relevance = (target_share, query_share) if queries_are_resumes else (query_share, target_share)
+            primary, secondary = (coverage, relevance) if by == 'coverage' else (relevance, coverage)
+            scored.append(((-primary, -secondary, index), (index, matched)))
+        results.append([pair for _, pair in sorted(scored)[:k]])
+    return results
+
+def _skill_sets(rng, count):
+    vocabulary = TAXONOMY.vocabulary + ['rust', 'Kotlin', 'terraform']
+    return [[rng.choice(vocabulary) for _ in range(rng.randint(0, 8))] for _ in range(count)]
+
+@pytest.mark.parametrize('by', ['coverage', 'relevance'])
+def test_matches_brute_force(monkeypatch, by):
+    # Small chunks, so results crossing chunk boundaries are covered too
+    monkeypatch.setattr(job_ranker, 'CHUNK_ROWS', 7)
+    rng = random.Random(7)
+    resumes, jobs = _skill_sets(rng, 30), _skill_sets(rng, 40)
+    for per, queries, targets in (('resume', resumes, jobs), ('job', jobs, resumes)):
+        results = rank_matches(resumes, jobs, k=5, per=per, by=by)
+        expected = _brute_force(queries, targets, 5, by, per == 'resume')
+        assert [[(m.index, m.matched) for m in matches] for matches in results] == expected
+
+def test_scores_aliases_and_unknown_skills():
+    ranker = JobRanker([['python', 'scikit-learn'], ['rust', 'sql'], []])
+    assert len(ranker) == 3
+    matches = ranker.rank_jobs([['Python', 'scikit learn', 'go']], k=3)[0]
+    assert [m.index for m in matches] == [0, 1, 2]
+    assert matches[0].coverage == 1.0 and matches[0].relevance == pytest.approx(2 / 3)
+    assert matches[0].matched == 2 and matches[2].coverage == 0.0
+    assert ranker.rank_jobs([['RUST']], k=1)[0][0].index == 1
+
+def test_rejects_bad_arguments():
+    with pytest.raises(ValueError):
+        rank_matches([['python']], [['python']], k=0)
+    with pytest.raises(ValueError):
+        rank_matches([['python']], [['python']], by='salary')
+    with pytest.raises(ValueError):
+        rank_matches([['python']], [['python']], per='team')
@@ -0,0 +1,94 @@
+from collections import Counter
+import pytest
+import job_store
+from job_store import JobStore
+from utils import keyword_terms
+
+POSTINGS = [
+    ("Data engineer building pipelines with python and airflow", ['Python', 'airflow']),
+    ("Analyst reporting with sql and tableau", ['SQL', 'tableau', 'excel']),
+    ("Machine learning engineer using python and scikit learn", ['python', 'scikit learn']),
+]
+
+@pytest.fixture
+def store(tmp_path):
+    store = JobStore(str(tmp_path / 'store.sqlite'))
+    yield store
+    store.close()
+
+def _expected_terms(texts):
+    counts = Counter()
+    for text in texts:
+        counts.update(set(keyword_terms(text)))
+    return dict(counts)
+
+def test_add_indexes_canonical_skills_and_dedupes(store):
+    ids = [store.add_text(text, title=f"Job {i}", skills=skills) for i, (text, skills) in enumerate(POSTINGS)]
+    assert ids == sorted(ids) and len(store) == 3
+    assert store.add_text(POSTINGS[0][0], skills=['docker']) == ids[0]
+    assert len(store) == 3
+    posting = store.get(ids[2])
+    assert posting.title == "Job 2" and posting.skills == ['python', 'scikit-learn']
+    assert store.text(ids[1]) == POSTINGS[1][0]
+    assert store.postings_needing('PYTHON') == [ids[0], ids[2]]
+    assert store.postings_needing('scikit learn') == [ids[2]]
+    assert store.postings_needing('rust') == []
+
+def test_remove_keeps_terms_and_index_consistent(store):
+    ids = [store.add_text(text, skills=skills) for text, skills in POSTINGS]
+    assert store.term_statistics() == (3, _expected_terms(text for text, _ in POSTINGS))
+    assert store.remove(ids[0]) is True
+    assert store.remove(ids[0]) is False
+    assert store.get(ids[0]) is None and store.text(ids[0]) is None
+    assert store.postings_needing('airflow') == []
+    assert store.postings_needing('python') == [ids[2]]
+    assert store.term_statistics() == (2, _expected_terms(text for text, _ in POSTINGS[1:]))
+    # IDs are not reused after a removal
+    assert store.add_text(POSTINGS[0][0], skills=POSTINGS[0][1]) > ids[2]
+    assert store.term_statistics() == (3, _expected_terms(text for text, _ in POSTINGS))
+
+def test_best_postings_by_coverage_and_relevance(store):
+    ids = [store.add_text(text, skills=skills) for text, skills in POSTINGS]
+    resume = ['python', 'airflow', 'sql']
+    by_coverage = store.best_postings(resume)
+    assert [(m.id, m.matched) for m in by_coverage] == [(ids[0], 2), (ids[2], 1), (ids[1], 1)]
+    assert by_coverage[0].coverage == 1.0 and by_coverage[0].relevance == pytest.approx(2 / 3)
+    assert by_coverage[1].coverage == 0.5 and by_coverage[2].coverage == pytest.approx(1 / 3)
+    by_relevance = store.best_postings(resume, k=2, by='relevance')
+    # Equal relevance falls back to coverage
+    assert [m.id for m in by_relevance] == [ids[0], ids[2]]
+    assert store.best_postings([]) == [] and store.best_postings(['rust']) == []
+    with pytest.raises(ValueError):
+        store.best_postings(resume, by='salary')
+
+def test_subscribers_and_changes_follow_every_posting(store):
+    events = []
+    store.subscribe(lambda event, text, change: events.append((event, text, change)))
+    before = store.changes()
+    posting_id = store.add_text(POSTINGS[0][0], skills=POSTINGS[0][1])
+    store.add_text(POSTINGS[0][0], skills=POSTINGS[0][1])
+    store.remove(posting_id)
+    store.remove(posting_id)
+    assert events == [('add', POSTINGS[0][0], 1), ('remove', POSTINGS[0][0], 2)]
+    assert store.changes()[0] == 2 and store.changes() != before
+
+def test_terms_are_backfilled_for_older_stores(tmp_path):
+    path = str(tmp_path / 'old.sqlite')
+    store = JobStore(path)
+    for text, skills in POSTINGS:
+        store.add_text(text, skills=skills)
+    store._conn.execute("DELETE FROM terms")
+    store.close()
+    reopened = JobStore(path)
+    assert reopened.term_statistics() == (3, _expected_terms(text for text, _ in POSTINGS))
+    reopened.close()
+
+def test_main_adds_files(tmp_path, capsys):
+    path = tmp_path / 'jd.txt'
+    path.write_text(POSTINGS[0][0], encoding='utf-8')
+    store_path = str(tmp_path / 'cli.sqlite')
+    job_store.main([str(path), '--path', store_path])
+    assert "1 postings" in capsys.readouterr().out
+    store = JobStore(store_path)
+    assert store.postings_needing('python') == [1]
+    store.close()
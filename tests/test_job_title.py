@@ -0,0 +1,13 @@
+from utils import extract_job_title
+
+def test_job_title_priorities():
+    assert extract_job_title("Acme Analytics\nJob Title: Senior Data Engineer\nWe need a Software Engineer") == "Senior Data Engineer"
+    assert extract_job_title("Our Product Manager team is hiring a Lead Data Scientist to join") == "Lead Data Scientist"
+    assert extract_job_title("Report to the Engineering Director. Python required.") == "Engineering Director"
+    assert extract_job_title("Great opportunity: Lead Product Manager wanted") == "Lead Product Manager"
+    assert extract_job_title("experience as a scrum master preferred") == "Scrum Master"
+    assert extract_job_title("python, sql, docker") == "Professional Role"
+
+def test_job_title_scan_stays_linear_on_long_text():
+    text = "word " * 200000 + "\nTitle: Data Engineer"
+    assert extract_job_title(text) == "Data Engineer"
@@ -0,0 +1,108 @@
+import math
+from collections import Counter
+import pytest
+import job_store
+import keyword_engine
+from job_store import JobStore
+from keyword_engine import KeywordEngine, get_keyword_engine, keyword_corpus_version
+from pipeline import run_stage
+from utils import keyword_terms
+
+CORPUS = [
+    "Data engineer building data pipelines with spark and airflow",
+    "Data analyst reporting with sql and tableau dashboards",
+    "Data scientist training models with python and pytorch",
+]
+
+def _brute_force(corpus, text, k):
+    df = Counter()
+    for document in corpus:
+        df.update(set(keyword_terms(document)))
+    terms = keyword_terms(text)
+    first = {}
+    for i, term in enumerate(terms):
+        first.setdefault(term, i)
+    scores = {t: c * (math.log((1 + len(corpus)) / (1 + df[t])) + 1) for t, c in Counter(terms).items()}
+    return [t for t, _ in sorted(scores.items(), key=lambda item: (-item[1], first[item[0]]))][:k]
+
+@pytest.fixture
+def engine():
+    engine = KeywordEngine()
+    for document in CORPUS:
+        engine.add_document(document)
+    return engine
+
+def test_common_terms_rank_below_specific_ones(engine):
+    keywords = engine.top_keywords("Data engineer with kafka pipelines", k=3)
+    assert keywords == ['kafka', 'engineer', 'pipelines']
+
+def test_matches_brute_force_tf_idf(engine):
+    texts = CORPUS + ["Spark spark sql python kafka data data data", "Nothing but the and of"]
+    expected = [_brute_force(CORPUS, text, 4) for text in texts]
+    assert engine.top_keywords_batch(texts, k=4) == expected
+    assert expected[-1] == ['nothing']
+
+def test_ties_keep_order_of_first_use():
+    engine = KeywordEngine()
+    assert engine.top_keywords("zeta alpha mango zeta alpha mango kiwi", k=3) == ['zeta', 'alpha', 'mango']
+    assert engine.top_keywords("", k=3) == []
+    with pytest.raises(ValueError):
+        engine.top_keywords("zeta", k=0)
+
+def test_remove_document_undoes_add(engine):
+    before = engine.idf().copy()
+    engine.add_document("kafka streams engineer")
+    engine.remove_document("kafka streams engineer")
+    assert engine.documents == len(CORPUS)
+    assert (engine.idf()[:len(before)] == before).all()
+
+def test_from_store_matches_documents_added_one_by_one(tmp_path, engine):
+    store = JobStore(str(tmp_path / 'store.sqlite'))
+    for document in CORPUS:
+        store.add_text(document)
+    loaded = KeywordEngine.from_store(store)
+    text = "Data engineer with kafka and data pipelines"
+    assert loaded.documents == engine.documents
+    assert loaded.top_keywords(text) == engine.top_keywords(text)
+    store.close()
+
+@pytest.fixture
+def default_store(tmp_path, monkeypatch):
+    store = JobStore(str(tmp_path / 'default.sqlite'))
+    monkeypatch.setattr(job_store, '_default_store', store)
+    monkeypatch.setattr(keyword_engine, '_default_engine', None)
+    monkeypatch.setattr(keyword_engine, '_subscribed_store', None)
+    yield store
+    store.close()
+
+def test_default_engine_applies_store_changes_incrementally(default_store, monkeypatch):
+    default_store.add_text(CORPUS[0])
+    engine = get_keyword_engine()
+    assert engine.documents == 1
+    monkeypatch.setattr(KeywordEngine, 'from_store', classmethod(lambda cls, store: pytest.fail("reloaded")))
+    posting_id = default_store.add_text(CORPUS[1])
+    assert get_keyword_engine() is engine and engine.documents == 2
+    default_store.remove(posting_id)
+    assert get_keyword_engine() is engine and engine.documents == 1
+
+def test_default_engine_reloads_after_another_connection_writes(default_store):
+    engine = get_keyword_engine()
+    other = JobStore(default_store.path)
+    other.add_text(CORPUS[2])
+    other.close()
+    reloaded = get_keyword_engine()
+    assert reloaded is not engine and reloaded.documents == 1
+
+def test_keywords_stage_is_recomputed_when_the_store_changes(default_store):
+    memo = {}
+    text = "Data engineer with spark pipelines"
+    values = {'jd_text': text, 'keyword_corpus': keyword_corpus_version()}
+    first = run_stage('keywords', values, memo)
+    assert first['keyword_corpus_size'] == 0
+    assert first['top_keywords'][0] == 'data'
+    for document in CORPUS:
+        default_store.add_text(document)
+    values = {'jd_text': text, 'keyword_corpus': keyword_corpus_version()}
+    second = run_stage('keywords', values, memo)
+    assert second['keyword_corpus_size'] == len(CORPUS)
+    assert second['top_keywords'][0] == 'engineer'
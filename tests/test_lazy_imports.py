@@ -0,0 +1,19 @@
+import json
+import subprocess
+import sys
+import pytest
+from benchmarks.import_budget import BUDGETS_MS, HEAVY_MODULES, ROOT, app_heavy_imports
+
+@pytest.mark.parametrize('module', sorted(BUDGETS_MS))
+def test_modules_defer_heavy_dependencies(module):
+    # Timing is left to benchmarks/import_budget.py; only what gets loaded is checked here
+    probe = f"import sys, json, {module}; print(json.dumps(sorted(m for m in {HEAVY_MODULES!r} if m in sys.modules)))"
+    proc = subprocess.run([sys.executable, '-c', probe], cwd=ROOT, capture_output=True, text=True, timeout=60)
+    assert proc.returncode == 0, proc.stderr
+    assert json.loads(proc.stdout.strip().splitlines()[-1]) == []
+
+def test_app_imports_no_heavy_module_at_top_level(tmp_path):
+    assert app_heavy_imports() == []
+    script = tmp_path / 'app.py'
+    script.write_text("import os\nimport plotly.express as px\nfrom numpy import array\ndef f():\n    import pandas\n")
+    assert app_heavy_imports(str(script)) == ['plotly.express', 'numpy']
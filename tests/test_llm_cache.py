@@ -0,0 +1,57 @@
+import json
+import openai
+import pytest
+import llm_cache
+import recommender
+from llm_cache import LLMResponseCache, normalize_prompt
+
+def test_prompts_differing_in_whitespace_share_an_entry(tmp_path):
+    cache = LLMResponseCache(str(tmp_path / 'llm.sqlite'))
+    assert normalize_prompt("\n    Analyze\tthis   resume\n") == "Analyze this resume"
+    cache.put('gpt', "Analyze this\n    resume", 100, "reply")
+    assert cache.get('gpt', "  Analyze  this resume ", 100) == "reply"
+    assert cache.get('other-model', "Analyze this resume", 100) is None
+    assert cache.get('gpt', "Analyze this resume", 200) is None
+    assert cache.get('gpt', "Analyze that resume", 100) is None
+    assert cache.stats() == {'hits': 1, 'misses': 3, 'hit_rate': 0.25}
+
+def test_entries_expire_and_are_bounded(tmp_path, monkeypatch):
+    clock = [1000.0]
+    monkeypatch.setattr('cache_store.time.time', lambda: clock[0])
+    cache = LLMResponseCache(str(tmp_path / 'llm.sqlite'), ttl=60, max_entries=2)
+    cache.put('gpt', 'one', 10, 'first')
+    clock[0] += 1
+    cache.put('gpt', 'two', 10, 'second')
+    clock[0] += 1
+    assert cache.get('gpt', 'one', 10) == 'first'
+    clock[0] += 1
+    cache.put('gpt', 'three', 10, 'third')
+    # 'two' was used least recently
+    assert cache.get('gpt', 'two', 10) is None
+    assert cache.get('gpt', 'one', 10) == 'first'
+    clock[0] += 61
+    assert cache.get('gpt', 'three', 10) is None
+
+@pytest.fixture
+def counting_llm(local_server, tmp_path, monkeypatch):
+    """Cache enabled at a temporary path, and an injected client whose requests are counted."""
+    monkeypatch.setenv('SKILLSHIFT_LLM_CACHE', '1')
+    monkeypatch.setattr(llm_cache, '_default_cache', LLMResponseCache(str(tmp_path / 'llm.sqlite')))
+    requests = []
+    def handle(method, path, body):
+        requests.append(json.loads(body)['messages'][0]['content'])
+        reply = {
+            'id': 'chatcmpl-test', 'object': 'chat.completion', 'created': 0, 'model': recommender.LLM_MODEL,
+            'choices': [{'index': 0, 'message': {'role': 'assistant', 'content': f" reply {len(requests)} "},
+                         'finish_reason': 'stop'}],
+        }
+        return 200, 'application/json', json.dumps(reply).encode('utf-8'), 0
+    recommender.set_openai_client(openai.OpenAI(api_key='test', base_url=local_server(handle) + '/v1', max_retries=0))
+    yield requests
+    recommender.set_openai_client(None)
+
+def test_repeated_requests_are_served_from_the_cache(counting_llm):
+    assert recommender._chat_completion("Suggest projects\n  for python", 50) == "reply 1"
+    assert recommender._chat_completion("Suggest projects for python", 50) == "reply 1"
+    assert recommender._chat_completion("Suggest projects for python", 80) == "reply 2"
+    assert len(counting_llm) == 2
@@ -0,0 +1,59 @@
+import asyncio
+import json
+import time
+import openai
+import pytest
+import recommender
+
+def _completion(content):
+    return json.dumps({
+        'id': 'chatcmpl-test', 'object': 'chat.completion', 'created': 0, 'model': recommender.LLM_MODEL,
+        'choices': [{'index': 0, 'message': {'role': 'assistant', 'content': content}, 'finish_reason': 'stop'}],
+    }).encode('utf-8')
+
+@pytest.fixture
+def stub_llm(local_server):
+    """
+    Inject an OpenAI client pointed at a local stub of the chat completions endpoint.
+    `delays` maps a word in the prompt to how long the stub waits before answering.
+    """
+    def use(delays):
+        def handle(method, path, body):
+            prompt = json.loads(body)['messages'][0]['content']
+            kind = 'advice' if 'career coach specializing' in prompt else 'feedback' if 'resume reviewer' in prompt else 'projects'
+            return 200, 'application/json', _completion(f"stub {kind}"), delays.get(kind, 0)
+        client = openai.OpenAI(api_key='test', base_url=local_server(handle) + '/v1', max_retries=0)
+        recommender.set_openai_client(client)
+    yield use
+    recommender.set_openai_client(None)
+
+def _outputs(**kwargs):
+    return asyncio.run(recommender.generate_llm_outputs_async(
+        'Resume text', 'Job description text', ['python', 'docker'], 'Data Engineer', **kwargs))
+
+def test_fast_calls_return_stub_text(stub_llm):
+    stub_llm({})
+    outputs = _outputs()
+    assert outputs == {'feedback': 'stub feedback', 'advice': 'stub advice'}
+
+def test_call_timeout_falls_back_per_call(stub_llm):
+    stub_llm({'advice': 3})
+    started = time.perf_counter()
+    outputs = _outputs(call_timeout=0.5, deadline=10)
+    assert time.perf_counter() - started < 2
+    assert outputs['feedback'] == 'stub feedback'
+    assert outputs['advice'] == recommender._role_advice_placeholder(['python', 'docker'], 'Data Engineer')
+
+def test_deadline_falls_back_for_unfinished_calls(stub_llm):
+    stub_llm({'feedback': 3})
+    started = time.perf_counter()
+    outputs = _outputs(call_timeout=10, deadline=0.5)
+    assert time.perf_counter() - started < 2
+    assert outputs['advice'] == 'stub advice'
+    assert outputs['feedback'] == recommender._feedback_placeholder(['python', 'docker'])
+
+def test_project_ideas_use_the_stub(stub_llm, monkeypatch):
+    stub_llm({})
+    monkeypatch.setattr(recommender, 'search_real_projects', lambda *args: 'real projects')
+    outputs = _outputs(include_projects=True)
+    assert outputs['projects'] == 'stub projects\n\nreal projects'
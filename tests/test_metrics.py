@@ -0,0 +1,57 @@
+import contextvars
+import json
+from concurrent.futures import ThreadPoolExecutor
+import pytest
+import metrics
+
+@pytest.fixture
+def registry(monkeypatch):
+    monkeypatch.setattr(metrics, '_enabled', False)
+    metrics.reset()
+    yield
+    metrics.reset()
+
+@metrics.timed('test.work')
+def _work(value):
+    return value * 2
+
+def test_collector_records_its_context_only(registry):
+    assert metrics.span('test.idle') is metrics._NO_SPAN
+    with metrics.collect() as spans:
+        assert _work(2) == 4
+        with metrics.span('test.block'):
+            pass
+        with ThreadPoolExecutor(2) as executor:
+            # Threads see the collector only when they run in a copy of this context
+            executor.submit(contextvars.copy_context().run, _work, 1).result()
+            executor.submit(_work, 1).result()
+    assert [name for name, _ in spans] == ['test.work', 'test.block', 'test.work']
+    assert all(seconds >= 0 for _, seconds in spans)
+    _work(3)
+    assert len(spans) == 3
+    # Disabled metrics leave the process-wide statistics untouched
+    assert metrics.snapshot() == {}
+
+def test_breakdown_orders_stages_by_total_time():
+    rows = metrics.breakdown([('a', 0.1), ('b', 0.5), ('a', 0.3)])
+    assert [(r['stage'], r['count']) for r in rows] == [('b', 1), ('a', 2)]
+    assert rows[1]['total_s'] == pytest.approx(0.4) and rows[1]['max_s'] == 0.3
+
+def test_enabled_metrics_export_histograms(registry, tmp_path):
+    metrics.enable()
+    log_path = tmp_path / 'spans.jsonl'
+    metrics.log_spans(str(log_path))
+    try:
+        metrics.record('test.parse', 0.003)
+        metrics.record('test.parse', 0.2)
+        metrics.record('test.parse', 100.0)
+    finally:
+        metrics.log_spans(None)
+    stage = metrics.snapshot()['test.parse']
+    assert stage['count'] == 3 and stage['max'] == 100.0
+    text = metrics.prometheus_text()
+    assert 'skillshift_stage_seconds_bucket{stage="test.parse",le="0.005"} 1' in text
+    assert 'skillshift_stage_seconds_bucket{stage="test.parse",le="30.0"} 2' in text
+    assert 'skillshift_stage_seconds_bucket{stage="test.parse",le="+Inf"} 3' in text
+    assert json.loads(metrics.json_lines())['count'] == 3
+    assert [json.loads(line)['stage'] for line in log_path.read_text().splitlines()] == ['test.parse'] * 3
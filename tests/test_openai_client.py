@@ -0,0 +1,43 @@
+import json
+from concurrent.futures import ThreadPoolExecutor
+import openai
+import pytest
+import recommender
+
+@pytest.fixture
+def fresh_client():
+    recommender.set_openai_client(None)
+    yield
+    recommender.set_openai_client(None)
+
+def _reply_server(local_server):
+    def handle(method, path, body):
+        reply = {
+            'id': 'chatcmpl-test', 'object': 'chat.completion', 'created': 0, 'model': recommender.LLM_MODEL,
+            'choices': [{'index': 0, 'message': {'role': 'assistant', 'content': 'pooled'}, 'finish_reason': 'stop'}],
+        }
+        return 200, 'application/json', json.dumps(reply).encode('utf-8'), 0
+    return local_server(handle)
+
+def test_one_client_is_shared_across_threads(fresh_client, local_server, monkeypatch):
+    monkeypatch.setenv('OPENAI_API_KEY', 'test')
+    monkeypatch.setenv('OPENAI_BASE_URL', _reply_server(local_server) + '/v1')
+    monkeypatch.setenv('SKILLSHIFT_LLM_MAX_RETRIES', '0')
+    with ThreadPoolExecutor(8) as executor:
+        clients = list(executor.map(lambda _: recommender.get_openai_client(), range(16)))
+        replies = list(executor.map(lambda i: recommender._chat_completion(f"prompt {i}", 10), range(16)))
+    assert all(client is clients[0] for client in clients)
+    assert clients[0].max_retries == 0
+    assert replies == ['pooled'] * 16
+
+def test_calls_without_a_key_or_client_are_skipped(fresh_client, monkeypatch):
+    monkeypatch.delenv('OPENAI_API_KEY', raising=False)
+    assert recommender._chat_completion("prompt", 10) is None
+    assert recommender._openai_client is None
+
+def test_injected_client_needs_no_key(fresh_client, local_server, monkeypatch):
+    monkeypatch.delenv('OPENAI_API_KEY', raising=False)
+    client = openai.OpenAI(api_key='injected', base_url=_reply_server(local_server) + '/v1', max_retries=0)
+    recommender.set_openai_client(client)
+    assert recommender.get_openai_client() is client
+    assert recommender._chat_completion("prompt", 10) == 'pooled'
@@ -0,0 +1,79 @@
+import pytest
+import parse_cache
+from cache_store import DiskCache, MemoryLRU
+from job_parser import parse_job_description
+from parse_cache import ParseCache, cached_parse
+
+def test_memory_lru_evicts_least_recently_used():
+    lru = MemoryLRU(2)
+    lru.put('a', 1)
+    lru.put('b', 2)
+    assert lru.get('a') == 1
+    lru.put('c', 3)
+    assert lru.get('b') is None and lru.get('a') == 1 and lru.get('c') == 3
+    lru.clear()
+    assert lru.get('a') is None
+
+def test_disk_cache_bounds_total_size(tmp_path, monkeypatch):
+    clock = [1000.0]
+    monkeypatch.setattr('cache_store.time.time', lambda: clock[0])
+    cache = DiskCache(str(tmp_path / 'disk.sqlite'), max_bytes=10)
+    for key in 'abc':
+        clock[0] += 1
+        cache.put(key, b'1234')
+    # 12 bytes > 10: the oldest entry goes
+    assert cache.get('a') is None
+    clock[0] += 1
+    assert bytes(cache.get('b')) == b'1234'
+    clock[0] += 1
+    cache.put('d', b'1234')
+    assert cache.get('c') is None and cache.get('b') is not None
+    # Values larger than the whole cache are not stored
+    cache.put('big', b'x' * 11)
+    assert cache.get('big') is None
+    cache.close()
+
+def test_parse_cache_tiers_and_keys(tmp_path):
+    path = str(tmp_path / 'parse.sqlite')
+    cache = ParseCache(path)
+    key = ParseCache.make_key('resume.pdf', b'%PDF data', 2)
+    assert key != ParseCache.make_key('resume.pdf', b'%PDF data', 3)
+    assert key != ParseCache.make_key('job.pdf', b'%PDF data', 2)
+    assert key != ParseCache.make_key('resume.pdf', b'%PDF other', 2)
+    assert cache.get(key) is None
+    cache.put(key, ['text', ['python'], None])
+    assert cache.get(key) == ('text', ['python'], None)
+    # A new process starts with an empty memory tier and reads the file
+    reopened = ParseCache(path)
+    assert reopened.get(key) == ('text', ['python'], None)
+    assert reopened.get(key) == ('text', ['python'], None)
+    assert cache.stats()['misses'] == 1 and cache.stats()['memory_hits'] == 1
+    stats = reopened.stats()
+    assert (stats['disk_hits'], stats['memory_hits'], stats['hit_rate']) == (1, 1, 1.0)
+
+@pytest.fixture
+def default_cache(tmp_path, monkeypatch):
+    cache = ParseCache(str(tmp_path / 'default.sqlite'))
+    monkeypatch.setattr(parse_cache, '_default_cache', cache)
+    monkeypatch.delenv('SKILLSHIFT_PARSE_CACHE', raising=False)
+    return cache
+
+def test_cached_parse_parses_identical_bytes_once(default_cache, monkeypatch):
+    calls = []
+    def parse(data):
+        calls.append(bytes(data))
+        return str(data, 'utf-8'), ['python']
+    assert cached_parse('job.txt', b'python job', 1, parse) == ('python job', ['python'])
+    assert cached_parse('job.txt', memoryview(b'python job'), 1, parse) == ('python job', ['python'])
+    assert calls == [b'python job']
+    monkeypatch.setenv('SKILLSHIFT_PARSE_CACHE', '0')
+    cached_parse('job.txt', b'python job', 1, parse)
+    assert len(calls) == 2
+
+def test_job_parser_results_are_cached(default_cache):
+    data = b"Data engineer with python and docker"
+    first = parse_job_description(data)
+    assert parse_job_description(data) == first
+    assert 'python' in first[1]
+    assert default_cache.stats()['memory_hits'] == 1
+    assert parse_job_description(data, use_cache=False) == first
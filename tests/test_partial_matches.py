@@ -0,0 +1,32 @@
+import random
+import string
+from difflib import SequenceMatcher
+from skill_comparator import get_partial_matches
+from utils import COMMON_SKILLS
+
+def _all_pairs(resume_skills, job_skills):
+    # Scores every resume x job pair
+    matches = []
+    resume_set = set([s.lower() for s in resume_skills])
+    job_set = set([s.lower() for s in job_skills])
+    for r in resume_set:
+        for j in job_set:
+            if r != j and 0.75 < SequenceMatcher(None, r, j).ratio() < 1.0:
+                matches.append((r, j))
+    return matches
+
+def _misspell(rng, skill):
+    position = rng.randrange(len(skill))
+    return skill[:position] + rng.choice(string.ascii_lowercase) + skill[position + 1:]
+
+def test_matches_all_pairs_scan_in_the_same_order():
+    rng = random.Random(3)
+    for _ in range(50):
+        resume = [_misspell(rng, s) if rng.random() < 0.5 else s for s in rng.sample(COMMON_SKILLS, 15)]
+        job = [_misspell(rng, s) if rng.random() < 0.5 else s.upper() for s in rng.sample(COMMON_SKILLS, 15)]
+        assert get_partial_matches(resume, job) == _all_pairs(resume, job)
+
+def test_close_spellings_match_and_exact_ones_do_not():
+    assert get_partial_matches(['PostgreSQL', 'Docker'], ['postgres', 'docker', 'kubernetes']) == [('postgresql', 'postgres')]
+    assert get_partial_matches([], ['python']) == []
+    assert get_partial_matches(['r'], ['go', 'ruby']) == []
@@ -0,0 +1,44 @@
+import io
+import os
+import pdfplumber
+from utils import generate_pdf_report
+
+RADAR = {'radar_labels': ['Airflow', 'Docker', 'Python', 'Sql'], 'resume_vector': [0, 0, 1, 1], 'jd_vector': [1, 1, 1, 0]}
+
+def _report(**overrides):
+    arguments = dict(
+        resume_text="Resume – Python and SQL “quoted” • bullet",
+        jd_text="Data Engineer with airflow and docker",
+        present_skills=['python'],
+        missing_skills=['airflow', 'docker'],
+        learning_path=["Step 1: Learn Airflow"],
+        ai_feedback="Add a pipeline project.",
+        role_advice="Highlight data modelling.",
+        radar=RADAR,
+    )
+    arguments.update(overrides)
+    return generate_pdf_report(**arguments)
+
+def _text(data):
+    with pdfplumber.open(io.BytesIO(data)) as pdf:
+        return len(pdf.pages), "\n".join(page.extract_text() or '' for page in pdf.pages)
+
+def test_report_is_rendered_in_memory(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    data = _report()
+    assert isinstance(data, bytes) and data.startswith(b'%PDF')
+    assert os.listdir(tmp_path) == []
+    pages, text = _text(data)
+    for expected in ("Skills Present: Python", "Missing Skills: Airflow, Docker", "Step 1: Learn Airflow",
+                     "Resume - Python and SQL \"quoted\" - bullet", "Job Description", "Airflow"):
+        assert expected in text
+
+def test_radar_chart_is_optional_and_grows_with_labels():
+    # 'Sql' only appears as a radar label
+    assert "Sql" in _text(_report())[1]
+    assert "Sql" not in _text(_report(radar=None))[1]
+    labels = [f"Skill {i}" for i in range(40)]
+    many = {'radar_labels': labels, 'resume_vector': [i % 2 for i in range(40)], 'jd_vector': [1] * 40}
+    pages, text = _text(_report(radar=many, resume_text="x" * 800, jd_text="y" * 800))
+    assert "Skill 39" in text and pages >= 2
+    assert _text(_report(radar={'radar_labels': [], 'resume_vector': [], 'jd_vector': []}))[0] == 1
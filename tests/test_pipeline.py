@@ -0,0 +1,48 @@
+import pytest
+import pipeline
+from pipeline import Stage, run_stage
+
+@pytest.fixture
+def counted_stages(monkeypatch):
+    calls = []
+    def double(x):
+        calls.append(('double', x))
+        return {'doubled': 2 * x}
+    def add(doubled, y):
+        calls.append(('add', doubled, y))
+        return {'total': doubled + y}
+    monkeypatch.setattr(pipeline, 'STAGES', {
+        'double': Stage(double, ('x',)),
+        'add': Stage(add, ('doubled', 'y')),
+    })
+    return calls
+
+def _run(values, memo):
+    run_stage('double', values, memo)
+    return run_stage('add', values, memo)['total']
+
+def test_only_stages_with_changed_inputs_rerun(counted_stages):
+    memo = {}
+    assert _run({'x': 1, 'y': 10}, memo) == 12
+    assert _run({'x': 1, 'y': 10}, memo) == 12
+    assert counted_stages == [('double', 1), ('add', 2, 10)]
+    assert _run({'x': 1, 'y': 20}, memo) == 22
+    assert counted_stages[2:] == [('add', 2, 20)]
+    assert _run({'x': 3, 'y': 20}, memo) == 26
+    assert counted_stages[3:] == [('double', 3), ('add', 6, 20)]
+
+def test_outputs_are_merged_into_values(counted_stages):
+    values = {'x': 2, 'y': 1}
+    _run(values, {})
+    assert values == {'x': 2, 'y': 1, 'doubled': 4, 'total': 5}
+
+def test_radar_and_comparison_stages():
+    values = {'resume_skills': ['Python', 'scikit learn', 'Rust'], 'jd_skills': ['python', 'docker', 'rust']}
+    memo = {}
+    run_stage('comparison', values, memo)
+    radar = run_stage('radar', values, memo)
+    assert values['comparison']['present'] == ['python', 'rust']
+    assert values['comparison']['missing'] == ['docker']
+    assert radar['radar_labels'] == ['Docker', 'Python', 'Rust', 'Scikit-Learn']
+    assert radar['resume_vector'] == [0, 1, 1, 1]
+    assert radar['jd_vector'] == [1, 1, 1, 0]
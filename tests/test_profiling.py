@@ -0,0 +1,56 @@
+import os
+import pstats
+import time
+import pytest
+import profiling
+from profiling import Profile, profile, prune, requested
+
+def _busy(seconds):
+    end = time.perf_counter() + seconds
+    while time.perf_counter() < end:
+        sum(range(100))
+
+@pytest.fixture
+def no_profiling_env(monkeypatch):
+    monkeypatch.delenv('SKILLSHIFT_PROFILE', raising=False)
+    monkeypatch.delenv('SKILLSHIFT_PROFILING', raising=False)
+
+def test_request_flags_need_the_operator_opt_in(no_profiling_env, monkeypatch):
+    assert not requested('1')
+    assert profile('run', '1') is profiling._NO_PROFILE
+    monkeypatch.setenv('SKILLSHIFT_PROFILING', '1')
+    assert requested('1') and requested(True) and requested('yes')
+    assert not requested(None) and not requested('0')
+    monkeypatch.setenv('SKILLSHIFT_PROFILE', '1')
+    assert requested(None)
+
+def test_profile_writes_pstats_and_collapsed_stacks(tmp_path):
+    with Profile('analyze one', directory=str(tmp_path), interval=0.001) as run:
+        _busy(0.1)
+    pstats_path, collapsed_path = run.paths
+    assert os.path.basename(pstats_path).endswith('-analyze_one.pstats')
+    assert pstats.Stats(pstats_path).total_calls > 0
+    with open(collapsed_path, encoding='utf-8') as f:
+        lines = f.read().splitlines()
+    assert lines and any('_busy (test_profiling.py' in line for line in lines)
+    assert all(line.rsplit(' ', 1)[1].isdigit() for line in lines)
+
+def test_only_one_profile_runs_at_a_time(tmp_path):
+    outer = Profile('outer', directory=str(tmp_path)).start()
+    try:
+        inner = Profile('inner', directory=str(tmp_path)).start()
+        assert inner.stop() is None
+    finally:
+        assert outer.stop() is not None
+    # The lock is released again
+    assert Profile('again', directory=str(tmp_path)).start().stop() is not None
+
+def test_prune_deletes_oldest_profiles_first(tmp_path):
+    for i, name in enumerate(['old', 'middle', 'new']):
+        for extension in ('.pstats', '.collapsed'):
+            path = tmp_path / (name + extension)
+            path.write_bytes(b'x' * 100)
+            os.utime(path, (1000 + i, 1000 + i))
+    (tmp_path / 'notes.txt').write_bytes(b'x' * 1000)
+    prune(str(tmp_path), 400, keep=str(tmp_path / 'old'))
+    assert sorted(os.listdir(tmp_path)) == ['new.collapsed', 'new.pstats', 'notes.txt', 'old.collapsed', 'old.pstats']
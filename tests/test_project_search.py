@@ -0,0 +1,53 @@
+import time
+from urllib.parse import parse_qs, urlsplit
+import pytest
+import recommender
+from cache_store import DiskCache
+
+def _search_page(*repos):
+    links = ''.join(f'<a href="/{repo}">{repo}</a>' for repo in repos)
+    return f"<html><body>{links}</body></html>".encode('utf-8')
+
+@pytest.fixture
+def fake_github(local_server, monkeypatch, tmp_path):
+    """Point project search at a local server; `respond(query)` gives (status, page, delay)."""
+    def use(respond):
+        def handle(method, path, body):
+            query = parse_qs(urlsplit(path).query)['q'][0]
+            status, page, delay = respond(query)
+            return status, 'text/html', page, delay
+        monkeypatch.setattr(recommender, 'GITHUB_URL', local_server(handle))
+        monkeypatch.setattr(recommender, '_http_cache', DiskCache(str(tmp_path / 'http_cache.sqlite'), max_bytes=1024 * 1024))
+    return use
+
+def test_search_returns_repositories_in_query_order(fake_github):
+    fake_github(lambda query: (200, _search_page(query.split()[0] + '/' + query.split()[1]), 0))
+    result = recommender.search_real_projects(['python', 'docker'], deadline=5)
+    assert result.startswith("**Real Project Examples:**")
+    assert result.index('python/project') < result.index('python/portfolio') < result.index('docker/project')
+
+def test_deadline_keeps_partial_results(fake_github):
+    # Searches for the second skill hang past the deadline; the first skill's results are used
+    def respond(query):
+        if query.startswith('docker'):
+            return 200, _search_page('slow/' + query.split()[1]), 3
+        return 200, _search_page('fast/' + query.split()[1]), 0
+    fake_github(respond)
+    started = time.perf_counter()
+    result = recommender.search_real_projects(['python', 'docker'], deadline=0.5)
+    assert time.perf_counter() - started < 2
+    assert 'fast/project' in result and 'fast/portfolio' in result
+    assert 'slow/' not in result
+
+def test_failed_searches_fall_back_to_curated_projects(fake_github):
+    fake_github(lambda query: (500, b'', 0))
+    result = recommender.search_real_projects(['python', 'sql'], deadline=5)
+    assert 'Data Analysis with Python' in result
+    assert 'SQL Database Projects' in result
+
+def test_deadline_with_no_results_falls_back(fake_github):
+    fake_github(lambda query: (200, _search_page('slow/repo'), 3))
+    started = time.perf_counter()
+    result = recommender.search_real_projects(['aws'], deadline=0.3)
+    assert time.perf_counter() - started < 2
+    assert 'AWS Cloud Projects' in result
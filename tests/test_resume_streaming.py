@@ -0,0 +1,53 @@
+from resume_parser import parse_resume
+
+def _pdf_bytes(pages):
+    from fpdf import FPDF
+    pdf = FPDF()
+    pdf.set_font('Arial', size=12)
+    for lines in pages:
+        pdf.add_page()
+        for line in lines:
+            pdf.cell(0, 10, line, ln=1)
+    return pdf.output(dest='S').encode('latin-1')
+
+WITH_SKILLS = [
+    ["Jane Doe", "Skills:", "Python, SQL, Docker", "EXPERIENCE", "Built pipelines"],
+    ["Worked with Tableau and Airflow"],
+    ["EDUCATION", "MSc Data Science"],
+]
+
+def test_streaming_stops_after_the_skills_section():
+    data = _pdf_bytes(WITH_SKILLS)
+    text, skills, raw = parse_resume(data, use_cache=False, streaming=True)
+    full_text, full_skills, full_raw = parse_resume(data, use_cache=False)
+    assert skills == full_skills == ['docker', 'python', 'sql']
+    assert raw == full_raw == "Python, SQL, Docker"
+    assert 'Tableau' in full_text and 'Tableau' not in text
+    assert full_text.startswith(text)
+
+def test_streaming_reads_only_the_first_of_several_skills_sections():
+    data = _pdf_bytes([
+        ["SKILLS", "Programming: Python, SQL", "EXPERIENCE", "Built pipelines"],
+        ["ADDITIONAL SKILLS", "Skills", "Tools: Tableau, Excel"],
+    ])
+    _, skills, raw = parse_resume(data, use_cache=False)
+    assert skills == ['excel', 'python', 'sql', 'tableau']
+    assert raw == "Programming: Python, SQL\nTools: Tableau, Excel"
+    _, streamed, streamed_raw = parse_resume(data, use_cache=False, streaming=True)
+    assert streamed == ['python', 'sql']
+    assert streamed_raw == "Programming: Python, SQL"
+
+def test_streaming_reads_everything_without_a_skills_section():
+    data = _pdf_bytes([["Jane Doe", "Python developer"], ["Tableau dashboards"]])
+    assert parse_resume(data, use_cache=False, streaming=True) == parse_resume(data, use_cache=False)
+    text, skills, raw = parse_resume(data, use_cache=False, streaming=True)
+    assert 'tableau' in skills and raw is None
+
+def test_streaming_results_are_cached_separately(tmp_path, monkeypatch):
+    import parse_cache
+    monkeypatch.setattr(parse_cache, '_default_cache', parse_cache.ParseCache(str(tmp_path / 'parse.sqlite')))
+    data = _pdf_bytes(WITH_SKILLS)
+    streamed = parse_resume(data, streaming=True)
+    full = parse_resume(data)
+    assert streamed[0] != full[0]
+    assert parse_resume(data, streaming=True) == streamed
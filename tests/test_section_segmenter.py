@@ -0,0 +1,54 @@
+from resume_parser import extract_skills_section
+from section_segmenter import Section, iter_sections, section_lines, segment_sections
+
+RESUME = "\n".join([
+    "Jane Doe",
+    "SUMMARY",
+    "Data engineer.",
+    "Skills:",
+    "Tools: Python, SQL",
+    "Skills: Docker; Git",
+    "",
+    "Not part of the skills block",
+    "Experience",
+    "Built pipelines",
+    "EDUCATION",
+])
+
+def test_sections_and_offsets():
+    sections = list(iter_sections(RESUME.split('\n')))
+    assert [s.name for s in sections] == ['summary', 'skills', 'experience', 'education']
+    skills = sections[1]
+    assert RESUME[skills.header_start:].startswith("Skills:")
+    assert RESUME[skills.start:skills.end] == "Tools: Python, SQL\nSkills: Docker; Git"
+    # Text after the blank line belongs to no section until the next header
+    assert RESUME[sections[0].start:sections[0].end] == "Data engineer."
+    assert RESUME[sections[2].start:sections[2].end] == "Built pipelines"
+    assert sections[3] == Section('education', len(RESUME) - len("EDUCATION"), len(RESUME) + 1, len(RESUME) + 1)
+    assert section_lines(RESUME, sections[3]) == []
+
+def test_skills_section_ends_at_named_or_caps_header():
+    text = "Skills\nPython\nPROJECTS\nchatbot\nskills - Go\nkafka\nwork history"
+    sections = segment_sections(text)
+    assert [section_lines(text, s) for s in sections['skills']] == [['Python'], ['kafka']]
+    assert section_lines(text, sections['projects'][0]) == ['chatbot']
+    assert section_lines(text, sections['work'][0]) == []
+
+def test_sections_are_yielded_as_soon_as_they_close():
+    read = []
+    def lines():
+        for line in RESUME.split('\n'):
+            read.append(line)
+            yield line
+    sections = iter_sections(lines())
+    next(sections)
+    assert next(sections).name == 'skills'
+    # The skills section closes at the blank line; nothing after it has been read
+    assert read[-1] == ""
+    assert len(read) == 7
+
+def test_extract_skills_section_collects_every_skills_block():
+    skills, raw = extract_skills_section(RESUME)
+    assert skills == ['Python', 'SQL', 'Docker', 'Git']
+    assert raw == "Tools: Python, SQL\nSkills: Docker; Git"
+    assert extract_skills_section("Jane Doe\nEXPERIENCE\nStuff") == (None, None)
@@ -0,0 +1,83 @@
+import json
+import threading
+import time
+import urllib.error
+import urllib.request
+import pytest
+import service
+import skill_embeddings
+from service import AnalysisService, ServiceBusy, ServiceStartupError, ServiceTimeout, make_server
+
+JD = "Senior Data Engineer with python, airflow and docker"
+
+def _slow_analyze(request):
+    time.sleep(float(request['resume_text']))
+    return {'slept': request['resume_text']}
+
+def test_analyzes_text_resumes():
+    with AnalysisService(workers=1) as analysis:
+        result = analysis.analyze(JD, resume_text="python and sql")
+        assert result['job_title'] == "Senior Data Engineer"
+        assert result['comparison']['present'] == ['python']
+        assert result['comparison']['missing'] == ['airflow', 'docker']
+        with pytest.raises(ValueError):
+            analysis.analyze('', resume_text="python")
+        with pytest.raises(ValueError):
+            analysis.analyze(JD)
+        assert analysis.stats()['completed'] == 1 and analysis.stats()['pending'] == 0
+
+def test_full_queue_is_rejected_and_slow_requests_time_out(monkeypatch):
+    # Workers are forked after the patch, so they run the slow stand-in
+    monkeypatch.setattr(service, '_analyze', _slow_analyze)
+    with AnalysisService(workers=1, max_queue=0) as analysis:
+        with pytest.raises(ServiceTimeout):
+            analysis.analyze(JD, resume_text='1', timeout=0.2)
+        with pytest.raises(ServiceBusy):
+            analysis.analyze(JD, resume_text='0')
+        stats = analysis.stats()
+        assert (stats['timed_out'], stats['rejected'], stats['pending']) == (1, 1, 1)
+        deadline = time.monotonic() + 5
+        while analysis.stats()['pending'] and time.monotonic() < deadline:
+            time.sleep(0.05)
+        assert analysis.analyze(JD, resume_text='0') == {'slept': '0'}
+
+def test_startup_reports_a_failing_initializer(monkeypatch):
+    def fail():
+        raise RuntimeError("model missing")
+    monkeypatch.setattr(skill_embeddings, 'get_default_skill_index', fail)
+    started = time.monotonic()
+    with pytest.raises(ServiceStartupError, match="RuntimeError: model missing"):
+        AnalysisService(workers=2)
+    assert time.monotonic() - started < 10
+
+def test_startup_gives_up_after_its_timeout(monkeypatch):
+    monkeypatch.setattr(skill_embeddings, 'get_default_skill_index', lambda: time.sleep(60))
+    started = time.monotonic()
+    with pytest.raises(ServiceStartupError, match="within 0.5 seconds"):
+        AnalysisService(workers=1, startup_timeout=0.5)
+    assert time.monotonic() - started < 10
+
+def _post(url, payload):
+    request = urllib.request.Request(url, data=json.dumps(payload).encode('utf-8'), method='POST')
+    try:
+        with urllib.request.urlopen(request, timeout=10) as response:
+            return response.status, json.loads(response.read())
+    except urllib.error.HTTPError as e:
+        return e.code, json.loads(e.read())
+
+def test_http_front_end():
+    with AnalysisService(workers=1) as analysis:
+        server = make_server(analysis, port=0)
+        threading.Thread(target=server.serve_forever, daemon=True).start()
+        base = f"http://127.0.0.1:{server.server_address[1]}"
+        try:
+            status, body = _post(base + '/analyze', {'jd_text': JD, 'resume_text': "python"})
+            assert status == 200 and body['comparison']['present'] == ['python']
+            assert _post(base + '/analyze', {'jd_text': JD})[0] == 400
+            assert _post(base + '/analyze', {'jd_text': JD, 'resume_base64': '***'})[0] == 400
+            assert _post(base + '/nothing', {})[0] == 404
+            with urllib.request.urlopen(base + '/health', timeout=10) as response:
+                assert json.loads(response.read())['completed'] == 1
+        finally:
+            server.shutdown()
+            server.server_close()
@@ -0,0 +1,57 @@
+import numpy as np
+import pytest
+import skill_embeddings
+from skill_comparator import compare_skills
+from skill_embeddings import HashingEncoder, build_skill_index, get_semantic_matches, load_skill_index
+
+SKILLS = ['python', 'postgresql', 'scikit-learn', 'aws', 'docker', 'tableau']
+
+@pytest.fixture
+def index(tmp_path):
+    return build_skill_index(SKILLS, encoder=HashingEncoder(), path=str(tmp_path / 'index.npy'))
+
+def test_hashing_encoder_is_deterministic_and_normalized():
+    first = HashingEncoder().encode(['python', 'postgres'])
+    second = HashingEncoder().encode(['python', 'postgres'])
+    assert np.array_equal(first, second)
+    assert np.allclose(np.linalg.norm(first, axis=1), 1.0)
+
+def test_top_k_ranks_closest_skills_first(index):
+    results = index.top_k(['postgres', 'scikit learn'], k=2)
+    assert results[0][0][0] == 'postgresql' and len(results[0]) == 2
+    assert results[1][0][0] == 'scikit-learn'
+    assert all(a[1] >= b[1] for row in results for a, b in zip(row, row[1:]))
+
+def test_top_k_against_given_candidates(index):
+    results = index.top_k(['docker'], k=5, candidates=['Docker', 'aws'])
+    assert results[0][0] == ('docker', pytest.approx(1.0))
+    assert len(results[0]) == 2
+    assert index.top_k([], k=3) == []
+    assert index.top_k(['docker'], k=3, candidates=[]) == [[]]
+
+def test_saved_index_round_trips(index, tmp_path):
+    loaded = load_skill_index(str(tmp_path / 'index.npy'), encoder=HashingEncoder())
+    assert loaded.skills == sorted(SKILLS)
+    assert np.array_equal(np.asarray(loaded.matrix), np.asarray(index.matrix))
+    with pytest.raises(ValueError):
+        load_skill_index(str(tmp_path / 'index.npy'), encoder=HashingEncoder(dim=64))
+
+def test_semantic_matches_pair_missing_skills_with_close_resume_skills(index):
+    matches = get_semantic_matches(['PostgreSQL', 'python'], ['postgres', 'python', 'tableau'], index)
+    assert matches == [('postgresql', 'postgres')]
+
+def test_semantic_matching_is_off_without_a_configured_model(monkeypatch, tmp_path):
+    monkeypatch.delenv('SKILLSHIFT_SKILL_ENCODER', raising=False)
+    monkeypatch.setattr(skill_embeddings, '_default_index', None)
+    monkeypatch.setattr(skill_embeddings, 'CACHE_DIR', str(tmp_path))
+    assert skill_embeddings.default_encoder() is None
+    result = compare_skills(['time management', 'error analysis', 'aws'], ['project management', 'data analysis', 'aws s3'])
+    assert result['partial'] == []
+    assert result['missing'] == ['aws s3', 'data analysis', 'project management']
+    assert skill_embeddings.get_default_skill_index() is None
+    assert list(tmp_path.iterdir()) == []
+
+def test_compare_skills_uses_an_injected_index(index):
+    result = compare_skills(['postgresql', 'python'], ['postgres', 'python'], skill_index=index)
+    assert result['present'] == ['python']
+    assert result['partial'] == [('postgresql', 'postgres')]
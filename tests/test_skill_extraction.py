@@ -0,0 +1,34 @@
+import random
+import re
+from skill_taxonomy import TAXONOMY
+from utils import COMMON_SKILLS, extract_skills_from_text
+
+def _reference_skills(text, skills):
+    # One word-boundary search per skill, aliases reported under their canonical name
+    found = set()
+    for skill in skills:
+        if re.search(r'(?<!\w)' + re.escape(skill.lower()) + r'(?!\w)', text.lower()):
+            found.add(TAXONOMY.aliases.get(skill.lower(), skill))
+    return sorted(found)
+
+def test_skills_match_per_skill_search():
+    rng = random.Random(1)
+    filler = ['resume', 'aims', 'html', 'mysqlx', 'data', 'server', 'with', '-', ',', '(', ')', 'AI-driven', 'Big']
+    words = COMMON_SKILLS + [s.upper() for s in COMMON_SKILLS[:20]] + filler * 3
+    for _ in range(200):
+        text = ' '.join(rng.choice(words) for _ in range(rng.randint(0, 30)))
+        assert extract_skills_from_text(text) == _reference_skills(text, COMMON_SKILLS), text
+
+def test_skills_on_word_boundaries_only():
+    text = "Resume: SQL Server, big data pipelines, Scikit Learn and some AI; gitlab ci/cd"
+    assert extract_skills_from_text(text) == sorted([
+        'sql server', 'sql', 'big data', 'data pipelines', 'scikit-learn', 'ai', 'gitlab ci/cd', 'gitlab',
+    ])
+    assert extract_skills_from_text("aims to parse html in aristotle") == []
+    assert extract_skills_from_text("Go and Rust", skills_list=['Go', 'rust', 'Java']) == ['Go', 'rust']
+
+def test_custom_vocabularies_keep_their_spellings():
+    assert extract_skills_from_text("python and docker", skills_list=[]) == []
+    assert extract_skills_from_text("", skills_list=[]) == []
+    assert extract_skills_from_text("Used scikit learn daily", skills_list=['scikit learn']) == ['scikit learn']
+    assert extract_skills_from_text("Used scikit learn daily") == ['scikit-learn']
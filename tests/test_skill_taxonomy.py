@@ -0,0 +1,47 @@
+import random
+from skill_comparator import compare_skills
+from skill_taxonomy import SKILL_CATEGORIES, TAXONOMY, SkillTaxonomy, count_bits, iter_ids
+
+def test_ids_aliases_and_canonical_names():
+    taxonomy = SkillTaxonomy({'A': ['Python', 'SQL'], 'B': ['sql', 'Scikit-Learn']}, {'Scikit Learn': 'scikit-learn'})
+    assert taxonomy.skills == ['python', 'sql', 'scikit-learn']
+    assert taxonomy.id_of('SQL') == 1 and taxonomy.id_of('scikit learn') == 2
+    assert taxonomy.id_of('rust') is None
+    assert taxonomy.canonical('SCIKIT LEARN') == 'scikit-learn'
+    assert taxonomy.canonical('Rust') == 'rust'
+    assert taxonomy.vocabulary == ['python', 'sql', 'scikit-learn', 'scikit learn']
+    # A skill listed in several categories is in each category's mask
+    assert taxonomy.category_masks == {'A': 0b011, 'B': 0b110}
+
+def test_to_bits_splits_known_and_unknown_skills():
+    bits, unknown = TAXONOMY.to_bits(['Python', 'python', 'scikit learn', 'Rust', 'RUST', 'Terraform'])
+    assert TAXONOMY.names(bits) == ['python', 'scikit-learn']
+    assert count_bits(bits) == 2
+    assert list(iter_ids(bits)) == sorted([TAXONOMY.id_of('python'), TAXONOMY.id_of('scikit-learn')])
+    assert unknown == {'rust', 'terraform'}
+    assert TAXONOMY.to_bits([]) == (0, set())
+    assert 'Programming Languages' in TAXONOMY.categories_of(bits)
+    assert TAXONOMY.categories_of(0) == []
+
+def test_mask_where_selects_matching_names():
+    mask = TAXONOMY.mask_where(lambda name: name.startswith('aws'))
+    assert TAXONOMY.names(mask) == ['aws', 'aws emr', 'aws s3']
+    assert count_bits(TAXONOMY.mask_where(lambda name: True)) == len(TAXONOMY.skills)
+
+def test_compare_skills_matches_set_comparison():
+    # Outside aliases, bitset comparison gives the same present/missing split as plain sets
+    rng = random.Random(14)
+    vocabulary = [s for skills in SKILL_CATEGORIES.values() for s in skills] + ['rust', 'terraform', 'Go']
+    for _ in range(20):
+        resume = rng.sample(vocabulary, 6)
+        job = rng.sample(vocabulary, 8)
+        result = compare_skills(resume, job)
+        resume_set = {s.lower() for s in resume}
+        job_set = {s.lower() for s in job}
+        assert result['present'] == sorted(resume_set & job_set)
+        assert result['missing'] == sorted(job_set - resume_set)
+
+def test_compare_skills_reports_aliases_under_canonical_name():
+    result = compare_skills(['Scikit Learn', 'Python'], ['scikit-learn', 'python', 'docker'])
+    assert result['present'] == ['python', 'scikit-learn']
+    assert result['missing'] == ['docker']
@@ -1,76 +1,260 @@
-# Expanded list of common technical and soft skills (user-provided and common variants)
-COMMON_SKILLS = [
-    # Programming Languages
-    'python', 'sql', 'r', 'javascript', 'xml', 'scala', 'bash',
-    # Data Analysis & Reporting
-    'excel', 'tableau', 'power bi', 'business objects', 'a/b testing', 'statistical analysis', 'spss', 'sas',
-    # Databases
-    'postgresql', 'sql server', 'mysql', 'mongodb', 'cassandra', 'snowflake', 'amazon aurora', 'oracle', 'hive',
-    # ETL & Big Data Tools
-    'apache spark', 'pyspark', 'hadoop', 'airflow', 'aws emr', 'aws s3', 'amazon aurora',
-    # Frameworks & Libraries
-    'pandas', 'numpy', 'scikit-learn', 'scikit learn', 'xgboost', 'tensorflow', 'pytorch', 'keras', 'transformers', 'clip', 'bert', 'u-net', 'opencv', 'nltk', 'spacy', 'mllib', 'prophet', 'arima', 'sarima',
-    # Tools & Platforms
-    'aws', 'git', 'gitlab', 'gitlab ci/cd', 'docker', 'jupyter', 'gradio', 'lucidchart', 'superset', 'looker', 'qgis', 'databricks', 'github', 'bitbucket', 'jenkins', 'jira',
-    # Visualization & Dashboarding
-    'tableau', 'power bi', 'excel (pivot tables, macros)', 'superset', 'looker',
-    # Process Modeling & Documentation
-    'lucidchart', 'youtrack', 'agile', 'scrum', 'business process mapping', 'cost-benefit analysis',
-    # Machine Learning/AI
-    'machine learning', 'deep learning', 'ml', 'ai', 'generative ai', 'nlp', 'drift detection', 'error analysis',
-    # Cloud
-    'azure', 'gcp', 'oci',
-    # Other
-    'object oriented programming', 'functional programming', 'quality assurance', 'data pipelines', 'model creation', 'production environments', 'data science', 'big data', 'data analysis', 'data scientist',
-    # Soft Skills
-    'communication', 'leadership', 'teamwork', 'problem solving', 'critical thinking', 'adaptability', 'creativity', 'time management', 'collaboration', 'project management', 'presentation', 'negotiation', 'empathy', 'organization',
-]
-
+import hashlib
+import math
+import os
 import re
-from fpdf import FPDF
+from functools import lru_cache
+from metrics import timed
+from skill_taxonomy import TAXONOMY
+
+# Every spelling recognized in text: canonical skills from the taxonomy, then their aliases
+COMMON_SKILLS = TAXONOMY.vocabulary
+
+# Local directory for on-disk caches and precomputed indexes
+CACHE_DIR = os.getenv('SKILLSHIFT_CACHE_DIR', '.skillshift_cache')
+
+# Changes whenever the skill vocabulary changes, so cached extraction results are invalidated
+SKILLS_VERSION = hashlib.sha256('\n'.join(COMMON_SKILLS).encode('utf-8')).hexdigest()[:12]
+
+def _trie_regex(node):
+    """Render a character trie as a regex that shares common prefixes."""
+    alternatives = [re.escape(ch) + _trie_regex(child) for ch, child in sorted(node.items()) if ch]
+    if not alternatives:
+        return ''
+    optional = '' in node
+    if len(alternatives) == 1 and not optional:
+        return alternatives[0]
+    return '(?:' + '|'.join(alternatives) + ')' + ('?' if optional else '')
+
+@lru_cache(maxsize=8)
+def _build_skill_matcher(skills):
+    """
+    Compile a tuple of skills into a single trie-shaped regex.
+    Returns (pattern, variants, nested): `variants` maps a lowercase match back to the
+    original skill spellings, and `nested` lists the shorter skills that end on a word
+    boundary inside a longer one (e.g. 'sql' inside 'sql server'), since the regex only
+    reports the longest skill starting at each position.
+    """
+    variants = {}
+    for skill in skills:
+        variants.setdefault(skill.lower(), set()).add(skill)
+    trie = {}
+    for key in variants:
+        node = trie
+        for ch in key:
+            node = node.setdefault(ch, {})
+        node[''] = {}
+    nested = {}
+    for key in variants:
+        nested[key] = [k for k in variants if len(k) < len(key) and key.startswith(k) and not key[len(k)].isalnum()]
+    # Zero-width lookahead so overlapping skills ('big data', 'data pipelines') are all reported
+    pattern = re.compile(r'(?<!\w)(?=(' + _trie_regex(trie) + r')(?!\w))')
+    return pattern, variants, nested
 
+# Built once at import so every call reuses the compiled matcher
+_build_skill_matcher(tuple(COMMON_SKILLS))
+
+@timed('utils.extract_skills')
 def extract_skills_from_text(text, skills_list=COMMON_SKILLS):
-    """Extract skills from text using case-insensitive substring matching."""
+    """
+    Extract skills from text using a single case-insensitive, word-boundary-aware pass.
+    With the default vocabulary, aliases are reported under their canonical name; a
+    custom skills_list is reported in its own spellings.
+    """
+    skills = tuple(skills_list)
+    if not skills:
+        return []
+    pattern, variants, nested = _build_skill_matcher(skills)
+    aliases = TAXONOMY.aliases if skills_list is COMMON_SKILLS else {}
+    found_keys = set()
+    for match in pattern.finditer(text.lower()):
+        key = match.group(1)
+        found_keys.add(key)
+        found_keys.update(nested[key])
     found_skills = set()
-    text_lower = text.lower()
-    for skill in skills_list:
-        if skill.lower() in text_lower:
-            found_skills.add(skill)
+    for key in found_keys:
+        # Default-vocabulary aliases are reported under their canonical name ('scikit learn' -> 'scikit-learn')
+        canonical = aliases.get(key)
+        if canonical is not None:
+            found_skills.add(canonical)
+        else:
+            found_skills.update(variants[key])
     return sorted(found_skills)
 
+# Words that end a job title, e.g. 'Senior Data *Scientist*'
+TITLE_SUFFIXES = frozenset(w.lower() for w in ['Engineer', 'Scientist', 'Manager', 'Analyst', 'Developer', 'Architect', 'Lead', 'Specialist', 'Consultant', 'Coordinator', 'Director', 'VP', 'CTO', 'CEO', 'CFO', 'COO'])
+COMMON_JOB_TITLES = [
+    'Data Scientist', 'Software Engineer', 'Data Engineer', 'Machine Learning Engineer',
+    'Product Manager', 'Business Analyst', 'Data Analyst', 'DevOps Engineer',
+    'Frontend Developer', 'Backend Developer', 'Full Stack Developer', 'UI/UX Designer',
+    'Project Manager', 'Scrum Master', 'Technical Lead', 'Architect'
+]
+# Words that can never be part of a title; they stop the backwards scan for modifiers
+_TITLE_STOPWORDS = frozenset(['a', 'an', 'the', 'and', 'or', 'for', 'to', 'of', 'with', 'as', 'is', 'are', 'be', 'we', 'our', 'you', 'your', 'looking', 'seeking', 'hiring', 'job', 'title', 'position', 'role'])
+_TITLE_CUES = frozenset(['title', 'position', 'role'])
+_HIRING_CUES = frozenset(['seeking', 'hiring'])
+_MAX_TITLE_WORDS = 5
+# How many tokens after 'hiring' / 'seeking' / 'looking for' a title may start
+_HIRING_CUE_WINDOW = 12
+_TITLE_TOKEN = re.compile(r"[A-Za-z]+|\n|[^\sA-Za-z]")
+# Matched against the lowercased text; much faster than an IGNORECASE alternation
+_COMMON_TITLE_PATTERN = re.compile('|'.join(re.escape(t.lower()) for t in sorted(COMMON_JOB_TITLES, key=len, reverse=True)))
+
+def _title_before(words):
+    """Build a title from the suffix word (last) and the modifiers directly before it."""
+    suffix = words[-1]
+    title = [suffix]
+    for word in reversed(words[:-1]):
+        if len(title) >= _MAX_TITLE_WORDS or word.lower() in _TITLE_STOPWORDS:
+            break
+        # A capitalized title only takes capitalized modifiers ('an experienced Data Scientist')
+        if suffix[0].isupper() and not word[0].isupper():
+            break
+        title.append(word)
+    return ' '.join(reversed(title))
+
+@timed('utils.extract_job_title')
 def extract_job_title(jd_text):
     """
-    Extract job title from job description text using regex patterns and common job titles.
+    Extract job title from job description text in a single pass over its tokens.
+    A title ends in a suffix word (Engineer, Scientist, Manager, ...). Titles after a
+    'Title:' / 'Position:' / 'Role:' label win, then titles shortly after 'hiring',
+    'seeking' or 'looking for', then the first title anywhere; common job titles are the
+    fallback.
     """
-    # Common job title patterns
-    patterns = [
-        r'(?:job title|position|role|title)[:\s]+([A-Z][A-Za-z\s]+(?:Engineer|Scientist|Manager|Analyst|Developer|Architect|Lead|Specialist|Consultant|Coordinator|Director|VP|CTO|CEO|CFO|COO))',
-        r'(?:we are looking for|seeking|hiring)[\s\w]+([A-Z][A-Za-z\s]+(?:Engineer|Scientist|Manager|Analyst|Developer|Architect|Lead|Specialist|Consultant|Coordinator|Director|VP|CTO|CEO|CFO|COO))',
-        r'([A-Z][A-Za-z\s]+(?:Engineer|Scientist|Manager|Analyst|Developer|Architect|Lead|Specialist|Consultant|Coordinator|Director|VP|CTO|CEO|CFO|COO))',
-    ]
-    
-    for pattern in patterns:
-        match = re.search(pattern, jd_text, re.IGNORECASE)
-        if match:
-            title = match.group(1).strip()
-            # Clean up the title
-            title = re.sub(r'\s+', ' ', title)  # Remove extra spaces
-            return title
-    
-    # If no pattern matches, try to find common job titles in the text
-    common_titles = [
-        'Data Scientist', 'Software Engineer', 'Data Engineer', 'Machine Learning Engineer',
-        'Product Manager', 'Business Analyst', 'Data Analyst', 'DevOps Engineer',
-        'Frontend Developer', 'Backend Developer', 'Full Stack Developer', 'UI/UX Designer',
-        'Project Manager', 'Scrum Master', 'Technical Lead', 'Architect'
-    ]
-    
-    for title in common_titles:
-        if title.lower() in jd_text.lower():
+    best, best_rank, best_run, best_start = None, 3, None, None
+    line_words = []       # the current run of consecutive words on this line
+    run = 0               # increments whenever a run of words is broken
+    labelled_line = False  # a 'Title:'-style label appeared earlier on this line
+    tokens_since_hiring = None
+    previous = None
+    for match in _TITLE_TOKEN.finditer(jd_text):
+        token = match.group()
+        lower = token.lower()
+        if token[0].isalpha():
+            line_words.append(token)
+            if lower in TITLE_SUFFIXES or (lower.endswith('s') and lower[:-1] in TITLE_SUFFIXES):
+                if labelled_line:
+                    rank = 0
+                elif tokens_since_hiring is not None and tokens_since_hiring <= _HIRING_CUE_WINDOW:
+                    rank = 1
+                else:
+                    rank = 2
+                title = _title_before(line_words[-(_MAX_TITLE_WORDS * 2):])
+                start = len(line_words) - len(title.split())
+                # A later suffix in the same run extends the title if it reaches back over it ('Lead Product Manager')
+                if rank < best_rank or (rank == best_rank and run == best_run and start <= best_start):
+                    best, best_rank, best_run, best_start = title, rank, run, start
+            if lower in _HIRING_CUES or (lower == 'for' and previous == 'looking'):
+                tokens_since_hiring = 0
+        else:
+            # A labelled title is final once its run of words ends
+            if best_rank == 0:
+                return best
+            if token == '\n':
+                labelled_line = False
+            elif token == ':' and previous in _TITLE_CUES:
+                labelled_line = True
+            line_words = []
+            run += 1
+        if tokens_since_hiring is not None:
+            tokens_since_hiring += 1
+        previous = lower
+    if best is not None:
+        return best
+
+    # If no title word is found, look for common job titles in one pass
+    found = set(m.group() for m in _COMMON_TITLE_PATTERN.finditer(jd_text.lower()))
+    for title in COMMON_JOB_TITLES:
+        if title.lower() in found:
             return title
     
     return "Professional Role"  # Default fallback
 
+KEYWORD_STOPWORDS = frozenset(['the','and','to','of','in','a','for','on','with','as','is','by','or','be','are','at','an','from','that','this','will','can','has','have','it','was','but','not','if','their','they','we','you','your','our','all','may','who','which','so','such','more','than','other','any','do','does','should','must','were','been','being','into','about','also','these','those','each','per','its','no','yes','i','ii','iii','iv','v','vi','vii','viii','ix','x'])
+_KEYWORD_TOKEN = re.compile(r'\b\w+\b')
+
+def keyword_terms(text):
+    """Lowercased words of a text that can be keywords: longer than two characters and not stopwords."""
+    return [w for w in _KEYWORD_TOKEN.findall(text.lower()) if len(w) > 2 and w not in KEYWORD_STOPWORDS]
+
+# Radar chart colours, matching Plotly's default Resume / Job Description traces
+RESUME_COLOR = (31, 119, 180)
+JD_COLOR = (255, 127, 14)
+GRID_COLOR = (200, 200, 200)
+
+# The PDF core fonts are Latin-1 only; common typographic characters get ASCII stand-ins
+_PDF_REPLACEMENTS = str.maketrans({
+    '\u2013': '-', '\u2014': '-', '\u2018': "'", '\u2019': "'", '\u201c': '"', '\u201d': '"',
+    '\u2022': '-', '\u2026': '...', '\u00a0': ' ',
+})
+
+def _pdf_text(text):
+    return text.translate(_PDF_REPLACEMENTS).encode('latin-1', 'replace').decode('latin-1')
+
+def draw_radar_chart(pdf, labels, resume_vector, jd_vector, radius=40):
+    """
+    Draw the skill radar chart with FPDF line primitives below the current position:
+    one spoke per skill, clockwise from the top, with the resume and job description
+    outlines and a legend. Values are in [0, 1].
+    """
+    count = len(labels)
+    if count == 0:
+        return
+    label_space = 12
+    if pdf.get_y() + 2 * (radius + label_space) + 10 > pdf.h - pdf.b_margin:
+        pdf.add_page()
+    cx = pdf.w / 2
+    cy = pdf.get_y() + radius + label_space
+    angles = [-math.pi / 2 + 2 * math.pi * i / count for i in range(count)]
+
+    def point(angle, value):
+        return cx + radius * value * math.cos(angle), cy + radius * value * math.sin(angle)
+
+    pdf.set_line_width(0.2)
+    pdf.set_draw_color(*GRID_COLOR)
+    # Grid rings need at least three spokes to enclose an area
+    for ring in (0.5, 1.0) if count > 2 else ():
+        corners = [point(angle, ring) for angle in angles]
+        for (x1, y1), (x2, y2) in zip(corners, corners[1:] + corners[:1]):
+            pdf.line(x1, y1, x2, y2)
+    for angle in angles:
+        pdf.line(cx, cy, *point(angle, 1.0))
+
+    pdf.set_line_width(0.6)
+    for vector, color in ((jd_vector, JD_COLOR), (resume_vector, RESUME_COLOR)):
+        pdf.set_draw_color(*color)
+        pdf.set_fill_color(*color)
+        corners = [point(angle, value) for angle, value in zip(angles, vector)]
+        for (x1, y1), (x2, y2) in zip(corners, corners[1:] + corners[:1]):
+            pdf.line(x1, y1, x2, y2)
+        for (x, y), value in zip(corners, vector):
+            if value:
+                pdf.rect(x - 0.8, y - 0.8, 1.6, 1.6, 'F')
+
+    pdf.set_font("Arial", size=7 if count <= 24 else 5)
+    pdf.set_text_color(60, 60, 60)
+    for angle, label in zip(angles, labels):
+        label = _pdf_text(label)
+        x, y = point(angle, 1.0 + 3.0 / radius)
+        width = pdf.get_string_width(label)
+        if math.cos(angle) < -0.1:
+            x -= width
+        elif abs(math.cos(angle)) <= 0.1:
+            x -= width / 2
+        pdf.text(x, y + 1, label)
+
+    legend_y = cy + radius + label_space - 2
+    pdf.set_font("Arial", size=8)
+    for offset, (name, color) in zip((-35, 5), (("Resume", RESUME_COLOR), ("Job Description", JD_COLOR))):
+        pdf.set_draw_color(*color)
+        pdf.line(cx + offset, legend_y, cx + offset + 6, legend_y)
+        pdf.text(cx + offset + 8, legend_y + 1, name)
+    pdf.set_text_color(0, 0, 0)
+    pdf.set_draw_color(0, 0, 0)
+    pdf.set_line_width(0.2)
+    pdf.set_y(legend_y + 4)
+
+@timed('utils.pdf_report')
 def generate_pdf_report(
     resume_text,
     jd_text,
@@ -79,42 +263,49 @@ def generate_pdf_report(
     learning_path,
     ai_feedback,
     role_advice,
-    radar_chart_path=None
+    radar=None
 ):
+    """
+    Render the analysis report and return the PDF as bytes; nothing is written to disk.
+    `radar` is the radar stage output (radar_labels, resume_vector, jd_vector); when
+    given, the radar chart is drawn natively in the PDF.
+    """
+    from fpdf import FPDF
     pdf = FPDF()
     pdf.add_page()
     pdf.set_font("Arial", size=12)
-    pdf.cell(0, 10, "SkillShift – Skill Gap Analysis Report", ln=True, align="C")
+    pdf.cell(0, 10, _pdf_text("SkillShift – Skill Gap Analysis Report"), ln=True, align="C")
     pdf.ln(5)
     pdf.set_font("Arial", size=10)
-    pdf.multi_cell(0, 8, f"Resume Summary:\n{resume_text[:800]}...", align="L")
+    pdf.multi_cell(0, 8, _pdf_text(f"Resume Summary:\n{resume_text[:800]}..."), align="L")
     pdf.ln(2)
-    pdf.multi_cell(0, 8, f"Job Description Summary:\n{jd_text[:800]}...", align="L")
+    pdf.multi_cell(0, 8, _pdf_text(f"Job Description Summary:\n{jd_text[:800]}..."), align="L")
     pdf.ln(2)
-    if radar_chart_path:
-        pdf.image(radar_chart_path, x=10, w=pdf.w-20)
+    if radar:
+        draw_radar_chart(pdf, radar['radar_labels'], radar['resume_vector'], radar['jd_vector'])
         pdf.ln(2)
     pdf.set_font("Arial", 'B', 11)
     pdf.cell(0, 8, "Skill Gap Analysis", ln=True)
     pdf.set_font("Arial", size=10)
-    pdf.multi_cell(0, 8, f"Skills Present: {', '.join([s.title() for s in present_skills])}")
-    pdf.multi_cell(0, 8, f"Missing Skills: {', '.join([s.title() for s in missing_skills])}")
+    pdf.multi_cell(0, 8, _pdf_text(f"Skills Present: {', '.join([s.title() for s in present_skills])}"))
+    pdf.multi_cell(0, 8, _pdf_text(f"Missing Skills: {', '.join([s.title() for s in missing_skills])}"))
     pdf.ln(2)
     pdf.set_font("Arial", 'B', 11)
     pdf.cell(0, 8, "Dynamic Learning Path", ln=True)
     pdf.set_font("Arial", size=10)
     for step in learning_path:
-        pdf.multi_cell(0, 8, step)
+        pdf.multi_cell(0, 8, _pdf_text(step))
     pdf.ln(2)
     pdf.set_font("Arial", 'B', 11)
     pdf.cell(0, 8, "AI-Powered Resume Feedback", ln=True)
     pdf.set_font("Arial", size=10)
-    pdf.multi_cell(0, 8, ai_feedback)
+    pdf.multi_cell(0, 8, _pdf_text(ai_feedback))
     pdf.ln(2)
     pdf.set_font("Arial", 'B', 11)
     pdf.cell(0, 8, "Role-Specific Advice", ln=True)
     pdf.set_font("Arial", size=10)
-    pdf.multi_cell(0, 8, role_advice)
+    pdf.multi_cell(0, 8, _pdf_text(role_advice))
     pdf.ln(2)
-    pdf.output("SkillShift_Report.pdf")
-    return "SkillShift_Report.pdf" 
\ No newline at end of file
+    # fpdf 1.x returns the document as a Latin-1 str, fpdf2 as a bytearray
+    output = pdf.output(dest='S')
+    return output.encode('latin-1') if isinstance(output, str) else bytes(output)